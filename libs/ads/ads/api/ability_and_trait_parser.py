@@ -1,14 +1,12 @@
 import re
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional
 
 from ads.api.distance_and_target_parser import parse_distance, parse_target
 from ads.api.foundry import generate_id
-from ads.api.power_roll_parser import parse_power_roll_block
+from ads.api.power_roll_parser import parse_effect_data, parse_power_roll_block
 from ads.api.string_format import title_case
-from ads.model import (
-    Ability,
-    Effect,
-)
+from ads.model import AbilityRecord, EffectRecord, PowerRollTierRecord
+from ads.model.records import Record, get_record_field_names
 
 ABILITY_TYPE_MAP = {
     "action": "mainAction",
@@ -173,54 +171,43 @@ ABILITY_HEADER_REGEX = re.compile(
 )
 
 
-def parse_effect_data(effect_source_line: str) -> Effect:
-    # text: str
-    # targets: str
-    # duration: Optional[Literal["endOfTargetTurn", "saveEnds", "endOfEncounter"]]
-    # slowed: bool
-    # weakened: bool
-    # frightened: bool
-    # bleeding: bool
-    # grabbed: bool
-    # taunted: bool
-    # restrained: bool
-    # weakness: Optional[Dict[str, int]]
-    return Effect()
-
-
-def parse_ability_block(ability_lines: List[str], monster_name: str) -> Ability:
+def parse_ability_block(
+    ability_lines: List[str],
+    monster_name: str,
+    header_parser: Optional[Callable[[str, str], Optional[Dict[str, Any]]]] = None,
+    tier_parser: Optional[Callable[[str], PowerRollTierRecord]] = None,
+) -> AbilityRecord:
+    """
+    Parses an ability block.  The header and power roll tier lines are read with `parse_ability_header` and
+    `parse_power_roll_tier_lines` unless other parsers for them are given.
+    """
     header_line = ability_lines[0].strip()
-    header = parse_ability_header(header_line, monster_name)
+    header = (header_parser or parse_ability_header)(header_line, monster_name)
     if not header:
-        return Ability(
+        return AbilityRecord(
             header_raw=header_line, name="UNKNOWN", type="mainAction", keywords=[]
         )
 
     if header["type"] == "monsterTrait":
         effect_text = " ".join(ability_lines[1:])
 
-        return Ability(
+        return AbilityRecord(
             name=header["name"],
             type=header["type"],
             keywords=[],
-            prePowerRollEffect=Effect(text=effect_text),
+            # A trait describes the monster rather than what it does to a target, so no condition is flagged.
+            prePowerRollEffect=EffectRecord(text=effect_text),
             header_raw=header_line,
         )
 
-    model = Ability(
+    model = AbilityRecord(
         name=header["name"],
         type=header["type"],
         villainActionOrdinal=header.get("villainActionOrdinal", None),
         maliceCost=header["maliceCost"],
         isSignature=header["isSignature"],
-        powerRoll=parse_power_roll_block(header, ability_lines),
+        powerRoll=parse_power_roll_block(header, ability_lines, tier_parser),
         keywords=[],
-        distance=None,
-        target=None,
-        trigger=None,
-        prePowerRollEffect=None,
-        maliceEffect=None,
-        postPowerRollEffect=None,
         header_raw=header_line,
     )
 
@@ -239,29 +226,27 @@ def parse_ability_block(ability_lines: List[str], monster_name: str) -> Ability:
                 for w in ability_line[len("Keywords") :].replace(",", " ").split()
                 if w
             ]
-            model["keywords"] = keywords
+            model.keywords = keywords
             # print(f"  - Keywords: {keywords}")
         elif ability_line.startswith("Distance"):
             # Compensation for a hard error in the source PDF: the post power roll effect is labeled
             # "Distance" instead of "Effect".
             if "The affected area is considered difficult terrain for" in ability_line:
-                model["postPowerRollEffect"] = Effect(
-                    text="The affected area is considered difficult terrain for the rest of the encounter."
+                model.postPowerRollEffect = parse_effect_data(
+                    "The affected area is considered difficult terrain for the rest of the encounter."
                 )
             # Compensation for a hard error in the source PDF: the post power roll effect is labeled
             # "Distance" instead of "Trigger".
             elif "The target uses a strike that targets the mastermind" in ability_line:
-                model["trigger"] = (
-                    f"{ability_line[len('Distance') :].strip()} {ability_lines[index + 1].strip()}"
-                )
+                model.trigger = f"{ability_line[len('Distance') :].strip()} {ability_lines[index + 1].strip()}"
             else:
-                model["distance"] = parse_distance(ability_line)
+                model.distance = parse_distance(ability_line)
 
-            model["target"] = parse_target(ability_line)
+            model.target = parse_target(ability_line)
         elif ability_line.startswith("Target"):
-            model["target"] = parse_target(ability_line)
+            model.target = parse_target(ability_line)
         elif ability_line.startswith("Trigger"):
-            model["trigger"] = ability_line[len("Trigger") :].strip()
+            model.trigger = ability_line[len("Trigger") :].strip()
         elif re.match(r"^[^1]{0,9}(?:11|12.16|17).", ability_line):
             power_roll_line_encountered = True
             final_effect_line_encountered = True
@@ -299,8 +284,8 @@ def parse_ability_block(ability_lines: List[str], monster_name: str) -> Ability:
             # If we have already registered the final line of the current malice effect, or if we are at the last
             # line of the ability block as a whole, we commit the current malice effect to the model.
             if malice_effect_lines:
-                model["maliceEffect"] = Effect(
-                    text=" ".join(malice_effect_lines).replace("  ", " ").strip()
+                model.maliceEffect = parse_effect_data(
+                    " ".join(malice_effect_lines).replace("  ", " ").strip()
                 )
                 malice_effect_lines = []
 
@@ -309,18 +294,14 @@ def parse_ability_block(ability_lines: List[str], monster_name: str) -> Ability:
             # line of the ability block as a whole, we commit the current effect to the model.
             if pre_power_roll_effect_lines:
                 # We have pre-power-roll effect lines, so we join them into a single effect description.
-                model["prePowerRollEffect"] = Effect(
-                    text=" ".join(pre_power_roll_effect_lines)
-                    .replace("  ", " ")
-                    .strip()
+                model.prePowerRollEffect = parse_effect_data(
+                    " ".join(pre_power_roll_effect_lines).replace("  ", " ").strip()
                 )
                 pre_power_roll_effect_lines = []
             elif post_power_roll_effect_lines:
                 # We have post-power-roll effect lines, so we join them into a single effect description.
-                model["postPowerRollEffect"] = Effect(
-                    text=" ".join(post_power_roll_effect_lines)
-                    .replace("  ", " ")
-                    .strip()
+                model.postPowerRollEffect = parse_effect_data(
+                    " ".join(post_power_roll_effect_lines).replace("  ", " ").strip()
                 )
                 post_power_roll_effect_lines = []
 
@@ -331,6 +312,17 @@ def parse_ability_header(
     header_line: str, monster_name: str
 ) -> Optional[Dict[str, Any]]:
     """Parse ability header, returning name, type, maliceCost, powerRoll bonus. Warn on partial match."""
+    normalized = normalize_ability_header_line(header_line)
+    match = ABILITY_HEADER_REGEX.match(normalized)
+    if not match:
+        print(
+            f"*** [WARN] [{monster_name}]: Could not parse ability header: '{header_line}'\n   Normalized as: {repr(normalized)}"
+        )
+        return None
+    return get_ability_header_fields(match.groupdict(), normalized, header_line)
+
+
+def normalize_ability_header_line(header_line: str) -> str:
     normalized = re.sub(r"[^A-Za-z0-9!()' +-]", "", header_line)
     normalized = (
         re.sub(r"([+]\s*[1-5])\s*.\s+(1?[0-9]\s?Malice)", r"\1 \2", header_line)
@@ -342,16 +334,13 @@ def parse_ability_header(
     #     .replace("2 0 5 Malice", "2 5 Malice")
     #     .replace("  ", " ").strip()
     # )
+    return normalized
 
-    match = ABILITY_HEADER_REGEX.match(normalized)
-    if not match:
-        print(
-            f"*** [WARN] [{monster_name}]: Could not parse ability header: '{header_line}'\n   Normalized as: {repr(normalized)}"
-        )
-        return None
-
-    groups = match.groupdict()
 
+def get_ability_header_fields(
+    groups: Dict[str, Any], normalized: str, header_line: str
+) -> Dict[str, Any]:
+    """Builds the ability header from the groups of a matched header line, named as in `ABILITY_HEADER_REGEX`."""
     # Determine ability type
     type_raw = groups.get("type") or ""
     type_key = type_raw.replace("  ", " ").replace("  ", " ").strip().lower()
@@ -448,42 +437,56 @@ def split_ability_blocks(lines: list[str]) -> list[list[str]]:
     return blocks
 
 
-def get_dict_without_none_values(input_dict: dict[str, Any]) -> dict[str, Any]:
-    cleaned: dict[str, Any] = {}
-    for key, value in input_dict.items():
-        if isinstance(value, dict):
-            nested = get_dict_without_none_values(value)  # type: ignore
-            if nested:
-                cleaned[key] = nested
-        elif value is not None:
-            cleaned[key] = value
-    return cleaned
+# Fields of the Foundry item "system" block, in output order, with the default used when the ability lacks them.
+FOUNDRY_ITEM_SYSTEM_FIELDS: tuple[tuple[str, Any], ...] = (
+    ("name", None),
+    ("maliceCost", None),
+    ("isSignature", False),
+    ("keywords", None),
+    ("type", None),
+    ("villainActionOrdinal", None),
+    ("distance", None),
+    ("target", None),
+    ("powerRoll", None),
+    ("trigger", None),
+    ("prePowerRollEffect", None),
+    ("maliceEffect", None),
+    ("postPowerRollEffect", None),
+)
+
+
+def get_foundry_value(value: Any) -> Any:
+    """
+    Expands a record into the dict Foundry stores, without the fields that are None and the nested records that
+    end up empty; None is returned when nothing is left.  Lists and dicts of the record are used as they are.
+    """
+    if not isinstance(value, Record):
+        return value
+    foundry_value: dict[str, Any] = {}
+    for field_name in get_record_field_names(type(value)):
+        field_value = get_foundry_value(getattr(value, field_name))
+        if field_value is not None:
+            foundry_value[field_name] = field_value
+    return foundry_value or None
 
 
-def get_foundry_item_model(actor_id: str, ability: Ability) -> dict[str, Any]:
+def get_foundry_item_model(actor_id: str, ability: AbilityRecord) -> dict[str, Any]:
     item_id = generate_id()
 
-    item_model: dict[str, Any] = {
+    # The system block is filled straight from the ability record, skipping None fields as they are met.
+    system: dict[str, Any] = {}
+    for field_name, default in FOUNDRY_ITEM_SYSTEM_FIELDS:
+        value = get_foundry_value(getattr(ability, field_name))
+        if value is None:
+            value = default
+        if value is not None:
+            system[field_name] = value
+
+    return {
         "_id": item_id,
         "_key": f"!actors.items!{actor_id}.{item_id}",
-        "name": ability["name"],
+        "name": ability.name,
         "type": "monsterAbility",
         "img": "icons/svg/book.svg",
-        "system": {
-            "name": ability["name"],
-            "maliceCost": ability.get("maliceCost", None),
-            "isSignature": ability.get("isSignature", False),
-            "keywords": ability["keywords"],
-            "type": ability["type"],
-            "villainActionOrdinal": ability.get("villainActionOrdinal", None),
-            "distance": ability.get("distance", None),
-            "target": ability.get("target", None),
-            "powerRoll": ability.get("powerRoll", None),
-            "trigger": ability.get("trigger", None),
-            "prePowerRollEffect": ability.get("prePowerRollEffect", None),
-            "maliceEffect": ability.get("maliceEffect", None),
-            "postPowerRollEffect": ability.get("postPowerRollEffect", None),
-        },
+        "system": system,
     }
-
-    return get_dict_without_none_values(item_model)
@@ -0,0 +1,204 @@
+import time
+from typing import Iterable, NamedTuple
+
+import numpy as np
+
+from ads.model import Monster
+
+MONSTER_METRIC_NAMES = ("stamina", "encounterValue", "freeStrikeDamage")
+TIER_NAMES = ("tier1", "tier2", "tier3")
+DEFAULT_Z_THRESHOLD = 3.5
+# Scales a median absolute deviation to a standard deviation for normally distributed residuals.
+MAD_TO_STANDARD_DEVIATION = 1.4826
+# Where most values sit right on the fit, a 5% miss is still within one deviation.
+MIN_LOG_SCALE = 0.05
+# After the first fit, the fit is repeated without the values it flagged, so misreads don't drag it along.
+REFIT_COUNT = 1
+
+
+class Anomaly(NamedTuple):
+    header_text: str
+    monster_name: str
+    field: str
+    value: int
+    expected: float
+    z_score: float
+
+
+class MetricTable(NamedTuple):
+    """One row per monster or per ability: the columns the fit explains its metrics by, and the metrics."""
+
+    header_texts: np.ndarray
+    monster_names: np.ndarray
+    field_prefixes: np.ndarray
+    levels: np.ndarray
+    types: np.ndarray
+    roles: np.ndarray
+    metric_names: tuple[str, ...]
+    # 0 where a row has no such value, e.g. a tier that deals no damage.
+    values: np.ndarray
+
+
+def get_monster_metric_table(monsters: list[Monster]) -> MetricTable:
+    return MetricTable(
+        header_texts=np.array(
+            [monster["header_text"] for monster in monsters], dtype=str
+        ),
+        monster_names=np.array([monster["name"] for monster in monsters], dtype=str),
+        field_prefixes=np.array([""] * len(monsters), dtype=str),
+        levels=np.array([monster["level"] for monster in monsters], np.float64),
+        types=np.array([monster["type"].lower() for monster in monsters], dtype=str),
+        roles=np.array(
+            [str(monster.get("role") or "none").lower() for monster in monsters],
+            dtype=str,
+        ),
+        metric_names=MONSTER_METRIC_NAMES,
+        values=np.array(
+            [
+                [monster[metric_name] for metric_name in MONSTER_METRIC_NAMES]  # type: ignore
+                for monster in monsters
+            ],
+            np.float64,
+        ).reshape(-1, len(MONSTER_METRIC_NAMES)),
+    )
+
+
+def get_tier_damage_metric_table(monsters: list[Monster]) -> MetricTable:
+    """One row per ability with a power roll that deals damage on some tier."""
+    ability_rows = [
+        (monster, ability)
+        for monster in monsters
+        for ability in monster["abilities"]
+        if ability.get("powerRoll")
+        and any(
+            ability["powerRoll"][tier_name].get("damage")  # type: ignore
+            for tier_name in TIER_NAMES
+        )
+    ]
+    return MetricTable(
+        header_texts=np.array(
+            [monster["header_text"] for monster, _ in ability_rows], dtype=str
+        ),
+        monster_names=np.array(
+            [monster["name"] for monster, _ in ability_rows], dtype=str
+        ),
+        field_prefixes=np.array(
+            [f"{ability['name']}." for _, ability in ability_rows], dtype=str
+        ),
+        levels=np.array([monster["level"] for monster, _ in ability_rows], np.float64),
+        types=np.array(
+            [monster["type"].lower() for monster, _ in ability_rows], dtype=str
+        ),
+        roles=np.array(
+            [str(monster.get("role") or "none").lower() for monster, _ in ability_rows],
+            dtype=str,
+        ),
+        metric_names=TIER_NAMES,
+        values=np.array(
+            [
+                [
+                    ability["powerRoll"][tier_name].get("damage") or 0  # type: ignore
+                    for tier_name in TIER_NAMES
+                ]
+                for _, ability in ability_rows
+            ],
+            np.float64,
+        ).reshape(-1, len(TIER_NAMES)),
+    )
+
+
+def get_design_matrix(table: MetricTable) -> np.ndarray:
+    """An intercept, the level, and one indicator column per type and per role but the first of each."""
+    _, type_codes = np.unique(table.types, return_inverse=True)
+    _, role_codes = np.unique(table.roles, return_inverse=True)
+    return np.column_stack(
+        [
+            np.ones(len(table.levels)),
+            table.levels,
+            np.eye(type_codes.max(initial=0) + 1)[type_codes][:, 1:],
+            np.eye(role_codes.max(initial=0) + 1)[role_codes][:, 1:],
+        ]
+    )
+
+
+def get_z_scores(
+    table: MetricTable, threshold: float = DEFAULT_Z_THRESHOLD
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Fits every metric by least squares on the log scale, so a residual reads as a ratio to the expected value
+    whatever the type.  Returns the expected values and the robust z-scores of the residuals, both shaped like
+    `table.values`; rows without a value get a z-score of 0.
+    """
+    design = get_design_matrix(table)
+    present = table.values > 0
+    log_values = np.log(np.where(present, table.values, 1))
+    expected = np.zeros_like(table.values)
+    z_scores = np.zeros_like(table.values)
+    for metric_index in range(len(table.metric_names)):
+        fitted = present[:, metric_index]
+        if fitted.sum() < design.shape[1]:
+            continue
+        for _ in range(REFIT_COUNT + 1):
+            coefficients = np.linalg.lstsq(
+                design[fitted], log_values[fitted, metric_index], rcond=None
+            )[0]
+            residuals = log_values[:, metric_index] - design @ coefficients
+            fitted_residuals = residuals[fitted]
+            scale = max(
+                MAD_TO_STANDARD_DEVIATION
+                * np.median(np.abs(fitted_residuals - np.median(fitted_residuals))),
+                MIN_LOG_SCALE,
+            )
+            metric_z_scores = np.where(present[:, metric_index], residuals / scale, 0)
+            fitted = present[:, metric_index] & (np.abs(metric_z_scores) <= threshold)
+        expected[:, metric_index] = np.exp(design @ coefficients)
+        z_scores[:, metric_index] = metric_z_scores
+    return expected, z_scores
+
+
+def get_anomalies(
+    table: MetricTable, threshold: float = DEFAULT_Z_THRESHOLD
+) -> list[Anomaly]:
+    expected, z_scores = get_z_scores(table, threshold)
+    rows, metric_indexes = np.nonzero(np.abs(z_scores) > threshold)
+    return [
+        Anomaly(
+            header_text=str(table.header_texts[row]),
+            monster_name=str(table.monster_names[row]),
+            field=f"{table.field_prefixes[row]}{table.metric_names[metric_index]}",
+            value=int(table.values[row, metric_index]),
+            expected=float(expected[row, metric_index]),
+            z_score=float(z_scores[row, metric_index]),
+        )
+        for row, metric_index in zip(rows, metric_indexes)
+    ]
+
+
+def detect_anomalies(
+    monster_models: Iterable[Monster], threshold: float = DEFAULT_Z_THRESHOLD
+) -> list[Anomaly]:
+    """
+    Flags the stamina, EV, free strike and tier damage values that sit far from what the level, type and role of
+    their monster predict across the corpus, furthest first.
+    """
+    monsters = list(monster_models)
+    anomalies = get_anomalies(get_monster_metric_table(monsters), threshold)
+    anomalies.extend(get_anomalies(get_tier_damage_metric_table(monsters), threshold))
+    return sorted(anomalies, key=lambda anomaly: -abs(anomaly.z_score))
+
+
+def print_anomaly_report(
+    monster_models: Iterable[Monster], threshold: float = DEFAULT_Z_THRESHOLD
+) -> None:
+    monsters = list(monster_models)
+    started_at = time.perf_counter()
+    anomalies = detect_anomalies(monsters, threshold)
+    print(
+        f"Checked {len(monsters)} monsters in {(time.perf_counter() - started_at) * 1000:.1f} ms: "
+        f"{len(anomalies)} values beyond {threshold} deviations."
+    )
+    for anomaly in anomalies:
+        print(
+            f"  *** [WARN] [{anomaly.monster_name}] {anomaly.field} = {anomaly.value}, expected ~{anomaly.expected:.0f} "
+            f"(z = {anomaly.z_score:+.1f}, header: '{anomaly.header_text}')"
+        )
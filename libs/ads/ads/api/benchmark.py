@@ -0,0 +1,122 @@
+import gc
+import time
+import tracemalloc
+from typing import Any, Callable, Iterable
+
+from ads.api.ability_and_trait_parser import get_foundry_item_model
+from ads.api.distance_and_target_parser import parse_distance_and_target
+from ads.api.monster_parser import (
+    iter_monster_blocks,
+    iter_monster_models,
+    read_source_lines,
+)
+from ads.api.parse_cache import clear_parse_caches
+from ads.model import MonsterRecord
+from ads.model.records import to_monster_model
+
+
+def iter_book_monster_models(ocr_file_path: str) -> Iterable[MonsterRecord]:
+    return iter_monster_models(iter_monster_blocks(read_source_lines(ocr_file_path)))
+
+
+def measure_retained_memory(build: Callable[[], Any]) -> tuple[Any, int, int, float]:
+    """
+    Runs `build` under tracemalloc and returns its result with the bytes and allocations it retains.  The parse
+    caches are cleared before and after, so only what the result itself holds on to is counted.
+    """
+    clear_parse_caches()
+    gc.collect()
+    tracemalloc.start()
+    started_at = time.perf_counter()
+    result = build()
+    elapsed = time.perf_counter() - started_at
+    clear_parse_caches()
+    gc.collect()
+    snapshot = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    retained_bytes = sum(trace.size for trace in snapshot.traces)
+    return result, retained_bytes, len(snapshot.traces), elapsed
+
+
+def benchmark_model_memory(ocr_file_path: str) -> None:
+    """
+    Compares the memory a whole book of parsed monsters retains as the records the parsers build, and as the
+    TypedDict models they are expanded into at the cache and the bestiary index.
+    """
+    monster_models, record_bytes, record_allocations, record_seconds = (
+        measure_retained_memory(lambda: list(iter_book_monster_models(ocr_file_path)))
+    )
+    monster_count = len(monster_models)
+    del monster_models
+
+    _, dict_bytes, dict_allocations, dict_seconds = measure_retained_memory(
+        lambda: [to_monster_model(m) for m in iter_book_monster_models(ocr_file_path)]
+    )
+
+    print(f"Parsed {monster_count} monsters from [{ocr_file_path}].")
+    print(f"{'model':<12}{'retained KiB':>14}{'allocations':>14}{'seconds':>10}")
+    for label, retained_bytes, allocations, seconds in (
+        ("record", record_bytes, record_allocations, record_seconds),
+        ("TypedDict", dict_bytes, dict_allocations, dict_seconds),
+    ):
+        print(
+            f"{label:<12}{retained_bytes / 1024:>14.1f}{allocations:>14}{seconds:>10.2f}"
+        )
+
+
+def benchmark_foundry_item_serialization(ocr_file_path: str, repeat: int) -> None:
+    abilities = [
+        ability
+        for monster_model in iter_book_monster_models(ocr_file_path)
+        for ability in monster_model.abilities
+    ]
+    started_at = time.perf_counter()
+    for _ in range(repeat):
+        for ability in abilities:
+            get_foundry_item_model("benchmark", ability)
+    elapsed = time.perf_counter() - started_at
+
+    serialized_count = len(abilities) * repeat
+    print(
+        f"Serialized {serialized_count} abilities ({len(abilities)} x {repeat}) in {elapsed:.3f}s: "
+        f"{serialized_count / elapsed:,.0f} abilities/s."
+    )
+
+
+def benchmark_distance_and_target_parsing(ocr_file_path: str, repeat: int) -> None:
+    distance_lines = [
+        line.strip()
+        for line in read_source_lines(ocr_file_path)
+        if line.strip().startswith("Distance")
+    ]
+    # Uncached, so every repetition tokenizes every line again.
+    parse = parse_distance_and_target.__wrapped__
+    started_at = time.perf_counter()
+    for _ in range(repeat):
+        for line in distance_lines:
+            parse(line)
+    elapsed = time.perf_counter() - started_at
+
+    unread_lines = [line for line in distance_lines if parse(line).distance is None]
+    parsed_count = len(distance_lines) * repeat
+    print(
+        f"Parsed {parsed_count} distance lines ({len(distance_lines)} x {repeat}) in {elapsed:.3f}s: "
+        f"{elapsed / parsed_count * 1_000_000:.1f} us/line, {parsed_count / elapsed:,.0f} lines/s."
+    )
+    print(f"{len(unread_lines)} lines without a readable distance:")
+    for line in unread_lines:
+        print(f"  - {line}")
+
+
+def get_prose_lines(ocr_file_path: str) -> list[str]:
+    """The effect, trigger and malice text of every monster of the book, one entry per field."""
+    prose_lines = []
+    for monster_model in iter_book_monster_models(ocr_file_path):
+        for ability in monster_model.abilities:
+            if ability.trigger:
+                prose_lines.append(ability.trigger)
+            for field in ("prePowerRollEffect", "postPowerRollEffect", "maliceEffect"):
+                effect = getattr(ability, field)
+                if effect and effect.text:
+                    prose_lines.append(effect.text)
+    return prose_lines
@@ -0,0 +1,411 @@
+import glob
+import os
+import re
+import time
+from typing import Any, Iterable, Iterator, NamedTuple, Optional
+
+import numpy as np
+import yaml
+
+from ads.api.monster_cache import MonsterCache, get_parser_version
+from ads.api.monster_parser import (
+    deduplicate_monsters,
+    iter_monster_blocks,
+    iter_monster_models,
+    read_source_lines,
+)
+from ads.model import Characteristics, Monster
+from ads.model.records import to_monster_model
+
+DEFAULT_SNAPSHOT_FILE_PATH = os.path.join(
+    os.path.expanduser("~"), ".cache", "ads", "bestiary-index.npz"
+)
+CHARACTERISTIC_NAMES = ("might", "agility", "reason", "intuition", "presence")
+# Integer Monster fields held as columns, characteristics flattened into their own columns.
+NUMERIC_COLUMN_NAMES = (
+    "level",
+    "encounterValue",
+    "stamina",
+    "speed",
+    "stability",
+    "freeStrikeDamage",
+    *CHARACTERISTIC_NAMES,
+)
+TEXT_COLUMN_NAMES = ("name", "type", "role")
+KEYWORD_BITS_PER_WORD = 64
+# "level>=3", "encounterValue <= 12", "might=2"
+FILTER_REGEX = re.compile(r"^\s*(\w+)\s*(<=|>=|!=|==|=|<|>)\s*(-?\d+)\s*$")
+COMPARISON_BY_OPERATOR = {
+    "<": np.less,
+    "<=": np.less_equal,
+    "=": np.equal,
+    "==": np.equal,
+    "!=": np.not_equal,
+    ">=": np.greater_equal,
+    ">": np.greater,
+}
+
+
+class BestiaryIndex(NamedTuple):
+    """
+    Column-per-field view of a bestiary: one row per monster, text fields as NumPy string arrays, type and role
+    as codes into `type_names`/`role_names`, and keywords as a bitset per row over `keyword_names`.
+    """
+
+    names: np.ndarray
+    header_texts: np.ndarray
+    type_names: np.ndarray
+    role_names: np.ndarray
+    keyword_names: np.ndarray
+    type_codes: np.ndarray
+    role_codes: np.ndarray
+    keyword_bits: np.ndarray
+    columns: dict[str, np.ndarray]
+
+
+class SnapshotSource(NamedTuple):
+    """What a snapshot was built from; any difference from the current source means it is rebuilt."""
+
+    source_path: str
+    # 0 for an OCR text file.
+    yaml_file_count: int
+    modified_time: float
+    parser_version: str
+
+
+def get_monster_from_foundry_actor(actor: dict[str, Any]) -> Monster:
+    """Reads the Monster fields the index needs back from an exported Foundry actor; abilities aren't read."""
+    system = actor["system"]
+    combat = system.get("combat", {})
+    return Monster(
+        name=actor["name"],
+        level=system["level"],
+        type=system["type"],
+        role=system.get("role") or None,
+        # Exported actors don't keep the OCR header line.
+        header_text=actor["name"],
+        keywords=system.get("keywords", []),
+        encounterValue=system.get("encounterValue", 0),
+        stamina=system["stamina"]["max"],
+        speed=combat.get("speed", 0),
+        movementTypes=combat.get("movementTypes", []),
+        size=combat.get("size", ""),
+        stability=combat.get("stability", 0),
+        freeStrikeDamage=combat.get("freeStrikeDamage", 0),
+        characteristics=Characteristics(**system["characteristics"]),
+        abilities=[],
+        traits=[],
+    )
+
+
+def iter_foundry_actor_monsters(yaml_folder_path: str) -> Iterator[Monster]:
+    for yaml_file_path in sorted(glob.glob(os.path.join(yaml_folder_path, "*.yml"))):
+        with open(yaml_file_path, encoding="utf-8") as yaml_file:
+            yield get_monster_from_foundry_actor(yaml.safe_load(yaml_file))
+
+
+def iter_source_monsters(
+    source_path: str, monster_cache: Optional[MonsterCache] = None
+) -> Iterator[Monster]:
+    """Yields the monsters of a folder of exported YAML actors, or of an OCR text file, once per name."""
+    if os.path.isdir(source_path):
+        monster_models = iter_foundry_actor_monsters(source_path)
+    else:
+        monster_models = map(
+            to_monster_model,
+            iter_monster_models(
+                iter_monster_blocks(read_source_lines(source_path)), monster_cache
+            ),
+        )
+    yield from deduplicate_monsters(monster_models)
+
+
+def get_snapshot_source(source_path: str) -> SnapshotSource:
+    if not os.path.isdir(source_path):
+        return SnapshotSource(
+            source_path=os.path.abspath(source_path),
+            yaml_file_count=0,
+            modified_time=os.path.getmtime(source_path),
+            parser_version=get_parser_version(),
+        )
+    yaml_file_paths = glob.glob(os.path.join(source_path, "*.yml"))
+    return SnapshotSource(
+        source_path=os.path.abspath(source_path),
+        yaml_file_count=len(yaml_file_paths),
+        modified_time=max(
+            [os.path.getmtime(source_path)]
+            + [os.path.getmtime(yaml_file_path) for yaml_file_path in yaml_file_paths]
+        ),
+        parser_version=get_parser_version(),
+    )
+
+
+def get_codes(values: list[str]) -> tuple[np.ndarray, np.ndarray]:
+    # Sorted distinct values and, per row, the index of its value among them.
+    names, codes = np.unique(np.array(values, dtype=str), return_inverse=True)
+    return names, codes.astype(np.uint8)
+
+
+def build_bestiary_index(monster_models: Iterable[Monster]) -> BestiaryIndex:
+    monsters = list(monster_models)
+    type_names, type_codes = get_codes([monster["type"] for monster in monsters])
+    role_names, role_codes = get_codes(
+        [str(monster.get("role") or "") for monster in monsters]
+    )
+    keyword_names = np.array(
+        sorted({keyword for monster in monsters for keyword in monster["keywords"]}),
+        dtype=str,
+    )
+    keyword_index_by_name = {
+        str(keyword): index for index, keyword in enumerate(keyword_names)
+    }
+    keyword_bits = np.zeros(
+        (len(monsters), len(keyword_names) // KEYWORD_BITS_PER_WORD + 1), np.uint64
+    )
+    for row, monster in enumerate(monsters):
+        for keyword in monster["keywords"]:
+            word, bit = divmod(keyword_index_by_name[keyword], KEYWORD_BITS_PER_WORD)
+            keyword_bits[row, word] |= np.uint64(1) << np.uint64(bit)
+
+    columns = {
+        column_name: np.array(
+            [
+                monster["characteristics"][column_name]  # type: ignore
+                if column_name in CHARACTERISTIC_NAMES
+                else monster[column_name]  # type: ignore
+                for monster in monsters
+            ],
+            dtype=np.int16,
+        )
+        for column_name in NUMERIC_COLUMN_NAMES
+    }
+    return BestiaryIndex(
+        names=np.array([monster["name"] for monster in monsters], dtype=str),
+        header_texts=np.array(
+            [monster["header_text"] for monster in monsters], dtype=str
+        ),
+        type_names=type_names,
+        role_names=role_names,
+        keyword_names=keyword_names,
+        type_codes=type_codes,
+        role_codes=role_codes,
+        keyword_bits=keyword_bits,
+        columns=columns,
+    )
+
+
+def save_bestiary_index(
+    bestiary_index: BestiaryIndex,
+    snapshot_file_path: str,
+    snapshot_source: SnapshotSource,
+) -> None:
+    """
+    Writes the index and its source as an uncompressed .npz of plain arrays, which loads without unpickling
+    anything.
+    """
+    snapshot_folder_path = os.path.dirname(snapshot_file_path)
+    if snapshot_folder_path:
+        os.makedirs(snapshot_folder_path, exist_ok=True)
+    arrays = {
+        field_name: value
+        for field_name, value in bestiary_index._asdict().items()
+        if field_name != "columns"
+    }
+    for column_name, column in bestiary_index.columns.items():
+        arrays[f"column_{column_name}"] = column
+    for field_name, value in snapshot_source._asdict().items():
+        arrays[f"source_{field_name}"] = np.array(value)
+    # Written through a file object, since np.savez would append ".npz" to any other file name.
+    with open(snapshot_file_path, "wb") as snapshot_file:
+        np.savez(snapshot_file, **arrays)  # type: ignore
+
+
+def load_bestiary_index(snapshot_file_path: str) -> BestiaryIndex:
+    with np.load(snapshot_file_path, allow_pickle=False) as snapshot:
+        arrays = {array_name: snapshot[array_name] for array_name in snapshot.files}
+    return BestiaryIndex(
+        **{
+            field_name: arrays[field_name]
+            for field_name in BestiaryIndex._fields
+            if field_name != "columns"
+        },
+        columns={
+            column_name: arrays[f"column_{column_name}"]
+            for column_name in NUMERIC_COLUMN_NAMES
+        },
+    )
+
+
+def load_snapshot_source(snapshot_file_path: str) -> Optional[SnapshotSource]:
+    # None for a snapshot written before sources were recorded.
+    with np.load(snapshot_file_path, allow_pickle=False) as snapshot:
+        if any(
+            f"source_{field_name}" not in snapshot.files
+            for field_name in SnapshotSource._fields
+        ):
+            return None
+        return SnapshotSource(
+            source_path=str(snapshot["source_source_path"]),
+            yaml_file_count=int(snapshot["source_yaml_file_count"]),
+            modified_time=float(snapshot["source_modified_time"]),
+            parser_version=str(snapshot["source_parser_version"]),
+        )
+
+
+def get_bestiary_index(
+    source_path: str,
+    snapshot_file_path: str = DEFAULT_SNAPSHOT_FILE_PATH,
+    rebuild: bool = False,
+    monster_cache: Optional[MonsterCache] = None,
+) -> BestiaryIndex:
+    """
+    Loads the snapshot unless it is missing or was built from another source, from an older state of this one
+    (files added, removed or modified) or by another parser version, in which case it is rebuilt.
+    """
+    started_at = time.perf_counter()
+    snapshot_source = get_snapshot_source(source_path)
+    if (
+        not rebuild
+        and os.path.exists(snapshot_file_path)
+        and load_snapshot_source(snapshot_file_path) == snapshot_source
+    ):
+        bestiary_index = load_bestiary_index(snapshot_file_path)
+        print(
+            f"Loaded {len(bestiary_index.names)} monsters from snapshot [{snapshot_file_path}] "
+            f"in {(time.perf_counter() - started_at) * 1000:.1f} ms."
+        )
+        return bestiary_index
+
+    bestiary_index = build_bestiary_index(
+        iter_source_monsters(source_path, monster_cache)
+    )
+    save_bestiary_index(bestiary_index, snapshot_file_path, snapshot_source)
+    print(
+        f"Indexed {len(bestiary_index.names)} monsters from [{source_path}] into snapshot [{snapshot_file_path}] "
+        f"in {time.perf_counter() - started_at:.2f}s."
+    )
+    return bestiary_index
+
+
+def get_code_mask(
+    names: np.ndarray, codes: np.ndarray, wanted_names: list[str]
+) -> np.ndarray:
+    # Matching is case-insensitive; a name the bestiary doesn't have matches no row.
+    wanted_codes = np.flatnonzero(
+        np.isin(np.char.lower(names), [name.lower() for name in wanted_names])
+    )
+    return np.isin(codes, wanted_codes)
+
+
+def get_keyword_mask(bestiary_index: BestiaryIndex, keywords: list[str]) -> np.ndarray:
+    """Rows that have every one of `keywords`, tested against all rows at once through the keyword bitsets."""
+    lowered_keyword_names = list(np.char.lower(bestiary_index.keyword_names))
+    wanted_bits = np.zeros(bestiary_index.keyword_bits.shape[1], np.uint64)
+    for keyword in keywords:
+        if keyword.lower() not in lowered_keyword_names:
+            return np.zeros(len(bestiary_index.names), bool)
+        word, bit = divmod(
+            lowered_keyword_names.index(keyword.lower()), KEYWORD_BITS_PER_WORD
+        )
+        wanted_bits[word] |= np.uint64(1) << np.uint64(bit)
+    return np.all((bestiary_index.keyword_bits & wanted_bits) == wanted_bits, axis=1)
+
+
+def get_filter_mask(bestiary_index: BestiaryIndex, filter_text: str) -> np.ndarray:
+    match = FILTER_REGEX.match(filter_text)
+    if not match or match.group(1) not in bestiary_index.columns:
+        raise ValueError(
+            f"Invalid filter: '{filter_text}'. Expected <column><op><number> with a column among "
+            f"{', '.join(NUMERIC_COLUMN_NAMES)} and an operator among {', '.join(COMPARISON_BY_OPERATOR)}."
+        )
+    column_name, operator, value = match.groups()
+    return COMPARISON_BY_OPERATOR[operator](
+        bestiary_index.columns[column_name], int(value)
+    )
+
+
+def get_sort_column(bestiary_index: BestiaryIndex, column_name: str) -> np.ndarray:
+    if column_name in bestiary_index.columns:
+        return bestiary_index.columns[column_name]
+    if column_name == "name":
+        return np.char.lower(bestiary_index.names)
+    if column_name in ("type", "role"):
+        # Codes follow the sorted names, so sorting by code sorts alphabetically.
+        return getattr(bestiary_index, f"{column_name}_codes")
+    raise ValueError(
+        f"Invalid sort column: '{column_name}'. Expected one of {', '.join(TEXT_COLUMN_NAMES + NUMERIC_COLUMN_NAMES)}."
+    )
+
+
+def query_bestiary_index(
+    bestiary_index: BestiaryIndex,
+    types: Optional[list[str]] = None,
+    roles: Optional[list[str]] = None,
+    keywords: Optional[list[str]] = None,
+    filters: Optional[list[str]] = None,
+    sort_by: Optional[list[str]] = None,
+) -> np.ndarray:
+    """
+    Returns the rows matching every filter, in `sort_by` order.  Sort keys come first to last, a "-" prefix
+    sorting descending; ties keep the bestiary order.
+    """
+    mask = np.ones(len(bestiary_index.names), bool)
+    if types:
+        mask &= get_code_mask(
+            bestiary_index.type_names, bestiary_index.type_codes, types
+        )
+    if roles:
+        mask &= get_code_mask(
+            bestiary_index.role_names, bestiary_index.role_codes, roles
+        )
+    if keywords:
+        mask &= get_keyword_mask(bestiary_index, keywords)
+    for filter_text in filters or []:
+        mask &= get_filter_mask(bestiary_index, filter_text)
+
+    rows = np.flatnonzero(mask)
+    if not sort_by:
+        return rows
+    sort_keys = []
+    # np.lexsort sorts by the last key first.
+    for sort_text in reversed(sort_by):
+        column = get_sort_column(bestiary_index, sort_text.lstrip("-+"))[rows]
+        if sort_text.startswith("-"):
+            # Negated ranks, which also work for string columns.
+            column = -np.unique(column, return_inverse=True)[1]
+        sort_keys.append(column)
+    return rows[np.lexsort(sort_keys)]
+
+
+def get_row_keywords(bestiary_index: BestiaryIndex, row: int) -> list[str]:
+    return [
+        str(keyword)
+        for index, keyword in enumerate(bestiary_index.keyword_names)
+        if int(bestiary_index.keyword_bits[row, index // KEYWORD_BITS_PER_WORD])
+        >> (index % KEYWORD_BITS_PER_WORD)
+        & 1
+    ]
+
+
+def print_query_results(
+    bestiary_index: BestiaryIndex, rows: np.ndarray, limit: Optional[int] = None
+) -> None:
+    print(
+        f"{'name':<28}{'lvl':>4}  {'type':<8}{'role':<12}{'EV':>4}{'stam':>6}{'spd':>5}{'stab':>5}{'FS':>4}"
+        f"  {'M':>3}{'A':>3}{'R':>3}{'I':>3}{'P':>3}  keywords"
+    )
+    columns = bestiary_index.columns
+    for row in rows[:limit]:
+        print(
+            f"{bestiary_index.names[row]:<28}{columns['level'][row]:>4}  "
+            f"{bestiary_index.type_names[bestiary_index.type_codes[row]]:<8}"
+            f"{bestiary_index.role_names[bestiary_index.role_codes[row]]:<12}"
+            f"{columns['encounterValue'][row]:>4}{columns['stamina'][row]:>6}{columns['speed'][row]:>5}"
+            f"{columns['stability'][row]:>5}{columns['freeStrikeDamage'][row]:>4}  "
+            + "".join(
+                f"{columns[characteristic_name][row]:>3}"
+                for characteristic_name in CHARACTERISTIC_NAMES
+            )
+            + f"  {', '.join(get_row_keywords(bestiary_index, row))}"
+        )
+    print(f"{len(rows)} of {len(bestiary_index.names)} monsters match.")
@@ -0,0 +1,73 @@
+import os
+import time
+from typing import Iterable, Iterator, Optional, TextIO
+
+from ads.api.monster_cache import MonsterCache
+from ads.api.monster_parser import (
+    DEFAULT_PARSER_ENGINE_NAME,
+    deduplicate_monsters,
+    export_yaml,
+    iter_monster_blocks,
+    iter_monster_foundry_actor_models,
+    iter_monster_models,
+    sanitize_source_line,
+)
+from ads.api.parse_cache import print_parse_cache_statistics
+from ads.api.pdf_ocr import COMBINED_OCR_FILE_NAME, format_page_text
+
+
+def iter_ocr_source_lines(
+    page_texts_by_page: Iterable[tuple[int, list[tuple[str, str]]]],
+    combined_ocr_file: TextIO,
+) -> Iterator[str]:
+    """
+    Yields the sanitized lines of the combined OCR text as pages come in, writing the same text that
+    `export_pdf_ocr_text` would to `combined_ocr_file` along the way.
+    """
+    separator = ""
+    for page_number, page_texts in page_texts_by_page:
+        for label, text in page_texts:
+            page_text = separator + format_page_text(page_number, label, text)
+            separator = "\n\n"
+            combined_ocr_file.write(page_text)
+            for source_line in page_text.splitlines(keepends=True):
+                yield sanitize_source_line(source_line)
+
+
+def build_monsters(
+    page_texts_by_page: Iterable[tuple[int, list[tuple[str, str]]]],
+    ocr_folder_path: str,
+    yaml_folder_path: str,
+    monster_cache: Optional[MonsterCache] = None,
+    engine_name: str = DEFAULT_PARSER_ENGINE_NAME,
+) -> None:
+    """
+    Runs the monster export over OCR output while it is still being produced: a monster's YAML is written as soon
+    as the next header (or the next page) closes its block, while the OCR workers are already busy with the pages
+    after it.
+    """
+    started_at = time.perf_counter()
+    os.makedirs(ocr_folder_path, exist_ok=True)
+    os.makedirs(yaml_folder_path, exist_ok=True)
+    combined_ocr_file_path = os.path.join(ocr_folder_path, COMBINED_OCR_FILE_NAME)
+    with open(combined_ocr_file_path, "w", encoding="utf-8") as combined_ocr_file:
+        source_lines = iter_ocr_source_lines(page_texts_by_page, combined_ocr_file)
+        monster_blocks = iter_monster_blocks(source_lines)
+        monster_models = iter_monster_models(monster_blocks, monster_cache, engine_name)
+        # Deduplicated as models, the way `export_monsters` does it.
+        monster_foundry_actor_models = iter_monster_foundry_actor_models(
+            deduplicate_monsters(monster_models)
+        )
+        exported_count = export_yaml(monster_foundry_actor_models, yaml_folder_path)
+
+    print(
+        f"Exported {exported_count} monsters to [{yaml_folder_path}] in {time.perf_counter() - started_at:.1f}s."
+    )
+    print(f"OCR text saved to [{combined_ocr_file_path}].")
+    print("Parse cache:")
+    print_parse_cache_statistics()
+    if monster_cache:
+        print(
+            f"  - monster cache: {monster_cache.hits} hits / {monster_cache.misses} misses "
+            f"[{monster_cache.cache_file_path}]"
+        )
@@ -0,0 +1,371 @@
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Iterable, NamedTuple, Optional
+
+import numpy as np
+
+from ads.api.power_roll_analytics import (
+    CRITICAL_NATURAL_ROLL,
+    EDGE_STATE_NAMES,
+    TIER_MIN_TOTALS,
+    get_tier_probabilities,
+)
+from ads.model import Ability, Monster
+
+DEFAULT_COMBAT_COUNT = 10000
+DEFAULT_CHUNK_SIZE = 2500
+DEFAULT_MAX_ROUNDS = 20
+# Villain actions are used at the end of the first three rounds, in order.
+VILLAIN_ACTION_COUNT = 3
+HEROES_WIN = 1
+MONSTERS_WIN = -1
+DRAW = 0
+# "Goblin Warrior:4"
+MONSTER_COUNT_SEPARATOR = ":"
+
+
+class PartySpec(NamedTuple):
+    hero_count: int
+    stamina: int
+    bonus: int
+    tier_damage: tuple[int, int, int]
+
+
+class CreatureTable(NamedTuple):
+    """
+    One row per creature in the encounter.  Every attack is a power roll: the best round ability, the best
+    malice ability (a cost of 0 when there is none), and the villain action of each ordinal.  A creature without
+    a round ability makes its free strike, which always hits.
+    """
+
+    names: np.ndarray
+    stamina: np.ndarray
+    round_bonuses: np.ndarray
+    round_tier_damage: np.ndarray
+    malice_costs: np.ndarray
+    malice_bonuses: np.ndarray
+    malice_tier_damage: np.ndarray
+    villain_bonuses: np.ndarray
+    villain_tier_damage: np.ndarray
+    has_villain_action: np.ndarray
+
+
+class CombatOutcomes(NamedTuple):
+    winners: np.ndarray
+    rounds: np.ndarray
+    heroes_standing: np.ndarray
+
+
+def get_power_roll_columns(ability: Ability) -> tuple[int, list[int]]:
+    power_roll = ability["powerRoll"]  # type: ignore
+    return power_roll["bonus"], [  # type: ignore
+        power_roll[tier_name].get("damage") or 0
+        for tier_name in ("tier1", "tier2", "tier3")
+    ]
+
+
+def get_best_power_roll(
+    abilities: list[Ability], fallback_damage: int
+) -> tuple[int, list[int], int]:
+    """The bonus, tier damage and malice cost of the ability with the highest expected damage without edges."""
+    best = (0, [fallback_damage] * 3, 0)
+    best_expected_damage = -1.0
+    for ability in abilities:
+        bonus, tier_damage = get_power_roll_columns(ability)
+        expected_damage = float(
+            get_tier_probabilities(np.array([bonus]))[0, EDGE_STATE_NAMES.index("none")]
+            @ tier_damage
+        )
+        if expected_damage > best_expected_damage:
+            best = (bonus, tier_damage, ability.get("maliceCost") or 0)
+            best_expected_damage = expected_damage
+    return best
+
+
+def get_creature_table(encounter: Iterable[tuple[Monster, int]]) -> CreatureTable:
+    """Lays out `encounter`, pairs of a monster and how many of it take part, one creature per row."""
+    rows = []
+    for monster, count in encounter:
+        attacks = [
+            ability
+            for ability in monster["abilities"]
+            if ability.get("powerRoll") and ability["powerRoll"]["bonus"] is not None  # type: ignore
+        ]
+        round_attack = get_best_power_roll(
+            [
+                ability
+                for ability in attacks
+                if ability["type"] == "mainAction" and not ability.get("maliceCost")
+            ],
+            monster["freeStrikeDamage"],
+        )
+        malice_attack = get_best_power_roll(
+            [
+                ability
+                for ability in attacks
+                if ability["type"] != "villainAction" and ability.get("maliceCost")
+            ],
+            0,
+        )
+        villain_attacks = [
+            get_best_power_roll(
+                [
+                    ability
+                    for ability in attacks
+                    if ability["type"] == "villainAction"
+                    and ability.get("villainActionOrdinal") == ordinal
+                ],
+                0,
+            )
+            for ordinal in range(1, VILLAIN_ACTION_COUNT + 1)
+        ]
+        rows.extend([(monster, round_attack, malice_attack, villain_attacks)] * count)
+    return CreatureTable(
+        names=np.array([monster["name"] for monster, _, _, _ in rows], dtype=str),
+        stamina=np.array([monster["stamina"] for monster, _, _, _ in rows], np.int32),
+        round_bonuses=np.array([attack[0] for _, attack, _, _ in rows], np.int32),
+        round_tier_damage=np.array(
+            [attack[1] for _, attack, _, _ in rows], np.int32
+        ).reshape(-1, 3),
+        malice_costs=np.array([attack[2] for _, _, attack, _ in rows], np.int32),
+        malice_bonuses=np.array([attack[0] for _, _, attack, _ in rows], np.int32),
+        malice_tier_damage=np.array(
+            [attack[1] for _, _, attack, _ in rows], np.int32
+        ).reshape(-1, 3),
+        villain_bonuses=np.array(
+            [[attack[0] for attack in attacks] for _, _, _, attacks in rows], np.int32
+        ).reshape(-1, VILLAIN_ACTION_COUNT),
+        villain_tier_damage=np.array(
+            [[attack[1] for attack in attacks] for _, _, _, attacks in rows], np.int32
+        ).reshape(-1, VILLAIN_ACTION_COUNT, 3),
+        has_villain_action=np.array(
+            [[any(attack[1]) for attack in attacks] for _, _, _, attacks in rows],
+            bool,
+        ).reshape(-1, VILLAIN_ACTION_COUNT),
+    )
+
+
+def roll_damage(
+    rng: np.random.Generator, combat_count: int, bonus: int, tier_damage: np.ndarray
+) -> np.ndarray:
+    # One power roll per combat, all at once.
+    natural_rolls = rng.integers(1, 11, (combat_count, 2)).sum(axis=1)
+    tiers = np.where(
+        natural_rolls >= CRITICAL_NATURAL_ROLL,
+        2,
+        np.digitize(natural_rolls + bonus, TIER_MIN_TOTALS),
+    )
+    return np.asarray(tier_damage)[tiers]
+
+
+def apply_damage(stamina: np.ndarray, acting: np.ndarray, damage: np.ndarray) -> None:
+    """Deals `damage` to the first standing combatant of each combat where someone is `acting`."""
+    standing = stamina > 0
+    targets = np.argmax(standing, axis=1)
+    combats = np.flatnonzero(acting & standing.any(axis=1))
+    stamina[combats, targets[combats]] -= damage[combats]
+
+
+def simulate_combats(
+    creatures: CreatureTable,
+    party: PartySpec,
+    combat_count: int,
+    seed_sequence: np.random.SeedSequence,
+    max_rounds: int = DEFAULT_MAX_ROUNDS,
+) -> CombatOutcomes:
+    """
+    Plays `combat_count` independent combats side by side, each array holding one row per combat.  Every
+    round the director gains malice for each standing hero plus the round number; the heroes attack, then each
+    creature makes its malice attack when the malice covers it and its round attack otherwise, then the villain
+    actions of that round go off against every standing hero.  Everybody attacks the first standing enemy.
+    """
+    rng = np.random.default_rng(seed_sequence)
+    creature_stamina = np.tile(creatures.stamina, (combat_count, 1))
+    hero_stamina = np.full((combat_count, party.hero_count), party.stamina, np.int32)
+    hero_tier_damage = np.array(party.tier_damage)
+    malice = np.zeros(combat_count, np.int32)
+    winners = np.zeros(combat_count, np.int8)
+    rounds = np.full(combat_count, max_rounds, np.int16)
+    ongoing = np.ones(combat_count, bool)
+
+    for round_number in range(1, max_rounds + 1):
+        malice[ongoing] += (hero_stamina[ongoing] > 0).sum(axis=1) + round_number
+        for hero in range(party.hero_count):
+            apply_damage(
+                creature_stamina,
+                ongoing & (hero_stamina[:, hero] > 0),
+                roll_damage(rng, combat_count, party.bonus, hero_tier_damage),
+            )
+        defeated = ongoing & ~(creature_stamina > 0).any(axis=1)
+        winners[defeated] = HEROES_WIN
+        rounds[defeated] = round_number
+        ongoing &= ~defeated
+
+        for creature in range(len(creatures.names)):
+            acting = ongoing & (creature_stamina[:, creature] > 0)
+            malice_cost = creatures.malice_costs[creature]
+            uses_malice = acting & (malice >= malice_cost) & (malice_cost > 0)
+            malice[uses_malice] -= malice_cost
+            damage = np.where(
+                uses_malice,
+                roll_damage(
+                    rng,
+                    combat_count,
+                    creatures.malice_bonuses[creature],
+                    creatures.malice_tier_damage[creature],
+                ),
+                roll_damage(
+                    rng,
+                    combat_count,
+                    creatures.round_bonuses[creature],
+                    creatures.round_tier_damage[creature],
+                ),
+            )
+            apply_damage(hero_stamina, acting, damage)
+        if round_number <= VILLAIN_ACTION_COUNT:
+            for creature in np.flatnonzero(
+                creatures.has_villain_action[:, round_number - 1]
+            ):
+                acting = ongoing & (creature_stamina[:, creature] > 0)
+                damage = roll_damage(
+                    rng,
+                    combat_count,
+                    creatures.villain_bonuses[creature, round_number - 1],
+                    creatures.villain_tier_damage[creature, round_number - 1],
+                )
+                hero_stamina[acting] -= damage[acting, None]
+        defeated = ongoing & ~(hero_stamina > 0).any(axis=1)
+        winners[defeated] = MONSTERS_WIN
+        rounds[defeated] = round_number
+        ongoing &= ~defeated
+        if not ongoing.any():
+            break
+
+    return CombatOutcomes(winners, rounds, (hero_stamina > 0).sum(axis=1))
+
+
+def run_combat_simulations(
+    creatures: CreatureTable,
+    party: PartySpec,
+    combat_count: int = DEFAULT_COMBAT_COUNT,
+    seed: Optional[int] = None,
+    workers: int = 1,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    max_rounds: int = DEFAULT_MAX_ROUNDS,
+) -> CombatOutcomes:
+    """
+    Splits the combats into chunks with a seed of their own each, spawned from `seed`, and runs the chunks on
+    `workers` processes.  Chunks don't depend on the worker count, so a seeded run gives the same outcomes
+    however many workers play it.
+    """
+    chunk_counts = [
+        min(chunk_size, combat_count - start)
+        for start in range(0, combat_count, chunk_size)
+    ]
+    seed_sequences = np.random.SeedSequence(seed).spawn(len(chunk_counts))
+    if workers <= 1:
+        chunk_outcomes = list(
+            map(
+                simulate_combats,
+                [creatures] * len(chunk_counts),
+                [party] * len(chunk_counts),
+                chunk_counts,
+                seed_sequences,
+                [max_rounds] * len(chunk_counts),
+            )
+        )
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            chunk_outcomes = list(
+                executor.map(
+                    simulate_combats,
+                    [creatures] * len(chunk_counts),
+                    [party] * len(chunk_counts),
+                    chunk_counts,
+                    seed_sequences,
+                    [max_rounds] * len(chunk_counts),
+                )
+            )
+    return CombatOutcomes(
+        *[
+            np.concatenate(
+                [getattr(outcomes, field_name) for outcomes in chunk_outcomes]
+            )
+            for field_name in CombatOutcomes._fields
+        ]
+    )
+
+
+def get_encounter_monsters(
+    monster_models: Iterable[Monster], monster_specs: list[str]
+) -> list[tuple[Monster, int]]:
+    """Looks up "name" or "name:count" specs among `monster_models`, case-insensitively."""
+    monsters_by_name = {monster["name"].lower(): monster for monster in monster_models}
+    encounter = []
+    for monster_spec in monster_specs:
+        name, _, count = monster_spec.partition(MONSTER_COUNT_SEPARATOR)
+        monster = monsters_by_name.get(name.strip().lower())
+        if monster is None:
+            raise ValueError(f"Unknown monster: '{name.strip()}'")
+        encounter.append((monster, int(count) if count.strip() else 1))
+    return encounter
+
+
+def print_combat_report(
+    outcomes: CombatOutcomes, party: PartySpec, elapsed: float
+) -> None:
+    combat_count = len(outcomes.winners)
+    print(
+        f"Simulated {combat_count} combats in {elapsed:.2f}s ({combat_count / elapsed:,.0f} combats/s)."
+    )
+    for label, winner in (
+        ("heroes win", HEROES_WIN),
+        ("monsters win", MONSTERS_WIN),
+        ("draw", DRAW),
+    ):
+        won = outcomes.winners == winner
+        if not won.any():
+            print(f"  - {label}: 0.0%")
+            continue
+        print(
+            f"  - {label}: {won.mean() * 100:.1f}%, after {outcomes.rounds[won].mean():.1f} rounds on average "
+            f"with {outcomes.heroes_standing[won].mean():.1f} of {party.hero_count} heroes standing"
+        )
+    print("Rounds to defeat:")
+    decided = outcomes.winners != DRAW
+    round_counts = np.bincount(outcomes.rounds[decided])
+    for round_number in np.flatnonzero(round_counts):
+        share = round_counts[round_number] / combat_count
+        print(f"  {round_number:>3} {share * 100:>5.1f}% {'#' * round(share * 50)}")
+
+
+def benchmark_combat_simulation(
+    creatures: CreatureTable,
+    party: PartySpec,
+    combat_count: int,
+    max_workers: Optional[int] = None,
+) -> None:
+    """Times the same seeded run on 1, 2, 4... workers and checks that they all agree."""
+    max_workers = max_workers or os.cpu_count() or 1
+    worker_counts = [1]
+    while worker_counts[-1] * 2 <= max_workers:
+        worker_counts.append(worker_counts[-1] * 2)
+    chunk_size = max(1, combat_count // (max_workers * 4))
+    print(f"{'workers':>8}{'seconds':>10}{'combats/s':>14}{'speedup':>9}")
+    baseline_seconds = 0.0
+    baseline_winners: Optional[np.ndarray] = None
+    for worker_count in worker_counts:
+        started_at = time.perf_counter()
+        outcomes = run_combat_simulations(
+            creatures, party, combat_count, 0, worker_count, chunk_size
+        )
+        elapsed = time.perf_counter() - started_at
+        baseline_seconds = baseline_seconds or elapsed
+        if baseline_winners is None:
+            baseline_winners = outcomes.winners
+        elif not np.array_equal(baseline_winners, outcomes.winners):
+            print(f"[WARN] Outcomes on {worker_count} workers differ from 1 worker.")
+        print(
+            f"{worker_count:>8}{elapsed:>10.2f}{combat_count / elapsed:>14,.0f}{baseline_seconds / elapsed:>9.2f}"
+        )
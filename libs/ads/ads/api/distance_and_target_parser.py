@@ -1,163 +1,173 @@
 import re
+from typing import NamedTuple, Optional
 
+from ads.api.parse_cache import memoized_parser
 from ads.model import (
-    Cube,
-    Distance,
-    Line,
-    Target,
+    CubeRecord,
+    DistanceRecord,
+    LineRecord,
+    TargetRecord,
 )
 
-MELEE_DISTANCE_PATTERN = r"Melee\s*(?P<meleeDistance>\d\d?)"
-RANGED_DISTANCE_PATTERN = r"Ranged\s*(?P<rangedDistance>\d\d?)"
-DISTANCE_PATTERN_BY_TYPE = {
-    "self": re.compile(r"^.*Self.*$", re.IGNORECASE),
-    "meleeAndRanged": re.compile(
-        rf"^.*{MELEE_DISTANCE_PATTERN}.*{RANGED_DISTANCE_PATTERN}.*$", re.IGNORECASE
-    ),
-    "melee": re.compile(rf"^.*{MELEE_DISTANCE_PATTERN}.*$", re.IGNORECASE),
-    "ranged": re.compile(rf"^.*{RANGED_DISTANCE_PATTERN}.*$", re.IGNORECASE),
-    "burst": re.compile(r"^[^0-9]*(?P<burstSize>\d\d?)\s*burst.*$", re.IGNORECASE),
-    "cube": re.compile(
-        r"^.*(?P<cubeSize>\d\d?)\s*cube\s*within\s*(?P<cubeWithin>\d\d?).*$",
-        re.IGNORECASE,
-    ),
-    "line": re.compile(
-        r"^.*(?P<lineWidth>\d\d?)\s*x\s*(?P<lineLength>\d\d?)\s*line\s*within\s*(?P<lineWithin>\d\d?).*$",
-        re.IGNORECASE,
-    ),
-}
-
-TARGET_PATTERN = re.compile(
-    r"(?P<self>self)?.*(?P<targetCount>(?:all|each|every|one|two|three|1|2|3))?.*(?:(?P<targetType>all(?:y|ies)|enem(?:y|ies)|creature[s]?|hero(?:es|s)|monster[s]?|target[s]?|object[s]?)\s*(?:or)?\s*)*.*$",
-    re.IGNORECASE,
+# A word, a number, or any other single character; whitespace only separates tokens.  Distance words are split off
+# the start of a word, since OCR often drops the space after them ("cubewithin").
+DISTANCE_TOKEN_PATTERN = re.compile(
+    r"(?i:melee|ranged|burst|cube|within|line|self|special)|[A-Za-z]+|\d+|\S"
 )
+TARGET_AREA_PATTERN = re.compile(r"\s*in the (?:area|aura|burst|cube|line|square)\s*")
+TARGET_NUMBER_WORD_PATTERN = re.compile(r"([Oo]ne|[Tt]wo|[Tt]hree|[Ff]our|[Ff]ive)\s")
+NUMBER_BY_WORD = {
+    "one": 1,
+    "two": 2,
+    "three": 3,
+    "four": 4,
+    "five": 5,
+}
+# The first of these digits or number words in the target is read as its count, wherever it is.
+TARGET_COUNT_PATTERN = re.compile(r"[1-5]|one|two|three|four|five")
+# Words found anywhere in the target ("creatures", "heroes") and the flags they set, in the order they are set.
+TARGET_FLAGS_BY_WORD = {
+    "special": ("special",),
+    "self": ("self",),
+    "ally": ("ally",),
+    "allies": ("ally",),
+    "creature": ("ally", "self", "enemy"),
+    "enemy": ("enemy",),
+    "enemies": ("enemy",),
+    "hero": ("ally", "self"),
+    "object": ("object",),
+}
 
 
-def parse_distance(distance_and_target_line: str) -> Distance:
-    distance_source = distance_and_target_line[len("Distance ") :].strip()
-    if not distance_source:
-        raise ValueError(f"Invalid distance line: '{distance_and_target_line}'")
-
-    normalized = distance_source.replace("  ", " ").replace("  ", " ")
-
-    # print(f"  - Distance: [{normalized}]")
-    match = DISTANCE_PATTERN_BY_TYPE["self"].match(normalized)
-    if match:
-        # print("      Matched by 'self' pattern")
-        return Distance(self=True)
-
-    match = DISTANCE_PATTERN_BY_TYPE["meleeAndRanged"].match(normalized)
-    if match:
-        # print("      Matched by 'meleeAndRanged' pattern")
-        return Distance(
-            melee=int(match.group("meleeDistance")),
-            ranged=int(match.group("rangedDistance")),
-        )
-
-    match = DISTANCE_PATTERN_BY_TYPE["melee"].match(normalized)
-    if match:
-        # print("      Matched by 'melee' pattern")
-        return Distance(melee=int(match.group("meleeDistance")))
-
-    match = DISTANCE_PATTERN_BY_TYPE["ranged"].match(normalized)
-    if match:
-        # print("      Matched by 'ranged' pattern")
-        return Distance(ranged=int(match.group("rangedDistance")))
-
-    match = DISTANCE_PATTERN_BY_TYPE["burst"].match(normalized)
-    if match:
-        # print("      Matched by 'burst' pattern")
-        return Distance(burst=int(match.group("burstSize")))
-
-    match = DISTANCE_PATTERN_BY_TYPE["cube"].match(normalized)
-    if match:
-        # print("      Matched by 'cube' pattern")
-        return Distance(
-            cube=Cube(
-                size=int(match.group("cubeSize")), within=int(match.group("cubeWithin"))
+class DistanceAndTarget(NamedTuple):
+    distance: Optional[DistanceRecord]
+    target: Optional[TargetRecord]
+
+
+def get_distance_from_tokens(tokens: list[str]) -> Optional[DistanceRecord]:
+    is_self = False
+    is_special = False
+    melee: Optional[int] = None
+    ranged: Optional[int] = None
+    burst: Optional[int] = None
+    cube: Optional[CubeRecord] = None
+    line: Optional[LineRecord] = None
+    # Padded, so the tokens after any token can be looked at without bounds checks.
+    padded_tokens = tokens + [""] * 5
+    for index, token in enumerate(tokens):
+        following = padded_tokens[index + 1 : index + 6]
+        if token == "self":
+            is_self = True
+        elif token == "special":
+            is_special = True
+        # Matched at the end of a token too: "orRanged15" reads as "or Ranged 15".
+        elif token.endswith("melee") and following[0].isdigit():
+            melee = melee if melee is not None else int(following[0])
+        elif token.endswith("ranged") and following[0].isdigit():
+            ranged = ranged if ranged is not None else int(following[0])
+        elif not token.isdigit():
+            continue
+        elif following[0].startswith("burst"):
+            burst = burst if burst is not None else int(token)
+        elif following[:2] == ["cube", "within"] and following[2].isdigit():
+            cube = cube or CubeRecord(size=int(token), within=int(following[2]))
+        elif (
+            following[0] == "x"
+            and following[1].isdigit()
+            and following[2:4] == ["line", "within"]
+            and following[4].isdigit()
+        ):
+            line = line or LineRecord(
+                width=int(token), length=int(following[1]), within=int(following[4])
             )
-        )
 
-    match = DISTANCE_PATTERN_BY_TYPE["line"].match(normalized)
-    if match:
-        # print("      Matched by 'line' pattern")
-        return Distance(
-            line=Line(
-                width=int(match.group("lineWidth")),
-                length=int(match.group("lineLength")),
-                within=int(match.group("lineWithin")),
-            )
-        )
-
-    if "special" in normalized.lower():
-        return Distance(special=True)
-
-    raise ValueError(
-        f"Could not parse distance from line: '{distance_and_target_line}'\n"
-        f"Normalized as: '{normalized}'"
+    if is_self:
+        return DistanceRecord(self=True)
+    if melee is not None and ranged is not None:
+        return DistanceRecord(melee=melee, ranged=ranged)
+    if melee is not None:
+        return DistanceRecord(melee=melee)
+    if ranged is not None:
+        return DistanceRecord(ranged=ranged)
+    if burst is not None:
+        return DistanceRecord(burst=burst)
+    if cube:
+        return DistanceRecord(cube=cube)
+    if line:
+        return DistanceRecord(line=line)
+    if is_special:
+        return DistanceRecord(special=True)
+    return None
+
+
+def get_target(target_source: str) -> TargetRecord:
+    target_text = TARGET_AREA_PATTERN.sub(
+        "", target_source.replace("  ", " ").replace("  ", " ").strip()
     )
+    target_text = TARGET_NUMBER_WORD_PATTERN.sub(
+        lambda match: f"{NUMBER_BY_WORD[match.group(1).lower()]} ", target_text
+    )
+    target = TargetRecord(text=target_text)
+
+    lowered_source = target_source.lower()
+    for word, flags in TARGET_FLAGS_BY_WORD.items():
+        if word in lowered_source:
+            for flag in flags:
+                setattr(target, flag, True)
+
+    count_match = TARGET_COUNT_PATTERN.search(lowered_source)
+    if count_match:
+        count = count_match.group()
+        target.count = int(count) if count.isdigit() else NUMBER_BY_WORD[count]
+    return target
 
 
-def parse_target(distance_and_target_line: str) -> Target | None:
-    if "Target" not in distance_and_target_line:
-        f"[WARN] Didn't find Target in same line as Distance, which is highly unusual (but not illegal, nor completely unheard of): '{distance_and_target_line}'"
-        return None
+@memoized_parser
+def parse_distance_and_target(distance_and_target_line: str) -> DistanceAndTarget:
+    """
+    Reads a "Distance ... Target ..." line once: the distance from the tokens between the label and "Target", and
+    the target from the text after the last "Target".  Either is None when the line has no such part; distance
+    words in the target ("Target Self or one ally") don't count towards the distance.
+    """
+    distance_end = distance_and_target_line.find("Target")
+    if distance_end < 0:
+        distance_end = len(distance_and_target_line)
+    target_start = distance_and_target_line.rfind("Target") + len("Target")
+    distance_tokens = [
+        token.lower()
+        for token in DISTANCE_TOKEN_PATTERN.findall(
+            distance_and_target_line, 0, distance_end
+        )
+    ]
 
-    normalized = (
-        distance_and_target_line.split("Target")[-1]
-        .replace("  ", " ")
-        .replace("  ", " ")
-        .strip()
+    target_source = (
+        distance_and_target_line[target_start:]
+        if distance_end < len(distance_and_target_line)
+        else None
     )
-    normalized = re.sub(
-        r"\s*in the (?:area|aura|burst|cube|line|square)\s*", "", normalized
+    # The first token is the "Distance" label.
+    distance = get_distance_from_tokens(distance_tokens[1:])
+    if (
+        distance is None
+        and distance_tokens
+        and target_source is not None
+        and "special" in target_source.lower()
+    ):
+        # A distance too garbled to read is taken as special when the target is.
+        distance = DistanceRecord(special=True)
+    return DistanceAndTarget(
+        distance, get_target(target_source) if target_source is not None else None
     )
-    normalized = re.sub(r"[Oo]ne\s", r"1 ", normalized)
-    normalized = re.sub(r"[Tt]wo\s", r"2 ", normalized)
-    normalized = re.sub(r"[Tt]hree\s", r"3 ", normalized)
-    normalized = re.sub(r"[Ff]our\s", r"4 ", normalized)
-    normalized = re.sub(r"[Ff]ive\s", r"5 ", normalized)
-
-    target = Target(text=normalized)
-
-    if re.search("special", normalized, re.IGNORECASE):
-        target["special"] = True
-    if re.search("self", normalized, re.IGNORECASE):
-        target["self"] = True
-    if re.search(r"ally|allies", normalized, re.IGNORECASE):
-        target["ally"] = True
-    if re.search(r"creature[s]?", normalized, re.IGNORECASE):
-        target["ally"] = True
-        target["self"] = True
-        target["enemy"] = True
-    if re.search(r"enemy|enemies", normalized, re.IGNORECASE):
-        target["enemy"] = True
-    if re.search(r"hero(?:es|s)?", normalized, re.IGNORECASE):
-        target["ally"] = True
-        target["self"] = True
-    if re.search(r"object[s]?", normalized, re.IGNORECASE):
-        target["object"] = True
-
-    if re.search(r"(?:all|each|every)/s", normalized, re.IGNORECASE):
-        target["count"] = "all"
-    else:
-        match = re.search(
-            r"(?P<countInteger>[1|2|3|4|5])|(?P<countWord>one|two|three|four|five)",
-            normalized,
-            re.IGNORECASE,
+
+
+def parse_distance(distance_and_target_line: str) -> DistanceRecord:
+    distance = parse_distance_and_target(distance_and_target_line).distance
+    if distance is None:
+        raise ValueError(
+            f"Could not parse distance from line: '{distance_and_target_line}'"
         )
-        match_groups = match.groupdict() if match else {}
-
-        if match_groups.get("countInteger"):
-            target["count"] = int(match_groups["countInteger"])
-        elif match_groups.get("countWord"):
-            number_by_word = {
-                "one": 1,
-                "two": 2,
-                "three": 3,
-                "four": 4,
-                "five": 5,
-            }
-            target["count"] = number_by_word[match_groups["countWord"].lower()]
+    return distance
 
-    return target
+
+def parse_target(distance_and_target_line: str) -> TargetRecord | None:
+    return parse_distance_and_target(distance_and_target_line).target
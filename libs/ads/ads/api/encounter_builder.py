@@ -0,0 +1,241 @@
+import heapq
+import math
+import time
+from typing import NamedTuple
+
+import numpy as np
+
+from ads.api.bestiary_index import BestiaryIndex
+
+# A minion's EV is given for a squad of this many minions.
+MINION_EV_SQUAD_SIZE = 4
+DEFAULT_MINION_SQUAD_SIZES = (4,)
+DEFAULT_MAX_KINDS = 4
+DEFAULT_MAX_COUNT = 6
+DEFAULT_MAX_LEADERS = 1
+DEFAULT_EV_TOLERANCE = 2
+DEFAULT_ENCOUNTER_COUNT = 10
+# Types only ever fielded once per encounter.
+SINGLE_CREATURE_TYPES = ("leader", "solo")
+
+
+class EncounterUnit(NamedTuple):
+    name: str
+    type: str
+    level: int
+    is_leader: bool
+    # (creature count, EV) per way of fielding the monster, highest EV first.
+    options: tuple[tuple[int, int], ...]
+
+
+class EncounterPick(NamedTuple):
+    name: str
+    type: str
+    creature_count: int
+    encounter_value: int
+
+
+class Encounter(NamedTuple):
+    encounter_value: int
+    picks: tuple[EncounterPick, ...]
+
+
+class EncounterSearch(NamedTuple):
+    """The fixed inputs of one search and the heap of the best encounters found so far."""
+
+    units: list[EncounterUnit]
+    # reachable_sums[i][k]: bit s is set when units[i:] can add exactly s EV using at most k of them.
+    reachable_sums: list[list[int]]
+    budget: int
+    min_encounter_value: int
+    max_kinds: int
+    max_leaders: int
+    encounter_count: int
+    # Entries are (-gap, kinds, -order, encounter), so the root is the worst encounter kept.
+    best: list[tuple[int, int, int, Encounter]]
+
+
+def get_encounter_units(
+    bestiary_index: BestiaryIndex,
+    rows: np.ndarray,
+    minion_squad_sizes: tuple[int, ...] = DEFAULT_MINION_SQUAD_SIZES,
+    max_count: int = DEFAULT_MAX_COUNT,
+) -> list[EncounterUnit]:
+    """
+    One unit per monster of `rows`: minions are fielded in up to `max_count` squads of one of `minion_squad_sizes`,
+    leaders and solos once, anyone else up to `max_count` times.
+    """
+    units = []
+    for row in rows:
+        monster_type = str(bestiary_index.type_names[bestiary_index.type_codes[row]])
+        encounter_value = int(bestiary_index.columns["encounterValue"][row])
+        if encounter_value <= 0:
+            continue
+        if monster_type.lower() == "minion":
+            option_set = {
+                (
+                    squad_count * squad_size,
+                    squad_count
+                    * math.ceil(encounter_value * squad_size / MINION_EV_SQUAD_SIZE),
+                )
+                for squad_size in minion_squad_sizes
+                for squad_count in range(1, max_count + 1)
+            }
+        elif monster_type.lower() in SINGLE_CREATURE_TYPES:
+            option_set = {(1, encounter_value)}
+        else:
+            option_set = {
+                (count, count * encounter_value) for count in range(1, max_count + 1)
+            }
+        units.append(
+            EncounterUnit(
+                name=str(bestiary_index.names[row]),
+                type=monster_type,
+                level=int(bestiary_index.columns["level"][row]),
+                is_leader=monster_type.lower() == "leader",
+                options=tuple(sorted(option_set, key=lambda option: -option[1])),
+            )
+        )
+    # The costliest units are decided first, which leaves the cheap ones to fill the remaining budget.
+    units.sort(key=lambda unit: (-unit.options[0][1], unit.name))
+    return units
+
+
+def get_reachable_sums(
+    units: list[EncounterUnit], budget: int, max_kinds: int
+) -> list[list[int]]:
+    """
+    Dynamic programme over the units from last to first: the EV sums each suffix can make with at most k units,
+    as Python integers used as bitsets, capped at the budget.
+    """
+    budget_mask = (1 << (budget + 1)) - 1
+    reachable_sums = [[1] * (max_kinds + 1)]
+    for unit in reversed(units):
+        following = reachable_sums[-1]
+        current = [following[0]]
+        for kinds in range(1, max_kinds + 1):
+            sums = following[kinds]
+            for _, encounter_value in unit.options:
+                sums |= following[kinds - 1] << encounter_value
+            current.append(sums & budget_mask)
+        reachable_sums.append(current)
+    reachable_sums.reverse()
+    return reachable_sums
+
+
+def get_best_reachable_sum(reachable: int, remaining_budget: int) -> int:
+    # The highest sum that still fits in the budget; 0 is always reachable by adding nothing.
+    return (reachable & ((1 << (remaining_budget + 1)) - 1)).bit_length() - 1
+
+
+def add_encounter(
+    search: EncounterSearch, encounter_value: int, picks: list[EncounterPick]
+) -> None:
+    entry = (
+        encounter_value - search.budget,
+        len(picks),
+        -len(search.best),
+        Encounter(encounter_value, tuple(picks)),
+    )
+    if len(search.best) < search.encounter_count:
+        heapq.heappush(search.best, entry)
+    elif entry[:2] > search.best[0][:2]:
+        heapq.heapreplace(search.best, entry)
+
+
+def is_pruned(
+    search: EncounterSearch, unit_index: int, encounter_value: int, kinds: int
+) -> bool:
+    """
+    Bounds the branch with the reachable sums: it is cut when no completion lands within the tolerance, or when
+    even its best completion can't beat the worst encounter kept.
+    """
+    remaining_budget = search.budget - encounter_value
+    best_sum = get_best_reachable_sum(
+        search.reachable_sums[unit_index][search.max_kinds - kinds], remaining_budget
+    )
+    if encounter_value + best_sum < search.min_encounter_value:
+        return True
+    if len(search.best) < search.encounter_count:
+        return False
+    best_gap = remaining_budget - best_sum
+    best_kinds = search.max_kinds if best_sum > 0 else kinds
+    return (-best_gap, best_kinds) <= search.best[0][:2]
+
+
+def search_encounters(
+    search: EncounterSearch,
+    unit_index: int,
+    encounter_value: int,
+    leaders: int,
+    picks: list[EncounterPick],
+) -> None:
+    """
+    Branch and bound over the units in order: each is fielded in one of its options, or left out.  An encounter
+    is recorded when a pick brings it within the tolerance, so leaving the later units out doesn't repeat it.
+    """
+    if unit_index == len(search.units) or len(picks) == search.max_kinds:
+        return
+    if is_pruned(search, unit_index, encounter_value, len(picks)):
+        return
+
+    unit = search.units[unit_index]
+    if not unit.is_leader or leaders < search.max_leaders:
+        for creature_count, option_value in unit.options:
+            if encounter_value + option_value > search.budget:
+                continue
+            picks.append(
+                EncounterPick(unit.name, unit.type, creature_count, option_value)
+            )
+            if encounter_value + option_value >= search.min_encounter_value:
+                add_encounter(search, encounter_value + option_value, picks)
+            search_encounters(
+                search,
+                unit_index + 1,
+                encounter_value + option_value,
+                leaders + unit.is_leader,
+                picks,
+            )
+            picks.pop()
+    search_encounters(search, unit_index + 1, encounter_value, leaders, picks)
+
+
+def build_encounters(
+    units: list[EncounterUnit],
+    budget: int,
+    tolerance: int = DEFAULT_EV_TOLERANCE,
+    max_kinds: int = DEFAULT_MAX_KINDS,
+    max_leaders: int = DEFAULT_MAX_LEADERS,
+    encounter_count: int = DEFAULT_ENCOUNTER_COUNT,
+) -> list[Encounter]:
+    """
+    Returns the best `encounter_count` encounters worth between `budget - tolerance` and `budget` EV: closest to
+    the budget first, then with the most distinct monsters, then in search order.
+    """
+    search = EncounterSearch(
+        units=units,
+        reachable_sums=get_reachable_sums(units, budget, max_kinds),
+        budget=budget,
+        min_encounter_value=budget - tolerance,
+        max_kinds=max_kinds,
+        max_leaders=max_leaders,
+        encounter_count=encounter_count,
+        best=[],
+    )
+    search_encounters(search, 0, 0, 0, [])
+    return [entry[3] for entry in sorted(search.best, reverse=True)]
+
+
+def print_encounters(
+    encounters: list[Encounter], budget: int, started_at: float
+) -> None:
+    print(
+        f"{len(encounters)} encounters for a budget of {budget} EV, found in "
+        f"{(time.perf_counter() - started_at) * 1000:.1f} ms:"
+    )
+    for encounter_number, encounter in enumerate(encounters, 1):
+        print(f"  {encounter_number:>2}. EV {encounter.encounter_value}")
+        for pick in encounter.picks:
+            print(
+                f"        {pick.creature_count:>2} x {pick.name} ({pick.type}, EV {pick.encounter_value})"
+            )
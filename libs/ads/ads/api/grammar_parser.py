@@ -0,0 +1,603 @@
+import re
+import time
+from typing import Any, Callable, Dict, Iterator, NamedTuple, Optional
+
+from lark import Lark, Token, Tree, UnexpectedInput
+
+from ads.api.ability_and_trait_parser import (
+    TRAIT_NAMES,
+    get_ability_header_fields,
+    normalize_ability_header_line,
+    parse_ability_block,
+    split_ability_blocks,
+)
+from ads.api.monster_parser import (
+    MONSTER_ROLE_WHITELIST,
+    MONSTER_TYPE_WHITELIST,
+    filter_keyword_candidates,
+    get_header_fields,
+    get_monster_model_from_block,
+    iter_monster_blocks,
+    normalize_header_fields,
+    normalize_keywords,
+    normalize_weakness_immunity_type,
+    parse_with_captain,
+    read_source_lines,
+)
+from ads.api.parse_cache import clear_parse_caches
+from ads.api.power_roll_parser import (
+    DAMAGE_TYPE_PATTERN,
+    DAMAGE_TYPES,
+    EFFECT_DURATION_PATTERN,
+    POWER_ROLL_EFFECT_KEYWORDS,
+    normalize_power_roll_tier_line,
+    parse_effect_data,
+    parse_potency_effect,
+)
+from ads.model import (
+    CharacteristicsRecord,
+    ImmunityOrWeakness,
+    Monster,
+    MonsterBlock,
+    MonsterHeader,
+    MonsterRecord,
+    PowerRollTierRecord,
+)
+from ads.model.records import to_monster_model
+
+# The grammars below read the same lines the regex parsers do, after the same OCR repairs.  Each one is compiled
+# once into an LALR(1) parser; its contextual lexer only tries the terminals the parser can accept next, so a
+# name word that happens to spell a monster type ("Goblin Leader") is still read as part of the name.  OCR noise
+# is absorbed by the terminals themselves (stray characters around numbers, "Reas0n") and by a lowest-priority
+# catch-all at the end of the lines the regex parsers never anchored at the end either.
+
+HEADER_GRAMMAR = rf"""
+    header: name LEVEL LEVEL_NUMBER MONSTER_TYPE MONSTER_ROLE? HEADER_TRAILER?
+    name: NAME_PART+
+
+    LEVEL.2: /(?:LEVELT?|LEVE[1IT])(?![a-z])/i
+    LEVEL_NUMBER: /\d+/
+    MONSTER_TYPE: /{"|".join(MONSTER_TYPE_WHITELIST)}/i
+    MONSTER_ROLE: /{"|".join(MONSTER_ROLE_WHITELIST)}/i
+    HEADER_TRAILER: /[_l]/i
+    NAME_PART: /\w+/
+
+    %ignore /[^A-Za-z0-9_]+/
+"""
+
+STATS_GRAMMAR = r"""
+    stats_line: (keywords_and_ev | _stat_field+) STATS_REST?
+    _stat_field: stamina | speed | size_and_stability | free_strike | immunity | weakness | with_captain
+    keywords_and_ev: [keyword (("," | "/") keyword)*] EV STAT_NUMBER
+    keyword: KEYWORD_WORD+
+    stamina: STAMINA STAT_NUMBER
+    speed: SPEED STAT_NUMBER ["(" MOVEMENT_TYPE ("," MOVEMENT_TYPE)* ")"]
+    size_and_stability: SIZE SIZE_VALUE "/" STABILITY STAT_NUMBER
+    free_strike: FREE_STRIKE STAT_NUMBER
+    immunity: IMMUNITY damage_amount ("," damage_amount)*
+    weakness: "/"? WEAKNESS damage_amount ("," damage_amount)*
+    damage_amount: DAMAGE_TYPE_WORD STAT_NUMBER
+    // The captain bonus itself is read by `parse_with_captain`; it is only skipped here.
+    with_captain: WITH_CAPTAIN CAPTAIN_BONUS?
+
+    EV.2: /\bEV\s*[:\-]?/i
+    STAMINA.2: /\bStamina\b/i
+    SPEED.2: /\bSpeed\b/i
+    SIZE.2: /\bSize\b/i
+    STABILITY.2: /Stability/i
+    FREE_STRIKE.2: /\bFree Strike/i
+    IMMUNITY.2: /\bImmunity\b/i
+    WEAKNESS.2: /\bWeakness\b/i
+    WITH_CAPTAIN.2: /\bWith Captain\b/i
+    // Everything up to a Free Strike on the same row, stat names included ("With Captain Speed +2").
+    CAPTAIN_BONUS.3: /(?:(?!\bFree Strike).)+/i
+    STAT_NUMBER: /[0-9Oo]+/
+    KEYWORD_WORD: /[A-Za-z][A-Za-z'.]*/
+    MOVEMENT_TYPE: /[^,()]+/
+    SIZE_VALUE: /\w+/
+    DAMAGE_TYPE_WORD: /[A-Za-z0-9]+/
+    STATS_REST.-1: /.+/
+
+    %ignore /\s+/
+"""
+
+CHARACTERISTICS_GRAMMAR = r"""
+    characteristics: MIGHT SCORE AGILITY SCORE REASON SCORE INTUITION SCORE PRESENCE SCORE CHARACTERISTICS_REST?
+
+    MIGHT: /Might/i
+    AGILITY: /Agility/i
+    REASON: /Reas[o0]n/i
+    INTUITION: /Intuiti[o0]n/i
+    PRESENCE: /Presence/i
+    // OCR reads a zero as "O", "0O" or "od".
+    SCORE: /[+-]?\s*(?:[0-9Oo]+|od)(?![a-z])/
+    CHARACTERISTICS_REST.-1: /.+/
+
+    %ignore /[^A-Za-z0-9+-]+/
+"""
+
+ABILITY_HEADER_GRAMMAR = rf"""
+    ability_header: TRAIT_NAME | ABILITY_NAME "(" ABILITY_TYPE ")" [power_roll] [cost] ABILITY_HEADER_REST?
+    power_roll: POWER_ROLL_DICE "+" POWER_ROLL_BONUS
+    cost: MALICE_COST? MALICE | SIGNATURE
+
+    TRAIT_NAME.3: /(?:{"|".join(TRAIT_NAMES)})\s*$/
+    ABILITY_NAME: /[A-Za-z][A-Za-z!?' ]+[A-Za-z!?]/
+    ABILITY_TYPE: /(?:Free )?(?:Triggered Action|Maneuver|Villain Action\s?[123]?|(?:Main )?Action)/
+    POWER_ROLL_DICE.2: /2[Dd]1[0oO]/
+    POWER_ROLL_BONUS: /[+]?[1-5]/
+    MALICE_COST: /[0-9]{{1,2}}/
+    MALICE.2: /Malice/
+    SIGNATURE.2: /Signature/
+    ABILITY_HEADER_REST.-1: /.+/
+
+    %ignore " "
+"""
+
+POWER_ROLL_TIER_GRAMMAR = rf"""
+    tier: TIER_RANGE (NO_EFFECT TIER_REST? | [damage] [effect] (potency | MARK | SKIPPED)*)
+    damage: DAMAGE_VALUE DAMAGE_TYPE? DAMAGE ";"?
+    effect: MARK? EFFECT_TEXT
+    potency: POTENCY [MARK] [POTENCY_TEXT]
+
+    TIER_RANGE.3: /[^1l!]*(?:11|12.16|17[4]?[+]?)[^\sA-Za-z0-9]?/
+    NO_EFFECT.3: /No effect/i
+    // A damage amount is only read as one when "damage" follows; a stray character may be glued on either side.
+    DAMAGE_VALUE.3: /[^0-9\s]?[1-9][0-9]?[^0-9\s]?(?=\s*(?:{DAMAGE_TYPE_PATTERN})?\s*damage)/i
+    DAMAGE_TYPE.2: /(?:{DAMAGE_TYPE_PATTERN})(?=\s*damage)/i
+    DAMAGE.2: /damage/i
+    POTENCY.3: /[MARIP]\s?<\s?[0-6]/i
+    // Effect and potency text take the characters the regex parsers allow in them, up to the next potency.
+    EFFECT_TEXT.2: /[A-Za-z0-9](?:(?![MARIP]\s?<)[A-Za-z0-9 ,.-])*(?:\((?:{EFFECT_DURATION_PATTERN})?\))?/i
+    POTENCY_TEXT.2: /(?:(?![MARIP]\s?<)[A-Za-z0-9;',. +-])+(?:\((?:{EFFECT_DURATION_PATTERN})\))?/i
+    MARK: /[^\sA-Za-z0-9]+/
+    SKIPPED.-1: /(?:(?![MARIP]\s?<\s?[0-6])[^\s])+/i
+    TIER_REST.-1: /.+/
+
+    %ignore /\s+/
+"""
+
+HEADER_PARSER = Lark(HEADER_GRAMMAR, parser="lalr", start="header")
+STATS_PARSER = Lark(STATS_GRAMMAR, parser="lalr", start="stats_line")
+CHARACTERISTICS_PARSER = Lark(
+    CHARACTERISTICS_GRAMMAR, parser="lalr", start="characteristics"
+)
+ABILITY_HEADER_PARSER = Lark(
+    ABILITY_HEADER_GRAMMAR, parser="lalr", start="ability_header"
+)
+POWER_ROLL_TIER_PARSER = Lark(POWER_ROLL_TIER_GRAMMAR, parser="lalr", start="tier")
+
+EFFECT_KEYWORD_REGEX = re.compile(POWER_ROLL_EFFECT_KEYWORDS, re.IGNORECASE)
+# Stat rows only appear in the first lines of a block; the regex parser looks for the EV in as many.
+KEYWORDS_AND_EV_LINE_COUNT = 6
+# Differences reported per field path by the engine comparison.
+DEFAULT_COMPARISON_EXAMPLES = 10
+
+
+class EngineDifference(NamedTuple):
+    monster_name: str
+    path: str
+    regex_value: Any
+    grammar_value: Any
+
+
+class EngineComparison(NamedTuple):
+    monster_count: int
+    identical_count: int
+    differences: list[EngineDifference]
+
+
+def get_tokens(tree: Tree) -> list[Token]:
+    return list(tree.scan_values(lambda value: isinstance(value, Token)))
+
+
+def get_token_values_by_type(tree: Tree) -> dict[str, str]:
+    # The first token of each type, which is all the header and characteristics grammars have.
+    values_by_type: dict[str, str] = {}
+    for token in get_tokens(tree):
+        values_by_type.setdefault(token.type, token.value)
+    return values_by_type
+
+
+def get_source_text(source_line: str, tokens: list[Token]) -> str:
+    # The text spanned by the tokens, with whatever the lexer skipped between them.
+    return source_line[tokens[0].start_pos : tokens[-1].end_pos]
+
+
+def get_stat_number(token: Token) -> int:
+    return int(token.value.replace("O", "0").replace("o", "0"))
+
+
+def parse_header_line_with_grammar(source_line: str) -> Optional[Dict[str, Any]]:
+    try:
+        tree = HEADER_PARSER.parse(source_line)
+    except UnexpectedInput:
+        return None
+    values_by_type = get_token_values_by_type(tree)
+    return get_header_fields(
+        {
+            "name": get_source_text(source_line, get_tokens(tree.children[0])),
+            "level": values_by_type["LEVEL_NUMBER"],
+            "type": values_by_type["MONSTER_TYPE"],
+            "role": values_by_type.get("MONSTER_ROLE"),
+        }
+    )
+
+
+def parse_characteristics_with_grammar(
+    source_line: str,
+) -> Optional[CharacteristicsRecord]:
+    try:
+        tree = CHARACTERISTICS_PARSER.parse(source_line)
+    except UnexpectedInput:
+        return None
+    scores = [
+        int(re.sub("[Ood]", "0", token.value.replace(" ", "")))
+        for token in get_tokens(tree)
+        if token.type == "SCORE"
+    ]
+    return CharacteristicsRecord(
+        might=scores[0],
+        agility=scores[1],
+        reason=scores[2],
+        intuition=scores[3],
+        presence=scores[4],
+    )
+
+
+def parse_stats_line_with_grammar(source_line: str) -> Dict[str, Any]:
+    """
+    Reads the stat fields of one stat row, keyed by the Monster field they fill.  Immunity and weakness are read
+    as dicts by damage type; a line that isn't a stat row gives an empty dict.
+    """
+    try:
+        tree = STATS_PARSER.parse(source_line)
+    except UnexpectedInput:
+        return {}
+    stats: Dict[str, Any] = {}
+    for field in tree.children:
+        if not isinstance(field, Tree):
+            continue
+        tokens = [child for child in field.children if isinstance(child, Token)]
+        if field.data == "keywords_and_ev":
+            stats["keywordCandidates"] = [
+                get_source_text(source_line, get_tokens(keyword))
+                for keyword in field.children
+                if isinstance(keyword, Tree)
+            ]
+            stats["encounterValue"] = get_stat_number(tokens[-1])
+        elif field.data == "stamina":
+            stats["stamina"] = get_stat_number(tokens[1])
+        elif field.data == "speed":
+            stats["speed"] = get_stat_number(tokens[1])
+            stats["movementTypes"] = [
+                token.value.strip().lower()
+                for token in tokens
+                if token.type == "MOVEMENT_TYPE"
+            ] or ["walk"]
+        elif field.data == "size_and_stability":
+            stats["size"] = tokens[1].value.replace("5", "S")
+            stats["stability"] = get_stat_number(tokens[3])
+        elif field.data == "free_strike":
+            stats["freeStrikeDamage"] = get_stat_number(tokens[1])
+        elif field.data in ("immunity", "weakness"):
+            amounts: ImmunityOrWeakness = stats.setdefault(str(field.data), {})
+            for damage_amount in field.find_data("damage_amount"):
+                damage_type_token, value_token = damage_amount.children
+                damage_type = normalize_weakness_immunity_type(
+                    str(damage_type_token).replace("O", "0").replace("o", "0")
+                )
+                if damage_type in DAMAGE_TYPES:
+                    amounts[damage_type] = get_stat_number(value_token)  # type: ignore
+                else:
+                    print(f"Unknown Weakness/Immunity type: {damage_type!r}")
+    return stats
+
+
+def parse_ability_header_with_grammar(
+    header_line: str, monster_name: str
+) -> Optional[Dict[str, Any]]:
+    normalized = normalize_ability_header_line(header_line)
+    try:
+        tree = ABILITY_HEADER_PARSER.parse(normalized)
+    except UnexpectedInput:
+        print(
+            f"*** [WARN] [{monster_name}]: Could not parse ability header: '{header_line}'\n   Normalized as: {repr(normalized)}"
+        )
+        return None
+    values_by_type = get_token_values_by_type(tree)
+    if "TRAIT_NAME" in values_by_type:
+        return get_ability_header_fields(
+            {"traitName": values_by_type["TRAIT_NAME"].rstrip()},
+            normalized,
+            header_line,
+        )
+    ability_type = values_by_type["ABILITY_TYPE"]
+    has_cost = "MALICE" in values_by_type
+    return get_ability_header_fields(
+        {
+            "abilityName": values_by_type["ABILITY_NAME"],
+            "type": ability_type,
+            "villainActionOrdinal": ability_type[-1]
+            if ability_type[-1].isdigit()
+            else None,
+            "bonus": values_by_type.get("POWER_ROLL_BONUS"),
+            "maliceCost": values_by_type.get("MALICE_COST", "") if has_cost else None,
+            "signature": values_by_type.get("SIGNATURE"),
+        },
+        normalized,
+        header_line,
+    )
+
+
+def parse_power_roll_tier_lines_with_grammar(
+    power_roll_line: str,
+) -> PowerRollTierRecord:
+    """
+    Reads a tier as its range, then optionally damage, an effect and potency effects.  The effect is the text
+    after the damage, kept when it names an effect keyword; the potency effect is the last one on the line.
+    """
+    normalized = normalize_power_roll_tier_line(power_roll_line)
+    try:
+        tree = POWER_ROLL_TIER_PARSER.parse(normalized)
+    except UnexpectedInput:
+        raise ValueError(
+            f"Could not match power roll line: '{power_roll_line}'\n"
+            f"Normalized as: '{normalized}'"
+        )
+
+    if any(
+        isinstance(child, Token) and child.type == "NO_EFFECT"
+        for child in tree.children
+    ):
+        return PowerRollTierRecord(effect=parse_effect_data(tree.children[1].value))
+
+    damage = next(tree.find_data("damage"), None)
+    effect = next(tree.find_data("effect"), None)
+    potency = list(tree.find_data("potency"))
+    effect_text = (
+        get_token_values_by_type(effect)["EFFECT_TEXT"].strip() if effect else ""
+    )
+    has_effect = EFFECT_KEYWORD_REGEX.search(effect_text) is not None
+    if not damage and not has_effect and not potency:
+        raise ValueError(
+            f"Could not match power roll line: '{power_roll_line}'\n"
+            f"Normalized as: '{normalized}'"
+        )
+
+    damage_values_by_type = get_token_values_by_type(damage) if damage else {}
+    potency_values_by_type = get_token_values_by_type(potency[-1]) if potency else {}
+    return PowerRollTierRecord(
+        damage=int(re.sub("[^0-9]", "", damage_values_by_type["DAMAGE_VALUE"]))
+        if damage
+        else None,
+        damageType=damage_values_by_type.get("DAMAGE_TYPE"),
+        effect=parse_effect_data(effect_text) if has_effect else None,
+        potencyEffect=parse_potency_effect(
+            potency_values_by_type["POTENCY"][0],
+            potency_values_by_type["POTENCY"][-1],
+            potency_values_by_type.get("POTENCY_TEXT", ""),
+        )
+        if potency
+        else None,
+    )
+
+
+def get_monster_model_from_block_with_grammar(
+    monster_block: MonsterBlock,
+) -> MonsterRecord:
+    """
+    Grammar-engine counterpart of `get_monster_model_from_block`.  The block is split into stat rows and
+    ability blocks the same way; the header, stat rows, characteristics, ability headers and power roll tiers
+    are read with the grammars.  The "With Captain" row, distances, targets and effect prose are read with the
+    same parsers as the regex engine.
+    """
+    source_lines = monster_block["source_lines"]
+    parsed_header = parse_header_line_with_grammar(
+        monster_block["header"]["header_source_line"]
+    )
+    if not parsed_header:
+        raise ValueError(
+            f"Could not parse monster header: '{monster_block['header']['header_source_line']}'"
+        )
+    monster_header = normalize_header_fields(
+        MonsterHeader(
+            name=parsed_header["name"],
+            level=parsed_header["level"],
+            type=str(parsed_header["type"]).capitalize(),
+            role=str(
+                parsed_header["role"].capitalize() if parsed_header["role"] else None
+            ),
+            header_source_line=monster_block["header"]["header_source_line"],
+            start_line_index=monster_block["header"]["start_line_index"],
+            end_line_index=monster_block["header"]["end_line_index"],
+        )
+    )
+
+    characteristics: Optional[CharacteristicsRecord] = None
+    characteristics_line_index = 0
+    for characteristics_line_index, source_line in enumerate(source_lines):
+        characteristics = parse_characteristics_with_grammar(source_line)
+        if characteristics:
+            break
+    if not characteristics:
+        raise ValueError("Primary characteristics line not found in block!")
+
+    stats: Dict[str, Any] = {}
+    for source_line_index, source_line in enumerate(
+        source_lines[:characteristics_line_index]
+    ):
+        for field_name, value in parse_stats_line_with_grammar(source_line).items():
+            if field_name in ("immunity", "weakness"):
+                stats.setdefault(field_name, {}).update(value)
+            elif field_name in ("keywordCandidates", "encounterValue"):
+                if source_line_index < KEYWORDS_AND_EV_LINE_COUNT:
+                    stats.setdefault(field_name, value)
+            else:
+                stats.setdefault(field_name, value)
+    for field_name in (
+        "encounterValue",
+        "stamina",
+        "speed",
+        "size",
+        "freeStrikeDamage",
+    ):
+        if field_name not in stats:
+            raise ValueError(f"{field_name} not found in the provided lines.")
+
+    monster_model = MonsterRecord(
+        name=monster_header["name"],
+        level=monster_header["level"],
+        type=monster_header["type"],
+        role=monster_header.get("role", None),
+        header_text=monster_header["header_source_line"],
+        keywords=normalize_keywords(
+            filter_keyword_candidates(stats["keywordCandidates"])
+        ),
+        encounterValue=stats["encounterValue"],
+        stamina=stats["stamina"],
+        speed=stats["speed"],
+        movementTypes=stats["movementTypes"],
+        size=stats["size"],
+        stability=stats["stability"],
+        freeStrikeDamage=stats["freeStrikeDamage"],
+        characteristics=characteristics,
+        weakness=stats.get("weakness") or None,
+        immunity=stats.get("immunity") or None,
+        derivedCaptainBonuses=None,
+        appliedCaptainEffects=None,
+        abilities=[],
+    )
+    if monster_header["type"].lower() == "minion":
+        (
+            monster_model.appliedCaptainEffects,
+            monster_model.derivedCaptainBonuses,
+        ) = parse_with_captain(source_lines, characteristics_line_index)
+
+    for ability_block in split_ability_blocks(
+        source_lines[characteristics_line_index + 1 :]
+    ):
+        monster_model.abilities.append(
+            parse_ability_block(
+                ability_block,
+                monster_header["name"],
+                parse_ability_header_with_grammar,
+                parse_power_roll_tier_lines_with_grammar,
+            )
+        )
+    return monster_model
+
+
+def get_model_or_error(
+    build: Callable[[MonsterBlock], MonsterRecord], monster_block: MonsterBlock
+) -> MonsterRecord | str:
+    try:
+        return build(monster_block)
+    except Exception as e:
+        return f"{type(e).__name__}: {e}"
+
+
+def get_comparable_model(model: MonsterRecord | str) -> Monster | str:
+    # Models are compared field by field in their TypedDict shape; an error message is compared as it is.
+    return model if isinstance(model, str) else to_monster_model(model)
+
+
+def get_model_differences(
+    monster_name: str, path: str, regex_value: Any, grammar_value: Any
+) -> Iterator[EngineDifference]:
+    if isinstance(regex_value, dict) and isinstance(grammar_value, dict):
+        for key in {**regex_value, **grammar_value}:
+            yield from get_model_differences(
+                monster_name,
+                f"{path}.{key}",
+                regex_value.get(key),
+                grammar_value.get(key),
+            )
+    elif (
+        isinstance(regex_value, list)
+        and isinstance(grammar_value, list)
+        and len(regex_value) == len(grammar_value)
+    ):
+        for index, (regex_item, grammar_item) in enumerate(
+            zip(regex_value, grammar_value)
+        ):
+            yield from get_model_differences(
+                monster_name, f"{path}[{index}]", regex_item, grammar_item
+            )
+    elif regex_value != grammar_value:
+        yield EngineDifference(monster_name, path, regex_value, grammar_value)
+
+
+def compare_parser_engines(ocr_file_path: str) -> EngineComparison:
+    """Parses every monster block of `ocr_file_path` with both engines and lists where their models differ."""
+    monster_count = 0
+    identical_count = 0
+    differences: list[EngineDifference] = []
+    for monster_block in iter_monster_blocks(read_source_lines(ocr_file_path)):
+        monster_name = monster_block["header"]["name"]
+        monster_differences = list(
+            get_model_differences(
+                monster_name,
+                "monster",
+                get_comparable_model(
+                    get_model_or_error(get_monster_model_from_block, monster_block)
+                ),
+                get_comparable_model(
+                    get_model_or_error(
+                        get_monster_model_from_block_with_grammar, monster_block
+                    )
+                ),
+            )
+        )
+        monster_count += 1
+        identical_count += not monster_differences
+        differences.extend(monster_differences)
+    return EngineComparison(monster_count, identical_count, differences)
+
+
+def get_difference_field_path(path: str) -> str:
+    # "monster.abilities[3].powerRoll.tier1.damage" counts towards "monster.abilities[].powerRoll.tier1.damage".
+    return re.sub(r"\[\d+\]", "[]", path)
+
+
+def print_engine_comparison(
+    comparison: EngineComparison, examples: int = DEFAULT_COMPARISON_EXAMPLES
+) -> None:
+    print(
+        f"{comparison.identical_count} of {comparison.monster_count} monsters parse identically with both engines; "
+        f"{len(comparison.differences)} field differences."
+    )
+    differences_by_field_path: dict[str, list[EngineDifference]] = {}
+    for difference in comparison.differences:
+        differences_by_field_path.setdefault(
+            get_difference_field_path(difference.path), []
+        ).append(difference)
+    for field_path, differences in sorted(
+        differences_by_field_path.items(), key=lambda item: -len(item[1])
+    ):
+        print(f"  - {field_path}: {len(differences)}")
+        for difference in differences[:examples]:
+            print(
+                f"      [{difference.monster_name}] regex: {difference.regex_value!r} "
+                f"grammar: {difference.grammar_value!r}"
+            )
+
+
+def benchmark_parser_engines(ocr_file_path: str, repeat: int) -> None:
+    """Times both engines over every monster block, with the regex parsers' caches cleared before each pass."""
+    monster_blocks = list(iter_monster_blocks(read_source_lines(ocr_file_path)))
+    print(f"{'engine':<10}{'seconds':>10}{'ms/monster':>12}")
+    for engine_name, build in (
+        ("regex", get_monster_model_from_block),
+        ("grammar", get_monster_model_from_block_with_grammar),
+    ):
+        elapsed = 0.0
+        for _ in range(repeat):
+            clear_parse_caches()
+            started_at = time.perf_counter()
+            for monster_block in monster_blocks:
+                get_model_or_error(build, monster_block)
+            elapsed += time.perf_counter() - started_at
+        print(
+            f"{engine_name:<10}{elapsed:>10.3f}{elapsed / (repeat * len(monster_blocks)) * 1000:>12.2f}"
+        )
@@ -0,0 +1,188 @@
+import glob
+import hashlib
+import json
+import os
+import sqlite3
+import time
+from typing import NamedTuple, Optional
+
+from ads.model import MonsterBlock, MonsterRecord
+from ads.model.records import to_monster_model, to_monster_record
+
+DEFAULT_CACHE_FILE_PATH = os.path.join(
+    os.path.expanduser("~"), ".cache", "ads", "monster-cache.sqlite3"
+)
+DEFAULT_CACHE_MAX_BYTES = 64 * 1024 * 1024
+
+ADS_PACKAGE_PATH = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+PARSER_SOURCE_FILE_PATTERNS = (
+    os.path.join(ADS_PACKAGE_PATH, "api", "*_parser.py"),
+    os.path.join(ADS_PACKAGE_PATH, "api", "string_format.py"),
+    os.path.join(ADS_PACKAGE_PATH, "model", "*.py"),
+)
+
+
+class MonsterCacheStatistics(NamedTuple):
+    cache_file_path: str
+    parser_version: str
+    entries: int
+    stale_entries: int
+    size_bytes: int
+    max_bytes: int
+
+
+def get_parser_version() -> str:
+    """Fingerprint of the parser and model sources, so any change to them invalidates previously cached parses."""
+    fingerprint = hashlib.sha256()
+    for pattern in PARSER_SOURCE_FILE_PATTERNS:
+        for source_file_path in sorted(glob.glob(pattern)):
+            fingerprint.update(os.path.basename(source_file_path).encode("utf-8"))
+            with open(source_file_path, "rb") as source_file:
+                fingerprint.update(source_file.read())
+    return fingerprint.hexdigest()[:16]
+
+
+def get_block_key(monster_block: MonsterBlock, engine_name: str) -> str:
+    # The header line determines name/level/type/role and the block lines everything else; lines are joined
+    # with a separator so that different line splits can't collide.  The engine name leads, so the regex and
+    # grammar parses of a block are cached apart.
+    block_text = "\n".join(
+        [
+            engine_name,
+            monster_block["header"]["header_source_line"],
+            *monster_block["source_lines"],
+        ]
+    )
+    return hashlib.sha256(block_text.encode("utf-8")).hexdigest()
+
+
+class MonsterCache:
+    """
+    On-disk cache of parsed monster models keyed by (parser version, parser engine and block text), shared across
+    runs and books.  Least recently used entries are evicted once the serialized models exceed `max_bytes`.
+    """
+
+    def __init__(
+        self,
+        cache_file_path: str = DEFAULT_CACHE_FILE_PATH,
+        max_bytes: int = DEFAULT_CACHE_MAX_BYTES,
+        parser_version: Optional[str] = None,
+    ) -> None:
+        cache_folder_path = os.path.dirname(cache_file_path)
+        if cache_folder_path:
+            os.makedirs(cache_folder_path, exist_ok=True)
+        self.cache_file_path = cache_file_path
+        self.max_bytes = max_bytes
+        self.parser_version = parser_version or get_parser_version()
+        self.hits = 0
+        self.misses = 0
+        self.connection = sqlite3.connect(cache_file_path)
+        self.connection.execute("PRAGMA journal_mode=WAL")
+        self.connection.execute(
+            """
+            CREATE TABLE IF NOT EXISTS monsters (
+                parser_version TEXT NOT NULL,
+                block_key TEXT NOT NULL,
+                monster TEXT NOT NULL,
+                size INTEGER NOT NULL,
+                last_used REAL NOT NULL,
+                PRIMARY KEY (parser_version, block_key)
+            )
+            """
+        )
+        self.connection.execute(
+            "CREATE INDEX IF NOT EXISTS monsters_last_used ON monsters (last_used)"
+        )
+        self.size_bytes: int = self.connection.execute(
+            "SELECT COALESCE(SUM(size), 0) FROM monsters"
+        ).fetchone()[0]
+
+    def __enter__(self) -> "MonsterCache":
+        return self
+
+    def __exit__(self, *_: object) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self.connection.commit()
+        self.connection.close()
+
+    def get(
+        self, monster_block: MonsterBlock, engine_name: str
+    ) -> Optional[MonsterRecord]:
+        key = (self.parser_version, get_block_key(monster_block, engine_name))
+        row = self.connection.execute(
+            "SELECT monster FROM monsters WHERE parser_version = ? AND block_key = ?",
+            key,
+        ).fetchone()
+        if row is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self.connection.execute(
+            "UPDATE monsters SET last_used = ? WHERE parser_version = ? AND block_key = ?",
+            (time.time(), *key),
+        )
+        return to_monster_record(json.loads(row[0]))
+
+    def put(
+        self, monster_block: MonsterBlock, monster: MonsterRecord, engine_name: str
+    ) -> None:
+        key = (self.parser_version, get_block_key(monster_block, engine_name))
+        # Records are stored as the JSON of their TypedDict shape.
+        serialized_monster = json.dumps(
+            to_monster_model(monster), separators=(",", ":")
+        )
+        size = len(serialized_monster)
+        previous = self.connection.execute(
+            "SELECT size FROM monsters WHERE parser_version = ? AND block_key = ?", key
+        ).fetchone()
+        self.connection.execute(
+            "INSERT OR REPLACE INTO monsters VALUES (?, ?, ?, ?, ?)",
+            (*key, serialized_monster, size, time.time()),
+        )
+        self.size_bytes += size - (previous[0] if previous else 0)
+        if self.size_bytes > self.max_bytes:
+            self.evict()
+
+    def evict(self) -> None:
+        # Walk entries from least to most recently used until enough of them have been dropped.
+        evicted_rowids: list[int] = []
+        for rowid, size in self.connection.execute(
+            "SELECT rowid, size FROM monsters ORDER BY last_used"
+        ).fetchall():
+            if self.size_bytes <= self.max_bytes:
+                break
+            evicted_rowids.append(rowid)
+            self.size_bytes -= size
+        self.connection.executemany(
+            "DELETE FROM monsters WHERE rowid = ?", [(r,) for r in evicted_rowids]
+        )
+
+    def clear(self, stale_only: bool = False) -> int:
+        if stale_only:
+            cursor = self.connection.execute(
+                "DELETE FROM monsters WHERE parser_version != ?", (self.parser_version,)
+            )
+        else:
+            cursor = self.connection.execute("DELETE FROM monsters")
+        self.connection.commit()
+        self.connection.execute("VACUUM")
+        self.size_bytes = self.connection.execute(
+            "SELECT COALESCE(SUM(size), 0) FROM monsters"
+        ).fetchone()[0]
+        return cursor.rowcount
+
+    def get_statistics(self) -> MonsterCacheStatistics:
+        entries, stale_entries = self.connection.execute(
+            "SELECT COUNT(*), COALESCE(SUM(parser_version != ?), 0) FROM monsters",
+            (self.parser_version,),
+        ).fetchone()
+        return MonsterCacheStatistics(
+            cache_file_path=self.cache_file_path,
+            parser_version=self.parser_version,
+            entries=entries,
+            stale_entries=stale_entries,
+            size_bytes=self.size_bytes,
+            max_bytes=self.max_bytes,
+        )
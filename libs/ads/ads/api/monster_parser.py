@@ -1,27 +1,48 @@
+import os
 import re
 import unicodedata
-from typing import Any, Dict, List, Optional, Pattern, Tuple
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Pattern,
+    Tuple,
+    TypeVar,
+)
 
 import yaml
 
 from ads.api.ability_and_trait_parser import (
     get_foundry_item_model,
+    get_foundry_value,
     parse_ability_block,
     split_ability_blocks,
 )
 from ads.api.foundry import generate_id
+from ads.api.monster_cache import MonsterCache
+from ads.api.parse_cache import print_parse_cache_statistics
 from ads.api.power_roll_parser import DAMAGE_TYPES
 from ads.api.string_format import sanitize_name, title_case
 from ads.model import (
     AppliedCaptainEffects,
-    Characteristics,
+    CharacteristicsRecord,
     DerivedCaptainBonuses,
     ImmunityOrWeakness,
     Monster,
     MonsterBlock,
     MonsterHeader,
+    MonsterRecord,
 )
 
+PARSER_ENGINE_NAMES = ("regex", "grammar")
+DEFAULT_PARSER_ENGINE_NAME = "regex"
+# Monsters are deduplicated as the records the parsers build, or as the TypedDict models read back from them.
+DeduplicatedMonster = TypeVar("DeduplicatedMonster", MonsterRecord, Monster)
+
 # --- Markers and Patterns ---
 PAGE_LEFT_MARKER = re.compile(r"--- Page \d+ left ---", re.IGNORECASE)
 PAGE_RIGHT_MARKER = re.compile(r"--- Page \d+ right ---", re.IGNORECASE)
@@ -161,6 +182,23 @@ def normalize_keywords(keywords: List[str]) -> List[str]:
     return fixed
 
 
+def filter_keyword_candidates(candidates: list[str]) -> list[str]:
+    # Normalize and filter against whitelist
+    normalized: list[str] = []
+    for c in candidates:
+        tc = title_case(sanitize_name(c))
+        if tc in MONSTER_KEYWORD_WHITELIST:
+            normalized.append(tc)
+        # Handle "Human Rival" as special case
+        elif tc.lower() == "human rival":
+            normalized.extend(["Human", "Rival"])
+        elif tc.lower() == "angutotl":
+            normalized.append("Angulotl")
+        else:
+            print(f"UNKNOWN KEYWORD: {tc}")
+    return normalized
+
+
 def parse_keywords_and_ev(lines: list[str]) -> tuple[list[str], int]:
     """
     Extracts keywords (from before 'EV') and encounter value ('EV <number>').
@@ -174,20 +212,7 @@ def parse_keywords_and_ev(lines: list[str]) -> tuple[list[str], int]:
             left = line.split(m.group(0), 1)[0]
             # Split keywords by comma or just by space if only one
             candidates = [k.strip() for k in re.split(r"[,/]", left) if k.strip()]
-            # Normalize and filter against whitelist
-            normalized: list[str] = []
-            for c in candidates:
-                tc = title_case(sanitize_name(c))
-                if tc in MONSTER_KEYWORD_WHITELIST:
-                    normalized.append(tc)
-                # Handle "Human Rival" as special case
-                elif tc.lower() == "human rival":
-                    normalized.extend(["Human", "Rival"])
-                elif tc.lower() == "angutotl":
-                    normalized.append("Angulotl")
-                else:
-                    print(f"UNKNOWN KEYWORD: {tc}")
-            return normalized, encounter_value
+            return filter_keyword_candidates(candidates), encounter_value
     # Fallback: if not found
     raise ValueError(
         "Encounter Value (EV) not found in the provided lines. "
@@ -238,22 +263,27 @@ def get_header_regex() -> Pattern[str]:
     type_join = "|".join(MONSTER_TYPE_WHITELIST)
     role_join = "|".join(MONSTER_ROLE_WHITELIST)
     level_variants = r"(LEVEL|LEVE1|LEVEI|LEVET|LEVELT|LEvEL|LeveL|Levet|Leve1|LeveI)"
-    # Accept nearly anything for name, until we hit LEVEL variant (non-greedy)
+    # Accept nearly anything for name, until we hit LEVEL variant (non-greedy).  The name ends on a word character
+    # and the junk runs are possessive, so a line that isn't a header is rejected in linear time instead of
+    # retrying every split of its punctuation between the name and the junk around it.
     header_pattern = (
-        r"^\W*"  # Leading junk/punct
-        r"(?P<name>.+?)"  # Name, as loose as possible
-        r"\W*"
+        r"^\W*+"  # Leading junk/punct
+        r"(?P<name>.*?\w)"  # Name, as loose as possible
+        r"\W*+"
         r"{lvl}"  # LEVEL (or variant)
-        r"\W*"
-        r"(?P<level>\d+)"  # The number
-        r"\W*"
+        r"\W*+"
+        r"(?P<level>\d++)"  # The number
+        r"\W*+"
         r"(?P<type>{type})"  # Type, required
-        r"(?:\W*(?P<role>{role}))?"  # Optional role
-        r"\W*[_l]?\W*$"  # Allow trailing "_", "l", or other junk
+        r"(?:\W*+(?P<role>{role}))?"  # Optional role
+        r"\W*+(?:[_l]\W*+)?$"  # Allow trailing "_", "l", or other junk
     ).format(lvl=level_variants, type=type_join, role=role_join)
     return re.compile(header_pattern, re.IGNORECASE)
 
 
+HEADER_REGEX = get_header_regex()
+
+
 def fix_ocr_name(name: str) -> str:
     # Fix known common OCR errors, expand as needed
     fixes = {
@@ -271,20 +301,24 @@ def fix_ocr_name(name: str) -> str:
 # --- Candidate Line Finding ---
 
 
+def is_header_candidate(normalized_line: str) -> bool:
+    # Must contain an OCR'd LEVEL, a known type, and a number close to LEVEL (avoid prose)
+    return bool(
+        re.search(r"L[EV1I]{2,4}", normalized_line, re.IGNORECASE)
+        and re.search(r"\d", normalized_line)
+        and any(
+            t in normalized_line.upper()
+            for t in [t.upper() for t in MONSTER_TYPE_WHITELIST]
+        )
+        and not re.search(r"malice", normalized_line, re.IGNORECASE)
+    )
+
+
 def get_header_candidates(lines: List[str]) -> List[Tuple[int, str]]:
     candidates: List[Tuple[int, str]] = []
     for line_index, line in enumerate(lines):
         normalized_line = normalize_string(line)
-        # Must contain an OCR'd LEVEL, a known type, and a number close to LEVEL (avoid prose)
-        if (
-            re.search(r"L[EV1I]{2,4}", normalized_line, re.IGNORECASE)
-            and re.search(r"\d", normalized_line)
-            and any(
-                t in normalized_line.upper()
-                for t in [t.upper() for t in MONSTER_TYPE_WHITELIST]
-            )
-            and not re.search(r"malice", normalized_line, re.IGNORECASE)
-        ):
+        if is_header_candidate(normalized_line):
             candidates.append((line_index, normalized_line))
     return candidates
 
@@ -293,11 +327,13 @@ def get_header_candidates(lines: List[str]) -> List[Tuple[int, str]]:
 
 
 def parse_header_line(source_line: str) -> Optional[Dict[str, Any]]:
-    header_regex = get_header_regex()
-    header_matches = header_regex.search(source_line)
+    header_matches = HEADER_REGEX.match(source_line)
     if not header_matches:
         return None
-    header_group_matches = header_matches.groupdict()
+    return get_header_fields(header_matches.groupdict())
+
+
+def get_header_fields(header_group_matches: Dict[str, Any]) -> Dict[str, Any]:
     name = fix_ocr_name(header_group_matches.get("name", "").strip(" |:-"))
     type = header_group_matches.get("type")
     role = header_group_matches.get("role")
@@ -313,34 +349,53 @@ def parse_header_line(source_line: str) -> Optional[Dict[str, Any]]:
 # --- Main Header Detection Function ---
 
 
+def get_monster_header_from_candidate(
+    source_line_index: int, source_line: str
+) -> Optional[MonsterHeader]:
+    parsed_line = parse_header_line(source_line)
+    if not (
+        parsed_line
+        and parsed_line["name"]
+        and parsed_line["type"]
+        and parsed_line["level"] is not None
+    ):
+        return None
+    return normalize_header_fields(
+        MonsterHeader(
+            name=parsed_line["name"],
+            level=parsed_line["level"],
+            type=str(parsed_line["type"]).capitalize(),
+            role=str(
+                (parsed_line["role"]).capitalize() if parsed_line["role"] else None
+            ),
+            header_source_line=source_line,
+            start_line_index=source_line_index,
+            end_line_index=source_line_index,  # may be adjusted for multi-line headers in future
+        )
+    )
+
+
+def get_monster_header(
+    source_line_index: int, source_line: str
+) -> Optional[MonsterHeader]:
+    normalized_line = normalize_string(source_line)
+    if not is_header_candidate(normalized_line):
+        return None
+    return get_monster_header_from_candidate(source_line_index, normalized_line)
+
+
 def get_monster_headers_from_source_lines(
     source_lines: List[str],
 ) -> List[MonsterHeader]:
     monster_headers: List[MonsterHeader] = []
     monster_header_candidates = get_header_candidates(source_lines)
     for source_line_index, source_line in monster_header_candidates:
-        parsed_line = parse_header_line(source_line)
-        if (
-            parsed_line
-            and parsed_line["name"]
-            and parsed_line["type"]
-            and parsed_line["level"] is not None
-        ):
-            monster_header = MonsterHeader(
-                name=parsed_line["name"],
-                level=parsed_line["level"],
-                type=str(parsed_line["type"]).capitalize(),
-                role=str(
-                    (parsed_line["role"]).capitalize() if parsed_line["role"] else None
-                ),
-                header_source_line=source_line,
-                start_line_index=source_line_index,
-                end_line_index=source_line_index,  # may be adjusted for multi-line headers in future
-            )
+        monster_header = get_monster_header_from_candidate(
+            source_line_index, source_line
+        )
+        if monster_header:
             monster_headers.append(monster_header)
 
-    monster_headers = [normalize_header_fields(h) for h in monster_headers]
-
     return monster_headers
 
 
@@ -409,7 +464,7 @@ def parse_free_strike(source_lines: List[str]) -> int:
     raise ValueError(f"Free Strike not found in the provided lines: {source_lines}")
 
 
-def parse_characteristics(source_line: str) -> Characteristics | None:
+def parse_characteristics(source_line: str) -> CharacteristicsRecord | None:
     normalized = (
         re.sub(
             "(?: [0Oo]+|[0Oo]+ |[0Oo]+$)",
@@ -432,14 +487,12 @@ def parse_characteristics(source_line: str) -> Characteristics | None:
     match = pattern.match(normalized)
     if match:
         characteristics = match.groupdict()
-        return Characteristics(
-            {
-                "might": int(characteristics["might"].replace("O", "0")),
-                "agility": int(characteristics["agility"].replace("O", "0")),
-                "reason": int(characteristics["reason"].replace("O", "0")),
-                "intuition": int(characteristics["intuition"].replace("O", "0")),
-                "presence": int(characteristics["presence"].replace("O", "0")),
-            }
+        return CharacteristicsRecord(
+            might=int(characteristics["might"].replace("O", "0")),
+            agility=int(characteristics["agility"].replace("O", "0")),
+            reason=int(characteristics["reason"].replace("O", "0")),
+            intuition=int(characteristics["intuition"].replace("O", "0")),
+            presence=int(characteristics["presence"].replace("O", "0")),
         )
 
     return None
@@ -491,7 +544,7 @@ def parse_with_captain(
 
 def get_characteristics_and_line_index(
     source_lines: list[str],
-) -> tuple[Characteristics, int]:
+) -> tuple[CharacteristicsRecord, int]:
     for source_line_index, source_line in enumerate(source_lines):
         characteristics = parse_characteristics(source_line)
         if characteristics:
@@ -567,56 +620,49 @@ def parse_immunity_and_weakness(
     return (weakness or None, immunity or None)
 
 
-def get_monster_model_from_block(monster_block: MonsterBlock) -> Monster:
+def get_monster_model_from_block(monster_block: MonsterBlock) -> MonsterRecord:
     source_lines = monster_block["source_lines"]
     monster_header = monster_block["header"]
     characteristics, characteristics_line_index = get_characteristics_and_line_index(
         source_lines
     )
 
-    monster_model: Monster = {
-        "name": monster_header["name"],
-        "level": monster_header["level"],
-        "type": monster_header["type"],
-        "role": monster_header.get("role", None),
-        "header_text": monster_header["header_source_line"],
-        "keywords": [],
-        "encounterValue": 0,
-        "stamina": 0,
-        "speed": 0,
-        "movementTypes": [],
-        "size": "",
-        "stability": 0,
-        "freeStrikeDamage": parse_free_strike(source_lines),
-        "characteristics": characteristics,
-        "weakness": None,
-        "immunity": None,
-        "derivedCaptainBonuses": None,
-        "appliedCaptainEffects": None,
-        "abilities": [],
-        "traits": [],
-    }
-
-    monster_model["keywords"], monster_model["encounterValue"] = (
-        parse_keywords_and_ev_row(source_lines)
-    )
-    monster_model["stamina"] = parse_stamina(source_lines)
-    monster_model["speed"], monster_model["movementTypes"] = (
-        parse_speed_and_movement_types(source_lines)
-    )
-    monster_model["size"], monster_model["stability"] = parse_size_and_stability(
-        source_lines
+    free_strike_damage = parse_free_strike(source_lines)
+    keywords, encounter_value = parse_keywords_and_ev_row(source_lines)
+    stamina = parse_stamina(source_lines)
+    speed, movement_types = parse_speed_and_movement_types(source_lines)
+    size, stability = parse_size_and_stability(source_lines)
+    monster_model = MonsterRecord(
+        name=monster_header["name"],
+        level=monster_header["level"],
+        type=monster_header["type"],
+        role=monster_header.get("role", None),
+        header_text=monster_header["header_source_line"],
+        keywords=keywords,
+        encounterValue=encounter_value,
+        stamina=stamina,
+        speed=speed,
+        movementTypes=movement_types,
+        size=size,
+        stability=stability,
+        freeStrikeDamage=free_strike_damage,
+        characteristics=characteristics,
+        weakness=None,
+        immunity=None,
+        derivedCaptainBonuses=None,
+        appliedCaptainEffects=None,
+        abilities=[],
     )
 
     # Optional fields:
-    monster_model["weakness"], monster_model["immunity"] = parse_immunity_and_weakness(
+    monster_model.weakness, monster_model.immunity = parse_immunity_and_weakness(
         source_lines, characteristics_line_index
     )
     if monster_header["type"].lower() == "minion":
         captain_result = parse_with_captain(source_lines, characteristics_line_index)
         if captain_result:
-            monster_model["appliedCaptainEffects"] = captain_result[0]
-            monster_model["derivedCaptainBonuses"] = captain_result[1]
+            monster_model.appliedCaptainEffects = captain_result[0]
+            monster_model.derivedCaptainBonuses = captain_result[1]
 
     first_ability_source_lines = source_lines[characteristics_line_index + 1 :]
     ability_blocks = split_ability_blocks(first_ability_source_lines)
@@ -627,7 +673,7 @@ def get_monster_model_from_block(monster_block: MonsterBlock) -> Monster:
             )
             continue
         parsed_ability = parse_ability_block(ability_block, monster_header["name"])
-        monster_model["abilities"].append(parsed_ability)
+        monster_model.abilities.append(parsed_ability)
 
     return monster_model
 
@@ -671,38 +717,66 @@ def group_source_lines_into_monsters_blocks(
     return blocks
 
 
+def iter_monster_blocks(source_lines: Iterable[str]) -> Iterator[MonsterBlock]:
+    """
+    Streaming counterpart of `group_source_lines_into_monsters_blocks`: yields each block as soon as the line
+    that terminates it (next header, next left page marker or noise header) has been read.
+    """
+    header: Optional[MonsterHeader] = None
+    block_lines: List[str] = []
+    for source_line_index, source_line in enumerate(source_lines):
+        next_header = get_monster_header(source_line_index, source_line)
+        if next_header or (
+            header
+            and (PAGE_LEFT_MARKER.match(source_line) or is_noise_header(source_line))
+        ):
+            if header:
+                yield MonsterBlock(
+                    header=header,
+                    source_lines=block_lines,
+                    raw_text="".join(block_lines),
+                )
+            header = next_header
+            block_lines = []
+        elif header and not (
+            FOOTER_RE.search(source_line) or PAGE_MARKER.match(source_line)
+        ):
+            block_lines.append(source_line)
+    if header:
+        yield MonsterBlock(
+            header=header, source_lines=block_lines, raw_text="".join(block_lines)
+        )
+
+
 def get_monster_foundry_actor_model(
-    monster_model: Monster,
+    monster_model: MonsterRecord,
 ) -> dict[str, Any]:
     # Prepare fields
-    is_minion = monster_model["type"].lower() == "minion"
+    is_minion = monster_model.type.lower() == "minion"
     actor_id = generate_id()
     width = 1
     try:
         # Handle sizes like "1S", "2", "3" (token width/height)
-        if (
-            str(monster_model.get("size", "")).startswith("1")
-            or str(monster_model.get("size", "")).isdigit()
-        ):
-            width = int(str(monster_model["size"])[0])
+        if str(monster_model.size).startswith("1") or str(monster_model.size).isdigit():
+            width = int(str(monster_model.size)[0])
     except Exception:
         width = 1
 
-    if monster_model["size"].endswith("S") or monster_model["size"].endswith("T"):
+    if monster_model.size.endswith("S") or monster_model.size.endswith("T"):
         ring_scale = 1.1
     else:
         ring_scale = 0.9
 
-    monster_image_path = f"systems/aeon-draw-steel/images/monsters/{monster_model['name'].replace(' ', '-').lower()}-01.webp"
+    monster_image_path = f"systems/aeon-draw-steel/images/monsters/{monster_model.name.replace(' ', '-').lower()}-01.webp"
 
     monster_foundry_actor_model: dict[str, Any] = {
         "_id": actor_id,
         "_key": f"!actors!{actor_id}",
-        "name": monster_model["name"],
+        "name": monster_model.name,
         "type": "minion" if is_minion else "enemy",
         "img": monster_image_path,
         "prototypeToken": {
-            "name": monster_model["name"],
+            "name": monster_model.name,
             "displayName": 50,
             "displayBars": 50,
             "bar1": {"attribute": "stamina"},
@@ -722,37 +796,37 @@ def get_monster_foundry_actor_model(
             },
         },
         "system": {
-            "name": monster_model["name"],
-            "keywords": monster_model.get("keywords", []),
-            "level": monster_model["level"],
-            "type": monster_model["type"].title(),
-            "role": monster_model.get("role") or "",
-            "encounterValue": monster_model.get("encounterValue", 0),
-            "characteristics": monster_model.get("characteristics", {}),
+            "name": monster_model.name,
+            "keywords": monster_model.keywords,
+            "level": monster_model.level,
+            "type": monster_model.type.title(),
+            "role": monster_model.role or "",
+            "encounterValue": monster_model.encounterValue,
+            "characteristics": get_foundry_value(monster_model.characteristics),
             "stamina": (
                 {
-                    "max": monster_model["stamina"],
-                    "perMinion": monster_model["stamina"],
-                    "value": monster_model["stamina"],
+                    "max": monster_model.stamina,
+                    "perMinion": monster_model.stamina,
+                    "value": monster_model.stamina,
                 }
                 if is_minion
                 else {
-                    "max": monster_model["stamina"],
-                    "value": monster_model["stamina"],
+                    "max": monster_model.stamina,
+                    "value": monster_model.stamina,
                 }
             ),
             "combat": {
-                "size": monster_model.get("size"),
-                "speed": monster_model.get("speed"),
-                "movementTypes": monster_model.get("movementTypes", []),
-                "stability": monster_model.get("stability"),
-                "freeStrikeDamage": monster_model.get("freeStrikeDamage"),
+                "size": monster_model.size,
+                "speed": monster_model.speed,
+                "movementTypes": monster_model.movementTypes,
+                "stability": monster_model.stability,
+                "freeStrikeDamage": monster_model.freeStrikeDamage,
             },
         },
         "items": [],
     }
 
-    for ability in monster_model.get("abilities", []):
+    for ability in monster_model.abilities:
         monster_foundry_actor_model["items"].append(
             get_foundry_item_model(actor_id, ability)
         )
@@ -764,21 +838,69 @@ def get_monster_foundry_actor_model(
         "derivedCaptainBonuses",
         "appliedCaptainEffects",
     ):
-        field_value = monster_model.get(field_name, None)
+        field_value = getattr(monster_model, field_name)
         if field_value:
             monster_foundry_actor_model["system"][field_name] = field_value
 
     return monster_foundry_actor_model
 
 
-def export_yaml(monster_foundry_actor_models: list[dict[str, Any]]):
+def get_monster_model_builder(
+    engine_name: str = DEFAULT_PARSER_ENGINE_NAME,
+) -> Callable[[MonsterBlock], MonsterRecord]:
+    if engine_name == "regex":
+        return get_monster_model_from_block
+    if engine_name == "grammar":
+        # Lark is an optional extra, and the grammar engine builds on this module, so it is only imported when needed.
+        from ads.api.grammar_parser import get_monster_model_from_block_with_grammar
+
+        return get_monster_model_from_block_with_grammar
+    raise ValueError(
+        f"Unknown parser engine [{engine_name}]; expected one of {PARSER_ENGINE_NAMES}."
+    )
+
+
+def iter_monster_models(
+    monster_blocks: Iterable[MonsterBlock],
+    monster_cache: Optional[MonsterCache] = None,
+    engine_name: str = DEFAULT_PARSER_ENGINE_NAME,
+) -> Iterator[MonsterRecord]:
+    get_monster_model = get_monster_model_builder(engine_name)
+    for monster_block in monster_blocks:
+        monster_model = (
+            monster_cache.get(monster_block, engine_name) if monster_cache else None
+        )
+        if monster_model is None:
+            monster_model = get_monster_model(monster_block)
+            if monster_cache:
+                monster_cache.put(monster_block, monster_model, engine_name)
+        yield monster_model
+
+
+def iter_collected_monsters(
+    monster_models: Iterable[MonsterRecord], collected_monsters: list[MonsterRecord]
+) -> Iterator[MonsterRecord]:
+    for monster_model in monster_models:
+        collected_monsters.append(monster_model)
+        yield monster_model
+
+
+def iter_monster_foundry_actor_models(
+    monster_models: Iterable[MonsterRecord],
+) -> Iterator[dict[str, Any]]:
+    for monster_model in monster_models:
+        yield get_monster_foundry_actor_model(monster_model)
+
+
+def export_yaml(
+    monster_foundry_actor_models: Iterable[dict[str, Any]], yaml_folder_path: str
+) -> int:
+    exported_count = 0
     for monster_foundry_actor_model in monster_foundry_actor_models:
         file_name = (
             f"{str(monster_foundry_actor_model['name']).replace(' ', '-').lower()}.yml"
         )
-        file_path = (
-            f"c:/_/aeon/fvtt-system-draw-steel/packs/_source/monsters/{file_name}"
-        )
+        file_path = os.path.join(yaml_folder_path, file_name)
         with open(file_path, "w", encoding="utf-8") as file:
             yaml.safe_dump(
                 monster_foundry_actor_model,
@@ -787,67 +909,80 @@ def export_yaml(monster_foundry_actor_models: list[dict[str, Any]]):
                 allow_unicode=True,
                 default_flow_style=False,
             )
+        exported_count += 1
+    return exported_count
 
 
-def deduplicate_monsters(monster_foundry_actor_models: list[dict[str, Any]]):
+def deduplicate_monsters(
+    monster_models: Iterable[DeduplicatedMonster],
+) -> Iterator[DeduplicatedMonster]:
+    # Only the names are retained, so memory stays flat no matter how many monsters stream through.
     seen_monster_names = set[str]()
-    unique_monster_models: list[dict[str, Any]] = []
-    for monster_model in monster_foundry_actor_models:
-        monster_name = str(monster_model["name"]).lower()
+    for monster_model in monster_models:
+        monster_name = (
+            monster_model.name
+            if isinstance(monster_model, MonsterRecord)
+            else monster_model["name"]
+        ).lower()
         if monster_name not in seen_monster_names:
             seen_monster_names.add(monster_name)
-            unique_monster_models.append(monster_model)
+            yield monster_model
         # else:
         #     print(f"Duplicate found, dropping: [{monster_name}]")
-    return unique_monster_models
 
 
-# --- Example Usage ---
+def sanitize_source_line(source_line: str) -> str:
+    sanitized_line = (
+        source_line.replace("’", "'")
+        .replace("‘", "'")
+        .replace("“", '"')
+        .replace("”", '"')
+    )
+    sanitized_line = re.sub(r"[^A-Za-z0-9/'\"\[\]()<!?.,; +-]", " ", sanitized_line)
+    sanitized_line = re.sub("minton", "minion", sanitized_line, flags=re.IGNORECASE)
+    sanitized_line = re.sub(r"\s+", " ", sanitized_line)
+    return sanitized_line.strip()
 
 
-def export_monsters(ocr_file_path: str, yaml_folder_path: str) -> None:
-    with open(
-        ocr_file_path,
-        encoding="utf-8",
-    ) as source_file:
-        source_lines = source_file.readlines()
+def read_source_lines(ocr_file_path: str) -> Iterator[str]:
+    with open(ocr_file_path, encoding="utf-8") as source_file:
+        for source_line in source_file:
+            yield sanitize_source_line(source_line)
 
-    pre_sanitized_source_lines: list[str] = []
-    for line in source_lines:
-        pre_sanitized_line = (
-            line.replace("’", "'").replace("‘", "'").replace("“", '"').replace("”", '"')
-        )
-        pre_sanitized_line = re.sub(
-            r"[^A-Za-z0-9/'\"\[\]()<!?.,; +-]", " ", pre_sanitized_line
-        )
-        pre_sanitized_line = re.sub(
-            "minton", "minion", pre_sanitized_line, 0, re.IGNORECASE
-        )
-        pre_sanitized_line = re.sub(r"\s+", " ", pre_sanitized_line)
-        pre_sanitized_source_lines.append(pre_sanitized_line.strip())
-
-    # for trait_name in TRAIT_NAMES:
-    #     print(f"[{trait_name}]")
-    #     for line in pre_sanitized_source_lines:
-    #         if re.match(rf"{trait_name}", line, re.IGNORECASE):
-    #             print(f"  - {line.strip()}")
-    # return
-
-    monster_headers = get_monster_headers_from_source_lines(pre_sanitized_source_lines)
-    monster_blocks = group_source_lines_into_monsters_blocks(
-        pre_sanitized_source_lines, monster_headers
-    )
 
-    monster_foundry_actor_models: list[dict[str, Any]] = []
-    for monster_block in monster_blocks:
-        # if monster_block["header"]["name"] in [
-        #     #     # "Mystic Queen Bargnot",
-        #     # "Dwarf Trapper",
-        #     # "Werewolf",
-        #     "Goblin Spinecleaver",
-        # ]:
-        monster_model = get_monster_model_from_block(monster_block)
-        monster_foundry_actor_model = get_monster_foundry_actor_model(monster_model)
-        monster_foundry_actor_models.append(monster_foundry_actor_model)
-
-    export_yaml(deduplicate_monsters(monster_foundry_actor_models))
+# --- Example Usage ---
+
+
+def export_monsters(
+    ocr_file_path: str,
+    yaml_folder_path: str,
+    monster_cache: Optional[MonsterCache] = None,
+    correct_prose: Optional[Callable[[MonsterRecord], MonsterRecord]] = None,
+    engine_name: str = DEFAULT_PARSER_ENGINE_NAME,
+    exported_monsters: Optional[list[MonsterRecord]] = None,
+) -> None:
+    # Each stage is a generator, so a monster travels from the OCR file to its YAML file before the next one
+    # is read: source -> blocks -> models -> actors -> sink.  Prose is corrected after the monster cache, so a
+    # retrained correction model doesn't invalidate cached parses.  Models are only retained when the caller
+    # passes `exported_monsters` to collect them into.
+    source_lines = read_source_lines(ocr_file_path)
+    monster_blocks = iter_monster_blocks(source_lines)
+    monster_models = iter_monster_models(monster_blocks, monster_cache, engine_name)
+    if correct_prose:
+        monster_models = map(correct_prose, monster_models)
+    # Actors are named after their monster, so deduplicating the models drops the same monsters.
+    monster_models = deduplicate_monsters(monster_models)
+    if exported_monsters is not None:
+        monster_models = iter_collected_monsters(monster_models, exported_monsters)
+    monster_foundry_actor_models = iter_monster_foundry_actor_models(monster_models)
+
+    os.makedirs(yaml_folder_path, exist_ok=True)
+    exported_count = export_yaml(monster_foundry_actor_models, yaml_folder_path)
+    print(f"Exported {exported_count} monsters to [{yaml_folder_path}].")
+    print("Parse cache:")
+    print_parse_cache_statistics()
+    if monster_cache:
+        print(
+            f"  - monster cache: {monster_cache.hits} hits / {monster_cache.misses} misses "
+            f"[{monster_cache.cache_file_path}]"
+        )
@@ -0,0 +1,202 @@
+import time
+from typing import NamedTuple, Optional, Protocol
+
+import numpy as np
+import pytesseract
+
+try:
+    import tesserocr
+except ImportError:  # tesserocr is an optional extra; pytesseract remains the fallback.
+    tesserocr = None
+
+OCR_BACKEND_NAMES = ("tesserocr", "pytesseract")
+DEFAULT_OCR_LANGUAGE = "eng"
+DEFAULT_PAGE_SEGMENTATION_MODE = 1
+# Not a real OCR engine, so it isn't one of OCR_BACKEND_NAMES; see StubOcrBackend.
+STUB_OCR_BACKEND_NAME = "stub"
+STUB_OCR_SECONDS = 0.4
+
+
+class OcrResult(NamedTuple):
+    text: str
+    # Tesseract's 0-100 confidence for each recognized word.
+    word_confidences: list[float]
+
+
+def get_mean_confidence(ocr_result: OcrResult) -> Optional[float]:
+    if not ocr_result.word_confidences:
+        return None
+    return sum(ocr_result.word_confidences) / len(ocr_result.word_confidences)
+
+
+class OcrBackend(Protocol):
+    name: str
+
+    def image_to_string(self, image: np.ndarray) -> str: ...
+
+    def image_to_data(self, image: np.ndarray) -> OcrResult: ...
+
+    def close(self) -> None: ...
+
+
+class PytesseractBackend:
+    """Runs the `tesseract` executable once per image, round-tripping the image through a temp file."""
+
+    name = "pytesseract"
+
+    def __init__(
+        self,
+        language: str = DEFAULT_OCR_LANGUAGE,
+        page_segmentation_mode: int = DEFAULT_PAGE_SEGMENTATION_MODE,
+        user_words_file_path: Optional[str] = None,
+        user_patterns_file_path: Optional[str] = None,
+    ) -> None:
+        try:
+            pytesseract.get_tesseract_version()
+        except pytesseract.TesseractNotFoundError as error:
+            raise ValueError(
+                "The pytesseract OCR backend requires the 'tesseract' executable on the PATH."
+            ) from error
+        self.language = language
+        self.config = f"--psm {page_segmentation_mode}"
+        if user_words_file_path:
+            self.config += f' --user-words "{user_words_file_path}"'
+        if user_patterns_file_path:
+            self.config += f' --user-patterns "{user_patterns_file_path}"'
+
+    def image_to_string(self, image: np.ndarray) -> str:
+        return pytesseract.image_to_string(
+            image, lang=self.language, config=self.config
+        )
+
+    def image_to_data(self, image: np.ndarray) -> OcrResult:
+        data = pytesseract.image_to_data(
+            image,
+            lang=self.language,
+            config=self.config,
+            output_type=pytesseract.Output.DICT,
+        )
+        # image_to_data returns words only.  The text is rebuilt the way Tesseract's text renderer writes it for
+        # image_to_string (and tesserocr's GetUTF8Text): the words of a line joined by single spaces, every line
+        # ended by a newline and every paragraph by an empty line, so both backends read a region the same way.
+        paragraphs: dict[tuple[int, int], dict[int, list[str]]] = {}
+        word_confidences: list[float] = []
+        for word, confidence, block_num, par_num, line_num in zip(
+            data["text"],
+            data["conf"],
+            data["block_num"],
+            data["par_num"],
+            data["line_num"],
+        ):
+            if float(confidence) < 0 or not word.strip():
+                continue
+            paragraphs.setdefault((block_num, par_num), {}).setdefault(
+                line_num, []
+            ).append(word)
+            word_confidences.append(float(confidence))
+        text = "".join(
+            "".join(f"{' '.join(words)}\n" for words in lines.values()) + "\n"
+            for lines in paragraphs.values()
+        )
+        return OcrResult(text, word_confidences)
+
+    def close(self) -> None:
+        pass
+
+
+class TesserocrBackend:
+    """
+    Keeps one Tesseract engine (and its loaded language model) alive for the lifetime of the backend and hands
+    it the raw 8-bit grayscale buffer; no process launch, no image encoding and no temp files per call.
+    """
+
+    name = "tesserocr"
+
+    def __init__(
+        self,
+        language: str = DEFAULT_OCR_LANGUAGE,
+        page_segmentation_mode: int = DEFAULT_PAGE_SEGMENTATION_MODE,
+        user_words_file_path: Optional[str] = None,
+        user_patterns_file_path: Optional[str] = None,
+    ) -> None:
+        if tesserocr is None:
+            raise ValueError(
+                "The tesserocr OCR backend requires the 'tesserocr' package; install it or use the pytesseract backend."
+            )
+        # The vocabulary files are init-only parameters; they can't be set on an engine that is already loaded.
+        variables: dict[str, str] = {}
+        if user_words_file_path:
+            variables["user_words_file"] = user_words_file_path
+        if user_patterns_file_path:
+            variables["user_patterns_file"] = user_patterns_file_path
+        self.api = tesserocr.PyTessBaseAPI(
+            lang=language, psm=page_segmentation_mode, variables=variables
+        )
+
+    def image_to_string(self, image: np.ndarray) -> str:
+        height, width = image.shape
+        # tesserocr only accepts `bytes`; tobytes() packs a region view of a page buffer in the same single copy.
+        buffer = np.asarray(image, dtype=np.uint8)
+        self.api.SetImageBytes(buffer.tobytes(), width, height, 1, width)
+        return self.api.GetUTF8Text()
+
+    def image_to_data(self, image: np.ndarray) -> OcrResult:
+        text = self.image_to_string(image)
+        # The confidences come from the recognition pass GetUTF8Text just ran; no second pass.
+        return OcrResult(text, [float(c) for c in self.api.AllWordConfidences()])
+
+    def close(self) -> None:
+        self.api.End()
+
+
+class StubOcrBackend:
+    """
+    Stands in for Tesseract where it isn't installed, e.g. in the OCR queue harness: every image takes
+    STUB_OCR_SECONDS and is read as one line naming its size, with full confidence.
+    """
+
+    name = STUB_OCR_BACKEND_NAME
+
+    def image_to_string(self, image: np.ndarray) -> str:
+        time.sleep(STUB_OCR_SECONDS)
+        height, width = image.shape
+        return f"Stub text of a {width}x{height} image.\n"
+
+    def image_to_data(self, image: np.ndarray) -> OcrResult:
+        return OcrResult(self.image_to_string(image), [100.0])
+
+    def close(self) -> None:
+        pass
+
+
+def get_default_ocr_backend_name() -> str:
+    return "tesserocr" if tesserocr is not None else "pytesseract"
+
+
+def create_ocr_backend(
+    backend_name: Optional[str] = None,
+    language: str = DEFAULT_OCR_LANGUAGE,
+    page_segmentation_mode: int = DEFAULT_PAGE_SEGMENTATION_MODE,
+    user_words_file_path: Optional[str] = None,
+    user_patterns_file_path: Optional[str] = None,
+) -> OcrBackend:
+    backend_name = backend_name or get_default_ocr_backend_name()
+    if backend_name == "tesserocr":
+        return TesserocrBackend(
+            language,
+            page_segmentation_mode,
+            user_words_file_path,
+            user_patterns_file_path,
+        )
+    if backend_name == "pytesseract":
+        return PytesseractBackend(
+            language,
+            page_segmentation_mode,
+            user_words_file_path,
+            user_patterns_file_path,
+        )
+    if backend_name == STUB_OCR_BACKEND_NAME:
+        return StubOcrBackend()
+    raise ValueError(
+        f"Unknown OCR backend [{backend_name}]; expected one of {OCR_BACKEND_NAMES}."
+    )
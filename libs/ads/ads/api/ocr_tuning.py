@@ -0,0 +1,279 @@
+import contextlib
+import hashlib
+import io
+import itertools
+import os
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import NamedTuple, Optional
+
+import numpy as np
+
+from ads.api.monster_parser import (
+    get_monster_model_from_block,
+    iter_monster_blocks,
+    sanitize_source_line,
+)
+from ads.api.ocr_backend import (
+    DEFAULT_PAGE_SEGMENTATION_MODE,
+    OcrBackend,
+    create_ocr_backend,
+    get_default_ocr_backend_name,
+)
+from ads.api.ocr_vocabulary import write_ocr_vocabulary_files
+from ads.api.page_layout import crop_region, get_column_regions, segment_page
+from ads.api.pdf_ocr import (
+    ADAPTIVE_THRESHOLD_BLOCK_SIZE,
+    ADAPTIVE_THRESHOLD_C,
+    COLUMN_LABELS,
+    DPI,
+    binarize,
+    format_page_text,
+    get_pdf_page_count,
+    rasterize_page,
+)
+
+DEFAULT_RASTER_CACHE_FOLDER_PATH = os.path.join(
+    os.path.expanduser("~"), ".cache", "ads", "rasters"
+)
+
+
+class OcrSettings(NamedTuple):
+    dpi: int
+    block_size: int
+    c: int
+    page_segmentation_mode: int
+
+
+class OcrSettingsScore(NamedTuple):
+    settings: OcrSettings
+    parsed_count: int
+    failed_count: int
+    ocr_seconds: float
+
+
+# Tesseract engines of a tuning worker, one per page segmentation mode swept.
+_tuning_backend_name: Optional[str] = None
+_tuning_ocr_backends: dict[int, OcrBackend] = {}
+
+
+def init_tuning_worker(backend_name: str) -> None:
+    global _tuning_backend_name
+    _tuning_backend_name = backend_name
+
+
+def get_tuning_ocr_backend(page_segmentation_mode: int) -> OcrBackend:
+    if page_segmentation_mode not in _tuning_ocr_backends:
+        _tuning_ocr_backends[page_segmentation_mode] = create_ocr_backend(
+            _tuning_backend_name, page_segmentation_mode=page_segmentation_mode
+        )
+    return _tuning_ocr_backends[page_segmentation_mode]
+
+
+def get_raster_cache_folder_path(
+    pdf_file_path: str, dpi: int, cache_folder_path: str
+) -> str:
+    # Keyed by the file's identity and modification time, so a re-exported PDF is rasterized again.
+    pdf_stat = os.stat(pdf_file_path)
+    pdf_key = hashlib.sha256(
+        f"{os.path.abspath(pdf_file_path)}|{pdf_stat.st_size}|{pdf_stat.st_mtime_ns}".encode(
+            "utf-8"
+        )
+    ).hexdigest()[:16]
+    return os.path.join(cache_folder_path, f"{pdf_key}-{dpi}dpi")
+
+
+def cache_page_rasters(
+    pdf_file_path: str,
+    dpi: int,
+    page_count: int,
+    cache_folder_path: str = DEFAULT_RASTER_CACHE_FOLDER_PATH,
+) -> list[str]:
+    """Rasterizes the first `page_count` pages to .npy files once; later runs at the same DPI reuse them."""
+    raster_folder_path = get_raster_cache_folder_path(
+        pdf_file_path, dpi, cache_folder_path
+    )
+    os.makedirs(raster_folder_path, exist_ok=True)
+    raster_file_paths: list[str] = []
+    for page_number in range(1, page_count + 1):
+        raster_file_path = os.path.join(
+            raster_folder_path, f"page_{page_number:02d}.npy"
+        )
+        if not os.path.exists(raster_file_path):
+            # Written under a temporary name so an interrupted run never leaves a truncated raster behind.
+            temp_file_path = f"{raster_file_path}.tmp"
+            with open(temp_file_path, "wb") as f:
+                np.save(f, rasterize_page(pdf_file_path, page_number, dpi))
+            os.replace(temp_file_path, raster_file_path)
+        raster_file_paths.append(raster_file_path)
+    return raster_file_paths
+
+
+def load_page_raster(raster_file_path: str) -> np.ndarray:
+    # Memory-mapped read-only, so the workers share the pages through the OS page cache instead of each loading them.
+    return np.load(raster_file_path, mmap_mode="r")
+
+
+def score_ocr_text(ocr_text: str) -> tuple[int, int]:
+    """Returns how many monster blocks of the OCR text parse without error, and how many fail."""
+    parsed_count = 0
+    failed_count = 0
+    source_lines = (
+        sanitize_source_line(line) for line in ocr_text.splitlines(keepends=True)
+    )
+    # The parser reports every failing block on stdout; a sweep only needs the counts.
+    with contextlib.redirect_stdout(io.StringIO()):
+        for monster_block in iter_monster_blocks(source_lines):
+            try:
+                get_monster_model_from_block(monster_block)
+                parsed_count += 1
+            except Exception:
+                failed_count += 1
+    return parsed_count, failed_count
+
+
+def ocr_page_rasters(
+    raster_file_paths: list[str], settings: OcrSettings, ocr_backend: OcrBackend
+) -> str:
+    """OCRs cached page rasters the way `ocr_page` does, without triage or re-OCR, into combined OCR text."""
+    all_text: list[str] = []
+    for page_number, raster_file_path in enumerate(raster_file_paths, start=1):
+        gray = load_page_raster(raster_file_path)
+        regions = segment_page(gray)
+        for label in COLUMN_LABELS:
+            region_texts = [
+                ocr_backend.image_to_string(
+                    binarize(
+                        crop_region(gray, region),
+                        settings.dpi,
+                        settings.block_size,
+                        settings.c,
+                    )
+                ).strip()
+                for region in get_column_regions(regions, label)
+            ]
+            all_text.append(
+                format_page_text(
+                    page_number, label, "\n".join(t for t in region_texts if t)
+                )
+            )
+    return "\n\n".join(all_text)
+
+
+def score_ocr_settings(
+    raster_file_paths: list[str], settings: OcrSettings
+) -> OcrSettingsScore:
+    ocr_backend = get_tuning_ocr_backend(settings.page_segmentation_mode)
+    started_at = time.perf_counter()
+    ocr_text = ocr_page_rasters(raster_file_paths, settings, ocr_backend)
+    ocr_seconds = time.perf_counter() - started_at
+    parsed_count, failed_count = score_ocr_text(ocr_text)
+    return OcrSettingsScore(settings, parsed_count, failed_count, ocr_seconds)
+
+
+def tune_ocr_settings(
+    pdf_file_path: str,
+    dpis: list[int],
+    block_sizes: list[int],
+    cs: list[int],
+    page_segmentation_modes: list[int],
+    page_count: Optional[int] = None,
+    worker_count: int = 1,
+    backend_name: Optional[str] = None,
+    cache_folder_path: str = DEFAULT_RASTER_CACHE_FOLDER_PATH,
+) -> list[OcrSettingsScore]:
+    """
+    OCRs the first `page_count` pages of a book with every combination of the given settings and returns the
+    scores best first: most monsters parsed, then fewest failures, then fastest.  Pages are rasterized once per
+    DPI and cached on disk; the combinations are spread over a process pool.
+    """
+    backend_name = backend_name or get_default_ocr_backend_name()
+    pdf_page_count = get_pdf_page_count(pdf_file_path)
+    page_count = min(page_count or pdf_page_count, pdf_page_count)
+    raster_file_paths_by_dpi = {
+        dpi: cache_page_rasters(pdf_file_path, dpi, page_count, cache_folder_path)
+        for dpi in dpis
+    }
+
+    all_settings = [
+        OcrSettings(*combination)
+        for combination in itertools.product(
+            dpis, block_sizes, cs, page_segmentation_modes
+        )
+    ]
+    with ProcessPoolExecutor(
+        max_workers=worker_count,
+        initializer=init_tuning_worker,
+        initargs=(backend_name,),
+    ) as executor:
+        scores = list(
+            executor.map(
+                score_ocr_settings,
+                [raster_file_paths_by_dpi[s.dpi] for s in all_settings],
+                all_settings,
+            )
+        )
+    return sorted(
+        scores,
+        key=lambda score: (-score.parsed_count, score.failed_count, score.ocr_seconds),
+    )
+
+
+def print_ocr_tuning_report(
+    pdf_file_path: str, scores: list[OcrSettingsScore], top: int = 10
+) -> None:
+    print(f"OCR settings for [{pdf_file_path}], best first:")
+    print(
+        f"{'dpi':>5}{'block':>7}{'C':>5}{'psm':>5}{'parsed':>8}{'failed':>8}{'ocr s':>9}"
+    )
+    for score in scores[:top]:
+        settings = score.settings
+        print(
+            f"{settings.dpi:>5}{settings.block_size:>7}{settings.c:>5}{settings.page_segmentation_mode:>5}"
+            f"{score.parsed_count:>8}{score.failed_count:>8}{score.ocr_seconds:>9.1f}"
+        )
+    if scores:
+        best = scores[0].settings
+        print(
+            f"Best settings: --dpi {best.dpi} --block-size {best.block_size} --c {best.c} --psm {best.page_segmentation_mode}"
+        )
+
+
+def benchmark_ocr_vocabulary(
+    pdf_file_path: str,
+    page_count: int,
+    backend_name: Optional[str] = None,
+    cache_folder_path: str = DEFAULT_RASTER_CACHE_FOLDER_PATH,
+) -> None:
+    """Compares OCR time and parse success over the first `page_count` pages without and with the vocabulary files."""
+    page_count = min(page_count, get_pdf_page_count(pdf_file_path))
+    raster_file_paths = cache_page_rasters(
+        pdf_file_path, DPI, page_count, cache_folder_path
+    )
+    settings = OcrSettings(
+        DPI,
+        ADAPTIVE_THRESHOLD_BLOCK_SIZE,
+        ADAPTIVE_THRESHOLD_C,
+        DEFAULT_PAGE_SEGMENTATION_MODE,
+    )
+
+    with tempfile.TemporaryDirectory() as vocabulary_folder_path:
+        vocabulary_file_paths = write_ocr_vocabulary_files(vocabulary_folder_path)
+        print(f"{'vocabulary':<12}{'parsed':>8}{'failed':>8}{'ocr s':>9}")
+        for label, (user_words_file_path, user_patterns_file_path) in (
+            ("off", (None, None)),
+            ("on", vocabulary_file_paths),
+        ):
+            ocr_backend = create_ocr_backend(
+                backend_name,
+                page_segmentation_mode=settings.page_segmentation_mode,
+                user_words_file_path=user_words_file_path,
+                user_patterns_file_path=user_patterns_file_path,
+            )
+            started_at = time.perf_counter()
+            ocr_text = ocr_page_rasters(raster_file_paths, settings, ocr_backend)
+            ocr_seconds = time.perf_counter() - started_at
+            ocr_backend.close()
+            parsed_count, failed_count = score_ocr_text(ocr_text)
+            print(f"{label:<12}{parsed_count:>8}{failed_count:>8}{ocr_seconds:>9.1f}")
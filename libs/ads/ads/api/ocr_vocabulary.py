@@ -0,0 +1,100 @@
+import os
+import re
+
+from ads.api.ability_and_trait_parser import ABILITY_TYPE_MAP, TRAIT_NAMES
+from ads.api.monster_parser import (
+    MONSTER_KEYWORD_WHITELIST,
+    MONSTER_ROLE_WHITELIST,
+    MONSTER_TYPE_WHITELIST,
+)
+from ads.api.power_roll_parser import DAMAGE_TYPES, EFFECT_CONDITIONS
+
+USER_WORDS_FILE_NAME = "ads.user-words"
+USER_PATTERNS_FILE_NAME = "ads.user-patterns"
+
+# Fixed labels of a stat block that none of the parser tables spell out.
+STAT_BLOCK_LABELS = (
+    "Stamina",
+    "Speed",
+    "Size",
+    "Stability",
+    "Free Strike",
+    "With Captain",
+    "Immunity",
+    "Weakness",
+    "Might",
+    "Agility",
+    "Reason",
+    "Intuition",
+    "Presence",
+    "Keywords",
+    "Distance",
+    "Target",
+    "Trigger",
+    "Effect",
+    "Signature",
+    "Malice",
+    "Melee",
+    "Ranged",
+    "Strike",
+    "Weapon",
+    "Magic",
+    "Area",
+    "Aura",
+    "Burst",
+    "Cube",
+    "Line",
+    "Wall",
+    "Level",
+    "save ends",
+)
+
+# Tesseract matches user patterns against single words, so a line such as "2d10 + 2" or "Stamina 52" is covered
+# by its numeric tokens.  Syntax: \d digit, \A uppercase letter, \* repeats the preceding character class.
+USER_PATTERNS = (
+    r"2d10",
+    r"+\d",
+    r"-\d",
+    r"\d\d-\d\d",
+    r"\d\d+",
+    r"\A<\d",
+    r"\d\A",
+    r"\d\*",
+)
+
+WORD_SPLIT_PATTERN = re.compile(r"[^A-Za-z']+")
+
+
+def get_ocr_user_words() -> list[str]:
+    """Returns every word of the stat block vocabulary, as written and in upper case (headers are set in caps)."""
+    phrases = [
+        *MONSTER_KEYWORD_WHITELIST,
+        *MONSTER_TYPE_WHITELIST,
+        *MONSTER_ROLE_WHITELIST,
+        *TRAIT_NAMES,
+        *DAMAGE_TYPES,
+        *ABILITY_TYPE_MAP,
+        *EFFECT_CONDITIONS,
+        *STAT_BLOCK_LABELS,
+    ]
+    words: set[str] = set()
+    for phrase in phrases:
+        for word in WORD_SPLIT_PATTERN.split(phrase):
+            word = word.strip("'")
+            if len(word) > 1:
+                words.add(word[0].upper() + word[1:])
+                words.add(word.lower())
+                words.add(word.upper())
+    return sorted(words)
+
+
+def write_ocr_vocabulary_files(folder_path: str) -> tuple[str, str]:
+    """Writes the user-words and user-patterns files to `folder_path` and returns their paths."""
+    os.makedirs(folder_path, exist_ok=True)
+    user_words_file_path = os.path.join(folder_path, USER_WORDS_FILE_NAME)
+    with open(user_words_file_path, "w", encoding="utf-8") as f:
+        f.write("\n".join(get_ocr_user_words()) + "\n")
+    user_patterns_file_path = os.path.join(folder_path, USER_PATTERNS_FILE_NAME)
+    with open(user_patterns_file_path, "w", encoding="utf-8") as f:
+        f.write("\n".join(USER_PATTERNS) + "\n")
+    return user_words_file_path, user_patterns_file_path
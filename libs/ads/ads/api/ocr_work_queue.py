@@ -0,0 +1,466 @@
+import json
+import os
+import socket
+import tempfile
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import NamedTuple, Optional
+
+import pypdfium2 as pdfium
+
+from ads.api.ocr_backend import (
+    DEFAULT_OCR_LANGUAGE,
+    DEFAULT_PAGE_SEGMENTATION_MODE,
+    STUB_OCR_BACKEND_NAME,
+)
+from ads.api.ocr_vocabulary import write_ocr_vocabulary_files
+from ads.api.pdf_ocr import (
+    ADAPTIVE_THRESHOLD_BLOCK_SIZE,
+    ADAPTIVE_THRESHOLD_C,
+    COMBINED_OCR_FILE_NAME,
+    DPI,
+    REOCR_DPI,
+    REOCR_MIN_CONFIDENCE,
+    format_page_text,
+    get_pdf_page_count,
+    init_ocr_worker,
+    ocr_page,
+)
+from ads.model import OcrQueueSpec
+
+QUEUE_SPEC_FILE_NAME = "queue.json"
+LEASES_FOLDER_NAME = "leases"
+RESULTS_FOLDER_NAME = "results"
+PAGES_FOLDER_NAME = "pages"
+# A lease not renewed for this long is taken to belong to a worker that died.  A live worker renews its lease
+# LEASE_RENEWALS_PER_PERIOD times per period while it OCRs the page, however long the page takes.
+DEFAULT_LEASE_SECONDS = 300.0
+LEASE_RENEWALS_PER_PERIOD = 3
+DEFAULT_POLL_SECONDS = 5.0
+# The harness lease is shorter than a stub page (two columns of STUB_OCR_SECONDS), so pages outlive their first
+# lease period and only the renewals keep them from being taken over.
+DEFAULT_HARNESS_PAGE_COUNT = 12
+DEFAULT_HARNESS_WORKER_COUNT = 4
+DEFAULT_HARNESS_LEASE_SECONDS = 0.5
+HARNESS_POLL_SECONDS = 0.1
+HARNESS_DPI = 72
+# Stands for a worker that crashed holding the lease of the first page.
+HARNESS_CRASHED_WORKER_ID = "crashed-worker"
+
+
+class OcrQueueStatus(NamedTuple):
+    page_count: int
+    done: int
+    leased: int
+    expired: int
+    pending: int
+
+
+class OcrQueueHarnessResult(NamedTuple):
+    page_count: int
+    worker_count: int
+    # Pages OCRed, summed over the workers; more than `page_count` means some page was OCRed twice.
+    ocr_page_count: int
+    done: int
+    leftover_lease_count: int
+    merged_page_text_count: int
+    elapsed_seconds: float
+
+
+def get_lease_file_path(queue_folder_path: str, page_number: int) -> str:
+    return os.path.join(
+        queue_folder_path, LEASES_FOLDER_NAME, f"page_{page_number:04d}.lease"
+    )
+
+
+def get_result_file_path(queue_folder_path: str, page_number: int) -> str:
+    return os.path.join(
+        queue_folder_path, RESULTS_FOLDER_NAME, f"page_{page_number:04d}.json"
+    )
+
+
+def create_ocr_queue(
+    queue_folder_path: str,
+    pdf_file_path: str,
+    dpi: int = DPI,
+    save_images: bool = False,
+    use_text_layer: bool = True,
+    use_triage: bool = True,
+    use_layout: bool = True,
+    reocr_min_confidence: float = REOCR_MIN_CONFIDENCE,
+    reocr_dpi: int = REOCR_DPI,
+    block_size: int = ADAPTIVE_THRESHOLD_BLOCK_SIZE,
+    c: int = ADAPTIVE_THRESHOLD_C,
+    page_segmentation_mode: int = DEFAULT_PAGE_SEGMENTATION_MODE,
+    use_vocabulary: bool = True,
+) -> OcrQueueSpec:
+    """
+    Sets up a work queue for a book in `queue_folder_path`, which must be on storage shared by every node that
+    will work on it.  Each page is one job; the OCR settings are fixed here so all workers produce the same text.
+    """
+    if os.path.exists(os.path.join(queue_folder_path, QUEUE_SPEC_FILE_NAME)):
+        raise ValueError(f"An OCR queue already exists in [{queue_folder_path}].")
+    for folder_name in (LEASES_FOLDER_NAME, RESULTS_FOLDER_NAME, PAGES_FOLDER_NAME):
+        os.makedirs(os.path.join(queue_folder_path, folder_name), exist_ok=True)
+    user_words_file_path, user_patterns_file_path = (
+        write_ocr_vocabulary_files(queue_folder_path)
+        if use_vocabulary
+        else (None, None)
+    )
+    queue_spec = OcrQueueSpec(
+        pdfFilePath=os.path.abspath(pdf_file_path),
+        pageCount=get_pdf_page_count(pdf_file_path),
+        dpi=dpi,
+        saveImages=save_images,
+        useTextLayer=use_text_layer,
+        useTriage=use_triage,
+        useLayout=use_layout,
+        reocrMinConfidence=reocr_min_confidence,
+        reocrDpi=reocr_dpi,
+        blockSize=block_size,
+        c=c,
+        pageSegmentationMode=page_segmentation_mode,
+        userWordsFilePath=user_words_file_path,
+        userPatternsFilePath=user_patterns_file_path,
+    )
+    write_json_atomically(
+        os.path.join(queue_folder_path, QUEUE_SPEC_FILE_NAME), queue_spec
+    )
+    return queue_spec
+
+
+def read_ocr_queue_spec(queue_folder_path: str) -> OcrQueueSpec:
+    queue_spec_file_path = os.path.join(queue_folder_path, QUEUE_SPEC_FILE_NAME)
+    if not os.path.exists(queue_spec_file_path):
+        raise ValueError(f"No OCR queue found in [{queue_folder_path}].")
+    with open(queue_spec_file_path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def write_json_atomically(file_path: str, value: object) -> None:
+    # Readers on other nodes see either no file or the whole file, never a partial write.
+    temp_file_path = f"{file_path}.{socket.gethostname()}-{os.getpid()}.tmp"
+    with open(temp_file_path, "w", encoding="utf-8") as f:
+        json.dump(value, f)
+    os.replace(temp_file_path, file_path)
+
+
+def get_lease_holder(lease_file_path: str) -> Optional[str]:
+    try:
+        with open(lease_file_path, encoding="utf-8") as f:
+            return f.read()
+    except FileNotFoundError:
+        return None
+
+
+def try_break_expired_lease(
+    lease_file_path: str, worker_id: str, lease_seconds: float
+) -> bool:
+    """
+    Moves an expired lease out of the way by renaming it to a name of this worker's own.  The rename is atomic,
+    so of several workers racing for the same expired lease only one moves it; the others find it gone.  A lease
+    renewed or taken over between the expiry check and the rename is put back.  Returns whether the page may be
+    claimed afresh.
+    """
+    try:
+        if time.time() - os.path.getmtime(lease_file_path) < lease_seconds:
+            return False
+    except FileNotFoundError:
+        return True
+    broken_lease_file_path = f"{lease_file_path}.{worker_id}.broken"
+    try:
+        os.rename(lease_file_path, broken_lease_file_path)
+    except FileNotFoundError:
+        return True
+    try:
+        is_expired = (
+            time.time() - os.path.getmtime(broken_lease_file_path) >= lease_seconds
+        )
+        if not is_expired:
+            try:
+                os.link(broken_lease_file_path, lease_file_path)
+            except FileExistsError:
+                # The page was claimed afresh in the meantime; the worker whose lease this was finds out when
+                # it next renews it, and at worst the page is OCRed twice.
+                pass
+        return is_expired
+    finally:
+        os.remove(broken_lease_file_path)
+
+
+def try_claim_page(
+    queue_folder_path: str, page_number: int, worker_id: str, lease_seconds: float
+) -> bool:
+    """Takes the lease on a page by creating its lease file exclusively, breaking the lease first if it expired."""
+    lease_file_path = get_lease_file_path(queue_folder_path, page_number)
+    for _ in range(2):
+        try:
+            lease_file = os.open(lease_file_path, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+        except FileExistsError:
+            if not try_break_expired_lease(lease_file_path, worker_id, lease_seconds):
+                return False
+            continue
+        with os.fdopen(lease_file, "w", encoding="utf-8") as f:
+            f.write(worker_id)
+        return True
+    return False
+
+
+def renew_lease(queue_folder_path: str, page_number: int, worker_id: str) -> bool:
+    """Pushes the expiry of this worker's lease on a page back; returns False once the lease is no longer ours."""
+    lease_file_path = get_lease_file_path(queue_folder_path, page_number)
+    if get_lease_holder(lease_file_path) != worker_id:
+        return False
+    try:
+        os.utime(lease_file_path)
+    except FileNotFoundError:
+        return False
+    return True
+
+
+def keep_lease_alive(
+    queue_folder_path: str,
+    page_number: int,
+    worker_id: str,
+    lease_seconds: float,
+    stopped: threading.Event,
+) -> None:
+    # Runs on a heartbeat thread next to the OCR of the page, until the page is done or the lease is lost.
+    while not stopped.wait(lease_seconds / LEASE_RENEWALS_PER_PERIOD):
+        if not renew_lease(queue_folder_path, page_number, worker_id):
+            return
+
+
+def release_page(queue_folder_path: str, page_number: int, worker_id: str) -> None:
+    # A lease another worker took over after ours expired is theirs now, and is left alone.
+    lease_file_path = get_lease_file_path(queue_folder_path, page_number)
+    if get_lease_holder(lease_file_path) != worker_id:
+        return
+    try:
+        os.remove(lease_file_path)
+    except FileNotFoundError:
+        pass
+
+
+def claim_next_page(
+    queue_folder_path: str, page_count: int, worker_id: str, lease_seconds: float
+) -> Optional[int]:
+    for page_number in range(1, page_count + 1):
+        if os.path.exists(get_result_file_path(queue_folder_path, page_number)):
+            continue
+        if not try_claim_page(queue_folder_path, page_number, worker_id, lease_seconds):
+            continue
+        # Another worker may have finished the page between the result check and the claim.
+        if os.path.exists(get_result_file_path(queue_folder_path, page_number)):
+            release_page(queue_folder_path, page_number, worker_id)
+            continue
+        return page_number
+    return None
+
+
+def run_ocr_queue_worker(
+    queue_folder_path: str,
+    backend_name: Optional[str] = None,
+    lease_seconds: float = DEFAULT_LEASE_SECONDS,
+    poll_seconds: float = DEFAULT_POLL_SECONDS,
+) -> int:
+    """
+    Claims and OCRs pages until every page of the queue has a result, and returns how many pages this worker did.
+    While the remaining pages are all leased by other workers it keeps polling, so that the pages of a worker
+    that crashed are picked up once their leases expire.  The lease on the page being OCRed is renewed from a
+    heartbeat thread, so a slow page isn't taken for a crashed one.
+    """
+    queue_spec = read_ocr_queue_spec(queue_folder_path)
+    worker_id = f"{socket.gethostname()}-{os.getpid()}"
+    init_ocr_worker(
+        backend_name,
+        DEFAULT_OCR_LANGUAGE,
+        queue_spec["pageSegmentationMode"],
+        queue_spec["userWordsFilePath"],
+        queue_spec["userPatternsFilePath"],
+    )
+
+    page_count = queue_spec["pageCount"]
+    done_count = 0
+    while get_ocr_queue_status(queue_folder_path, lease_seconds).done < page_count:
+        page_number = claim_next_page(
+            queue_folder_path, page_count, worker_id, lease_seconds
+        )
+        if page_number is None:
+            time.sleep(poll_seconds)
+            continue
+        stopped = threading.Event()
+        heartbeat = threading.Thread(
+            target=keep_lease_alive,
+            args=(queue_folder_path, page_number, worker_id, lease_seconds, stopped),
+            daemon=True,
+        )
+        heartbeat.start()
+        try:
+            page_texts = ocr_page(
+                queue_spec["pdfFilePath"],
+                page_number,
+                queue_spec["dpi"],
+                os.path.join(queue_folder_path, PAGES_FOLDER_NAME),
+                queue_spec["saveImages"],
+                queue_spec["useTextLayer"],
+                queue_spec["useTriage"],
+                queue_spec["useLayout"],
+                queue_spec["reocrMinConfidence"],
+                queue_spec["reocrDpi"],
+                queue_spec["blockSize"],
+                queue_spec["c"],
+            )
+        finally:
+            stopped.set()
+            heartbeat.join()
+        write_json_atomically(
+            get_result_file_path(queue_folder_path, page_number), page_texts
+        )
+        release_page(queue_folder_path, page_number, worker_id)
+        done_count += 1
+    return done_count
+
+
+def run_ocr_queue_workers(
+    queue_folder_path: str,
+    worker_count: int,
+    backend_name: Optional[str] = None,
+    lease_seconds: float = DEFAULT_LEASE_SECONDS,
+    poll_seconds: float = DEFAULT_POLL_SECONDS,
+) -> int:
+    """Runs `worker_count` independent queue workers on this node, exactly as if started separately."""
+    with ProcessPoolExecutor(max_workers=worker_count) as executor:
+        done_counts = [
+            executor.submit(
+                run_ocr_queue_worker,
+                queue_folder_path,
+                backend_name,
+                lease_seconds,
+                poll_seconds,
+            )
+            for _ in range(worker_count)
+        ]
+        return sum(done_count.result() for done_count in done_counts)
+
+
+def get_ocr_queue_status(
+    queue_folder_path: str, lease_seconds: float = DEFAULT_LEASE_SECONDS
+) -> OcrQueueStatus:
+    page_count = read_ocr_queue_spec(queue_folder_path)["pageCount"]
+    done = leased = expired = 0
+    now = time.time()
+    for page_number in range(1, page_count + 1):
+        if os.path.exists(get_result_file_path(queue_folder_path, page_number)):
+            done += 1
+            continue
+        try:
+            lease_age = now - os.path.getmtime(
+                get_lease_file_path(queue_folder_path, page_number)
+            )
+        except FileNotFoundError:
+            continue
+        if lease_age < lease_seconds:
+            leased += 1
+        else:
+            expired += 1
+    return OcrQueueStatus(
+        page_count, done, leased, expired, page_count - done - leased - expired
+    )
+
+
+def merge_ocr_queue(queue_folder_path: str, ocr_folder_path: str) -> str:
+    """Assembles the page results of a drained queue into the combined OCR file `export_pdf_ocr_text` writes."""
+    page_count = read_ocr_queue_spec(queue_folder_path)["pageCount"]
+    missing_page_numbers = [
+        page_number
+        for page_number in range(1, page_count + 1)
+        if not os.path.exists(get_result_file_path(queue_folder_path, page_number))
+    ]
+    if missing_page_numbers:
+        raise ValueError(
+            f"OCR queue [{queue_folder_path}] is missing results for pages {missing_page_numbers}."
+        )
+
+    all_text: list[str] = []
+    for page_number in range(1, page_count + 1):
+        with open(
+            get_result_file_path(queue_folder_path, page_number), encoding="utf-8"
+        ) as f:
+            page_texts = json.load(f)
+        for label, text in page_texts:
+            all_text.append(format_page_text(page_number, label, text))
+
+    os.makedirs(ocr_folder_path, exist_ok=True)
+    combined_ocr_file_path = os.path.join(ocr_folder_path, COMBINED_OCR_FILE_NAME)
+    with open(combined_ocr_file_path, "w", encoding="utf-8") as f:
+        f.write("\n\n".join(all_text))
+    return combined_ocr_file_path
+
+
+def write_blank_pdf(pdf_file_path: str, page_count: int) -> None:
+    pdf = pdfium.PdfDocument.new()
+    try:
+        for _ in range(page_count):
+            pdf.new_page(612, 792)
+        pdf.save(pdf_file_path)
+    finally:
+        pdf.close()
+
+
+def run_ocr_queue_harness(
+    page_count: int = DEFAULT_HARNESS_PAGE_COUNT,
+    worker_count: int = DEFAULT_HARNESS_WORKER_COUNT,
+    lease_seconds: float = DEFAULT_HARNESS_LEASE_SECONDS,
+) -> OcrQueueHarnessResult:
+    """
+    Drains a queue over a blank book in a temporary directory with `worker_count` local workers and the stub OCR
+    backend, then merges it.  The first page starts out leased by a crashed worker, its lease already expired.
+    Each page takes longer than `lease_seconds`, so a page OCRed twice or a lease left behind shows a lease bug.
+    """
+    started_at = time.perf_counter()
+    with tempfile.TemporaryDirectory() as temp_folder_path:
+        pdf_file_path = os.path.join(temp_folder_path, "book.pdf")
+        queue_folder_path = os.path.join(temp_folder_path, "queue")
+        write_blank_pdf(pdf_file_path, page_count)
+        # The blank pages have no text layer, no layout and nothing for triage to find, so each column is OCRed.
+        create_ocr_queue(
+            queue_folder_path,
+            pdf_file_path,
+            dpi=HARNESS_DPI,
+            use_triage=False,
+            use_layout=False,
+            use_vocabulary=False,
+        )
+        crashed_lease_file_path = get_lease_file_path(queue_folder_path, 1)
+        with open(crashed_lease_file_path, "w", encoding="utf-8") as f:
+            f.write(HARNESS_CRASHED_WORKER_ID)
+        crashed_at = time.time() - 2 * lease_seconds
+        os.utime(crashed_lease_file_path, (crashed_at, crashed_at))
+
+        ocr_page_count = run_ocr_queue_workers(
+            queue_folder_path,
+            worker_count,
+            STUB_OCR_BACKEND_NAME,
+            lease_seconds,
+            HARNESS_POLL_SECONDS,
+        )
+        queue_status = get_ocr_queue_status(queue_folder_path, lease_seconds)
+        leftover_lease_count = len(
+            os.listdir(os.path.join(queue_folder_path, LEASES_FOLDER_NAME))
+        )
+        combined_ocr_file_path = merge_ocr_queue(
+            queue_folder_path, os.path.join(temp_folder_path, "ocr-output")
+        )
+        with open(combined_ocr_file_path, encoding="utf-8") as f:
+            merged_page_text_count = f.read().count("--- Page ")
+    return OcrQueueHarnessResult(
+        page_count,
+        worker_count,
+        ocr_page_count,
+        queue_status.done,
+        leftover_lease_count,
+        merged_page_text_count,
+        time.perf_counter() - started_at,
+    )
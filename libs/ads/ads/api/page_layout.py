@@ -0,0 +1,149 @@
+from typing import Literal
+
+import cv2
+import numpy as np
+
+from ads.model import PageRegion
+
+# Segmentation runs on a quarter-resolution copy of the page; boxes are scaled back to the full raster.
+LAYOUT_SCALE = 0.25
+# Text lines are merged into blocks by closing gaps up to about a word space horizontally and a line gap
+# vertically (in thumbnail pixels at 300 DPI source resolution).
+TEXT_BLOCK_KERNEL_SIZE = (9, 5)
+# Boxes smaller than this (thumbnail pixels) are specks, page furniture or stray marks.
+MIN_REGION_AREA = 150
+# Blocks this densely inked and at least a few text lines tall are illustrations rather than text; single lines
+# of bold header type can be just as dense.
+ART_MIN_INK_DENSITY = 0.45
+ART_MIN_HEIGHT = 30
+# The gutter is searched for in the middle band of the page only.
+GUTTER_SEARCH_BAND = (0.35, 0.65)
+# Padding added around each region before OCR so glyphs touching the box edge aren't clipped.
+REGION_PADDING = 8
+
+
+def find_gutter_x(ink: np.ndarray) -> int:
+    """Returns the x of the emptiest vertical strip in the middle band of the page: the gap between the columns."""
+    width = ink.shape[1]
+    band_start = int(width * GUTTER_SEARCH_BAND[0])
+    band_end = int(width * GUTTER_SEARCH_BAND[1])
+    column_ink = ink[:, band_start:band_end].sum(axis=0, dtype=np.int64)
+    # Smooth so a single clean pixel column inside a paragraph can't win over the real gutter.
+    smoothed = np.convolve(column_ink, np.ones(5), mode="same")
+    return band_start + int(np.argmin(smoothed))
+
+
+def segment_page(gray: np.ndarray) -> list[PageRegion]:
+    """
+    Finds the text blocks of a two-column page and returns them in reading order: the left column top to bottom,
+    then the right column.  Blocks that straddle the gutter (full-width headers) are read with the left column.
+    """
+    full_height, full_width = gray.shape
+    thumbnail = cv2.resize(
+        gray, None, fx=LAYOUT_SCALE, fy=LAYOUT_SCALE, interpolation=cv2.INTER_AREA
+    )
+    _, ink = cv2.threshold(thumbnail, 0, 1, cv2.THRESH_BINARY_INV + cv2.THRESH_OTSU)
+    gutter_x = find_gutter_x(ink)
+
+    blocks = cv2.morphologyEx(
+        ink,
+        cv2.MORPH_CLOSE,
+        cv2.getStructuringElement(cv2.MORPH_RECT, TEXT_BLOCK_KERNEL_SIZE),
+    )
+    # Never let closing bridge the gutter; text that genuinely spans it still connects through its own ink.
+    blocks[:, max(gutter_x - 1, 0) : gutter_x + 2] = ink[
+        :, max(gutter_x - 1, 0) : gutter_x + 2
+    ]
+    contours, _ = cv2.findContours(blocks, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE)
+
+    boxes: list[tuple[Literal["left", "right"], int, int, int, int]] = []
+    for contour in contours:
+        x, y, width, height = cv2.boundingRect(contour)
+        if width * height < MIN_REGION_AREA:
+            continue
+        if (
+            height >= ART_MIN_HEIGHT
+            and ink[y : y + height, x : x + width].mean() >= ART_MIN_INK_DENSITY
+        ):
+            continue
+        column: Literal["left", "right"] = "left" if x < gutter_x else "right"
+        boxes.append((column, y, x, width, height))
+
+    boxes = merge_row_boxes(boxes)
+    boxes.sort(key=lambda box: (box[0] != "left", box[1], box[2]))
+    scale = 1 / LAYOUT_SCALE
+    regions: list[PageRegion] = []
+    for order, (column, y, x, width, height) in enumerate(boxes):
+        left = max(int(x * scale) - REGION_PADDING, 0)
+        top = max(int(y * scale) - REGION_PADDING, 0)
+        right = min(int((x + width) * scale) + REGION_PADDING, full_width)
+        bottom = min(int((y + height) * scale) + REGION_PADDING, full_height)
+        regions.append(
+            PageRegion(
+                column=column,
+                order=order,
+                x=left,
+                y=top,
+                width=right - left,
+                height=bottom - top,
+            )
+        )
+    return regions
+
+
+def merge_row_boxes(
+    boxes: list[tuple[Literal["left", "right"], int, int, int, int]],
+) -> list[tuple[Literal["left", "right"], int, int, int, int]]:
+    """
+    Merges blocks of the same column that share a text row, e.g. keywords and a right-aligned "EV 3", so that a
+    stat block row is always OCRed as one line.
+    """
+    merged: list[tuple[Literal["left", "right"], int, int, int, int]] = []
+    for column, y, x, width, height in sorted(boxes, key=lambda box: (box[0], box[1])):
+        if merged:
+            last_column, last_y, last_x, last_width, last_height = merged[-1]
+            overlap = min(last_y + last_height, y + height) - max(last_y, y)
+            if last_column == column and overlap > min(last_height, height) / 2:
+                left = min(last_x, x)
+                top = min(last_y, y)
+                right = max(last_x + last_width, x + width)
+                bottom = max(last_y + last_height, y + height)
+                merged[-1] = (column, top, left, right - left, bottom - top)
+                continue
+        merged.append((column, y, x, width, height))
+    return merged
+
+
+def split_page_at_middle(gray: np.ndarray) -> list[PageRegion]:
+    """The fixed layout: each half of the page is one region."""
+    height, width = gray.shape
+    mid_x = width // 2
+    return [
+        PageRegion(column="left", order=0, x=0, y=0, width=mid_x, height=height),
+        PageRegion(
+            column="right", order=1, x=mid_x, y=0, width=width - mid_x, height=height
+        ),
+    ]
+
+
+def crop_region(gray: np.ndarray, region: PageRegion) -> np.ndarray:
+    # A NumPy view into the page raster; nothing is copied.
+    return gray[
+        region["y"] : region["y"] + region["height"],
+        region["x"] : region["x"] + region["width"],
+    ]
+
+
+def get_column_regions(
+    regions: list[PageRegion], column: Literal["left", "right"]
+) -> list[PageRegion]:
+    return [region for region in regions if region["column"] == column]
+
+
+def get_bounding_region(regions: list[PageRegion]) -> tuple[int, int, int, int]:
+    """Returns the (x, y, width, height) box enclosing all regions."""
+    left = min(region["x"] for region in regions)
+    top = min(region["y"] for region in regions)
+    right = max(region["x"] + region["width"] for region in regions)
+    bottom = max(region["y"] + region["height"] for region in regions)
+    return left, top, right - left, bottom - top
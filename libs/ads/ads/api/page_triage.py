@@ -0,0 +1,48 @@
+from typing import Literal
+
+import cv2
+import numpy as np
+
+from ads.api.monster_parser import is_header_candidate, normalize_string
+from ads.api.ocr_backend import OcrBackend
+
+PageHalfClass = Literal["blank", "art", "prose", "statBlock"]
+
+# The probe OCRs a thumbnail at roughly 120 DPI (from 300 DPI): too coarse for body text, but stat block headers
+# ("GOBLIN ASSASSIN LEVEL 1 HORDE AMBUSHER") are set large and bold enough to survive it.
+TRIAGE_SCALE = 0.4
+BLANK_MAX_INK_DENSITY = 0.004
+ART_MIN_INK_DENSITY = 0.45
+
+
+def get_triage_thumbnail(gray: np.ndarray) -> np.ndarray:
+    thumbnail = cv2.resize(
+        gray, None, fx=TRIAGE_SCALE, fy=TRIAGE_SCALE, interpolation=cv2.INTER_AREA
+    )
+    _, binary = cv2.threshold(thumbnail, 0, 255, cv2.THRESH_BINARY + cv2.THRESH_OTSU)
+    return binary
+
+
+def get_ink_density(binary: np.ndarray) -> float:
+    return float(np.count_nonzero(binary == 0)) / binary.size
+
+
+def has_stat_block_header(text: str) -> bool:
+    # Same test `get_monster_headers_from_source_lines` applies to pick header candidates, so a half that fails
+    # it here would have contributed nothing to the export anyway.
+    return any(
+        is_header_candidate(normalize_string(line)) for line in text.splitlines()
+    )
+
+
+def classify_page_half(gray: np.ndarray, ocr_backend: OcrBackend) -> PageHalfClass:
+    """Cheap image-space triage of a page half; only "statBlock" halves are worth a full-resolution OCR pass."""
+    thumbnail = get_triage_thumbnail(gray)
+    ink_density = get_ink_density(thumbnail)
+    if ink_density <= BLANK_MAX_INK_DENSITY:
+        return "blank"
+    if ink_density >= ART_MIN_INK_DENSITY:
+        return "art"
+    if has_stat_block_header(ocr_backend.image_to_string(thumbnail)):
+        return "statBlock"
+    return "prose"
@@ -0,0 +1,68 @@
+import copy
+import functools
+from typing import Any, Callable, NamedTuple, TypeVar
+
+PARSE_CACHE_SIZE = 4096
+
+T = TypeVar("T")
+
+
+class ParseCacheStatistics(NamedTuple):
+    name: str
+    hits: int
+    misses: int
+    size: int
+
+
+_memoized_parsers: dict[str, Any] = {}
+
+
+def normalize_parse_cache_key(source_text: str) -> str:
+    # The parsers only ever see whitespace-collapsed source lines, so collapsing whitespace here can't change
+    # their result; it only lets lines that differ in spacing share an entry.
+    return " ".join(source_text.split())
+
+
+def memoized_parser(parser: Callable[[str], T]) -> Callable[[str], T]:
+    """
+    Memoizes a pure single-line parser in a bounded LRU cache keyed by the normalized line.  Cached results
+    are deep-copied on the way out so callers can keep mutating the models they get back.
+    """
+    cached_parser = functools.lru_cache(maxsize=PARSE_CACHE_SIZE)(parser)
+    _memoized_parsers[parser.__name__] = cached_parser
+
+    @functools.wraps(parser)
+    def parse(source_text: str) -> T:
+        return copy.deepcopy(cached_parser(normalize_parse_cache_key(source_text)))
+
+    return parse
+
+
+def get_parse_cache_statistics() -> list[ParseCacheStatistics]:
+    statistics: list[ParseCacheStatistics] = []
+    for name, cached_parser in _memoized_parsers.items():
+        cache_info = cached_parser.cache_info()
+        statistics.append(
+            ParseCacheStatistics(
+                name=name,
+                hits=cache_info.hits,
+                misses=cache_info.misses,
+                size=cache_info.currsize,
+            )
+        )
+    return statistics
+
+
+def clear_parse_caches() -> None:
+    for cached_parser in _memoized_parsers.values():
+        cached_parser.cache_clear()
+
+
+def print_parse_cache_statistics() -> None:
+    for statistics in get_parse_cache_statistics():
+        lookups = statistics.hits + statistics.misses
+        hit_rate = statistics.hits / lookups * 100 if lookups else 0.0
+        print(
+            f"  - {statistics.name}: {statistics.hits} hits / {statistics.misses} misses "
+            f"({hit_rate:.1f}% hit rate, {statistics.size} cached)"
+        )
@@ -0,0 +1,543 @@
+import functools
+import json
+import os
+import time
+import tracemalloc
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import Any, Callable, Iterator, Literal, Optional
+
+import cv2
+import numpy as np
+import pypdfium2 as pdfium
+from PIL import Image
+
+from ads.api.ocr_backend import (
+    DEFAULT_OCR_LANGUAGE,
+    DEFAULT_PAGE_SEGMENTATION_MODE,
+    OCR_BACKEND_NAMES,
+    OcrBackend,
+    OcrResult,
+    create_ocr_backend,
+    get_default_ocr_backend_name,
+    get_mean_confidence,
+)
+from ads.api.ocr_vocabulary import write_ocr_vocabulary_files
+from ads.api.page_layout import (
+    crop_region,
+    get_bounding_region,
+    get_column_regions,
+    segment_page,
+    split_page_at_middle,
+)
+from ads.api.page_triage import classify_page_half
+from ads.api.pdf_text_layer import extract_page_text_layer
+from ads.model import PageRegion
+
+DPI = 300
+ADAPTIVE_THRESHOLD_BLOCK_SIZE = 21
+ADAPTIVE_THRESHOLD_C = 15
+# Regions whose mean word confidence falls below this are rendered again at REOCR_DPI and re-OCRed; 0 disables it.
+REOCR_MIN_CONFIDENCE = 75.0
+REOCR_DPI = 600
+COMBINED_OCR_FILE_NAME = "full_combined_ocr.txt"
+COLUMN_LABELS: tuple[Literal["left", "right"], ...] = ("left", "right")
+
+# One OCR backend per worker process, created by the pool initializer so the language model is loaded once per
+# worker rather than once per image.
+_worker_ocr_backend: Optional[OcrBackend] = None
+# Page-sized scratch buffers of a worker process, reused from page to page: the page raster is rendered into one
+# and its regions are binarized into another, so a page costs no new raster allocations once the first is done.
+_worker_buffers: dict[str, np.ndarray] = {}
+
+
+def init_ocr_worker(
+    backend_name: str,
+    language: str = DEFAULT_OCR_LANGUAGE,
+    page_segmentation_mode: int = DEFAULT_PAGE_SEGMENTATION_MODE,
+    user_words_file_path: Optional[str] = None,
+    user_patterns_file_path: Optional[str] = None,
+) -> None:
+    global _worker_ocr_backend
+    if _worker_ocr_backend is not None:
+        _worker_ocr_backend.close()
+    _worker_ocr_backend = create_ocr_backend(
+        backend_name,
+        language,
+        page_segmentation_mode,
+        user_words_file_path,
+        user_patterns_file_path,
+    )
+
+
+def get_worker_ocr_backend() -> OcrBackend:
+    if _worker_ocr_backend is None:
+        raise ValueError("OCR worker has not been initialized; call init_ocr_worker.")
+    return _worker_ocr_backend
+
+
+def get_worker_buffer(buffer_key: str, shape: tuple[int, int]) -> np.ndarray:
+    """Returns a `shape` view of the worker's `buffer_key` buffer, growing it only when a larger page comes along."""
+    size = shape[0] * shape[1]
+    buffer = _worker_buffers.get(buffer_key)
+    if buffer is None or buffer.size < size:
+        buffer = np.empty(size, dtype=np.uint8)
+        _worker_buffers[buffer_key] = buffer
+    return buffer[:size].reshape(shape)
+
+
+def get_pdf_page_count(pdf_file_path: str) -> int:
+    pdf = pdfium.PdfDocument(pdf_file_path)
+    try:
+        return len(pdf)
+    finally:
+        pdf.close()
+
+
+def binarize(
+    gray: np.ndarray,
+    dpi: int = DPI,
+    block_size: int = ADAPTIVE_THRESHOLD_BLOCK_SIZE,
+    c: int = ADAPTIVE_THRESHOLD_C,
+    out: Optional[np.ndarray] = None,
+) -> np.ndarray:
+    # `block_size` is given for 300 DPI: the neighbourhood has to cover the same physical area at any resolution,
+    # and the block size must stay odd.  With `out` (which may be a view) OpenCV writes into it in place.
+    return cv2.adaptiveThreshold(
+        gray,
+        maxValue=255,
+        adaptiveMethod=cv2.ADAPTIVE_THRESH_GAUSSIAN_C,
+        thresholdType=cv2.THRESH_BINARY,
+        blockSize=(block_size * dpi // DPI) | 1,
+        C=c,
+        dst=out,
+    )
+
+
+def binarize_otsu(gray: np.ndarray) -> np.ndarray:
+    _, binary = cv2.threshold(gray, 0, 255, cv2.THRESH_BINARY + cv2.THRESH_OTSU)
+    return binary
+
+
+def new_worker_bitmap(
+    buffer_key: str, width: int, height: int, format: int, rev_byteorder: bool
+) -> pdfium.PdfBitmap:
+    # Only used for grayscale renders, so the bitmap is one byte per pixel with no row padding.
+    buffer = get_worker_buffer(buffer_key, (height, width)).reshape(-1)
+    return pdfium.PdfBitmap.new_native(
+        width, height, format, rev_byteorder, buffer=np.ctypeslib.as_ctypes(buffer)
+    )
+
+
+def render_page_gray(
+    page: pdfium.PdfPage,
+    dpi: int,
+    crop: tuple[float, float, float, float] = (0, 0, 0, 0),
+    buffer_key: Optional[str] = None,
+) -> np.ndarray:
+    """
+    Renders a page (less `crop`, in points from the left, bottom, right and top edge) straight to 8-bit grayscale.
+    With `buffer_key` the pixels land in that worker buffer and are only valid until it is used again.
+    """
+    bitmap_maker: Callable[..., Any] = (
+        functools.partial(new_worker_bitmap, buffer_key)
+        if buffer_key
+        else pdfium.PdfBitmap.new_native
+    )
+    bitmap = page.render(
+        scale=dpi / 72, crop=crop, grayscale=True, bitmap_maker=bitmap_maker
+    )
+    return bitmap.to_numpy()
+
+
+def rasterize_page(
+    pdf_file_path: str,
+    page_number: int,
+    dpi: int = DPI,
+    buffer_key: Optional[str] = None,
+) -> np.ndarray:
+    pdf = pdfium.PdfDocument(pdf_file_path)
+    try:
+        return render_page_gray(pdf[page_number - 1], dpi, buffer_key=buffer_key)
+    finally:
+        pdf.close()
+
+
+def rasterize_page_halves(
+    pdf_file_path: str, page_number: int, dpi: int = DPI
+) -> list[tuple[str, np.ndarray]]:
+    """Renders each column half of a page on its own, cropped at the rasterizer rather than cut from a full page."""
+    pdf = pdfium.PdfDocument(pdf_file_path)
+    try:
+        page = pdf[page_number - 1]
+        mid_x = page.get_width() / 2
+        return [
+            (label, render_page_gray(page, dpi, crop))
+            for label, crop in (("left", (0, 0, mid_x, 0)), ("right", (mid_x, 0, 0, 0)))
+        ]
+    finally:
+        pdf.close()
+
+
+def scale_region(region: PageRegion, scale: float) -> PageRegion:
+    return PageRegion(
+        column=region["column"],
+        order=region["order"],
+        x=int(region["x"] * scale),
+        y=int(region["y"] * scale),
+        width=int(region["width"] * scale),
+        height=int(region["height"] * scale),
+    )
+
+
+def reocr_region(
+    gray: np.ndarray,
+    high_dpi_gray: np.ndarray,
+    region: PageRegion,
+    scale: float,
+    reocr_dpi: int,
+    ocr_backend: OcrBackend,
+    block_size: int = ADAPTIVE_THRESHOLD_BLOCK_SIZE,
+    c: int = ADAPTIVE_THRESHOLD_C,
+) -> tuple[OcrResult, Optional[float]]:
+    """
+    Re-OCRs a low-confidence region at the higher resolution with adaptive thresholding, and at the original
+    resolution with a global Otsu threshold (which copes better with faint or unevenly lit scans), returning the
+    result with the best mean confidence.
+    """
+    high_dpi_region = crop_region(high_dpi_gray, scale_region(region, scale))
+    candidates = [
+        ocr_backend.image_to_data(binarize(high_dpi_region, reocr_dpi, block_size, c)),
+        ocr_backend.image_to_data(binarize_otsu(crop_region(gray, region))),
+    ]
+    confidences = [get_mean_confidence(candidate) or 0.0 for candidate in candidates]
+    best = int(np.argmax(confidences))
+    return candidates[best], confidences[best]
+
+
+def ocr_page(
+    pdf_file_path: str,
+    page_number: int,
+    dpi: int = DPI,
+    ocr_folder_path: Optional[str] = None,
+    save_images: bool = False,
+    use_text_layer: bool = True,
+    use_triage: bool = True,
+    use_layout: bool = True,
+    reocr_min_confidence: float = REOCR_MIN_CONFIDENCE,
+    reocr_dpi: int = REOCR_DPI,
+    block_size: int = ADAPTIVE_THRESHOLD_BLOCK_SIZE,
+    c: int = ADAPTIVE_THRESHOLD_C,
+) -> list[tuple[str, str]]:
+    """
+    Returns the (label, text) pairs of both columns of a page in reading order, taken from the embedded text
+    layer when the page has a usable one and OCRed with the worker's backend otherwise.  With layout analysis
+    on, only the text blocks found by `segment_page` are OCRed (and recorded in page_NN_regions.json); with
+    triage on, only columns that look like stat blocks are OCRed at all, the others come back empty.  Regions
+    OCRed with a mean word confidence below `reocr_min_confidence` are retried (see `reocr_region`); the page
+    is only rendered at `reocr_dpi` if one of its regions needs it.
+    """
+    page_texts = (
+        extract_page_text_layer(pdf_file_path, page_number) if use_text_layer else None
+    )
+    if page_texts is None:
+        ocr_backend = get_worker_ocr_backend()
+        gray = rasterize_page(pdf_file_path, page_number, dpi, "page")
+        binary_page = get_worker_buffer("binaryPage", gray.shape)
+        regions = segment_page(gray) if use_layout else split_page_at_middle(gray)
+        high_dpi_gray: Optional[np.ndarray] = None
+        page_texts = []
+        previous_column_has_stat_block = False
+        for label in COLUMN_LABELS:
+            column_regions = get_column_regions(regions, label)
+            if not column_regions:
+                page_texts.append((label, ""))
+                previous_column_has_stat_block = False
+                continue
+            x, y, width, height = get_bounding_region(column_regions)
+            # A stat block that starts in the left column runs on into the right one without a new header.
+            has_stat_block = (
+                not use_triage
+                or previous_column_has_stat_block
+                or classify_page_half(gray[y : y + height, x : x + width], ocr_backend)
+                == "statBlock"
+            )
+            previous_column_has_stat_block = has_stat_block
+            if not has_stat_block:
+                page_texts.append((label, ""))
+                continue
+            region_texts: list[str] = []
+            for region in column_regions:
+                binary = binarize(
+                    crop_region(gray, region),
+                    dpi,
+                    block_size,
+                    c,
+                    crop_region(binary_page, region),
+                )
+                ocr_result = ocr_backend.image_to_data(binary)
+                region["confidence"] = get_mean_confidence(ocr_result)
+                if (
+                    region["confidence"] is not None
+                    and region["confidence"] < reocr_min_confidence
+                ):
+                    if high_dpi_gray is None:
+                        high_dpi_gray = rasterize_page(
+                            pdf_file_path, page_number, reocr_dpi, "reocrPage"
+                        )
+                    reocr_result, region["reocrConfidence"] = reocr_region(
+                        gray,
+                        high_dpi_gray,
+                        region,
+                        reocr_dpi / dpi,
+                        reocr_dpi,
+                        ocr_backend,
+                        block_size,
+                        c,
+                    )
+                    if region["reocrConfidence"] > region["confidence"]:
+                        ocr_result = reocr_result
+                region_texts.append(ocr_result.text.strip())
+                if ocr_folder_path and save_images:
+                    out_img = os.path.join(
+                        ocr_folder_path,
+                        f"page_{page_number:02d}_{label}_{region['order']:02d}.png",
+                    )
+                    Image.fromarray(binary).save(out_img)
+            page_texts.append((label, "\n".join(t for t in region_texts if t)))
+
+        if ocr_folder_path:
+            out_json = os.path.join(
+                ocr_folder_path, f"page_{page_number:02d}_regions.json"
+            )
+            with open(out_json, "w", encoding="utf-8") as f:
+                json.dump(regions, f, indent=2)
+
+    if ocr_folder_path:
+        for label, text in page_texts:
+            out_txt = os.path.join(
+                ocr_folder_path, f"page_{page_number:02d}_{label}.txt"
+            )
+            with open(out_txt, "w", encoding="utf-8") as f:
+                f.write(text)
+    return page_texts
+
+
+def format_page_text(page_number: int, label: str, text: str) -> str:
+    return f"--- Page {page_number} {label} ---\n{text.strip()}\n"
+
+
+def iter_pdf_ocr_page_texts(
+    pdf_file_path: str,
+    ocr_folder_path: str,
+    backend_name: Optional[str] = None,
+    worker_count: int = 1,
+    dpi: int = DPI,
+    save_images: bool = False,
+    use_text_layer: bool = True,
+    use_triage: bool = True,
+    use_layout: bool = True,
+    reocr_min_confidence: float = REOCR_MIN_CONFIDENCE,
+    reocr_dpi: int = REOCR_DPI,
+    block_size: int = ADAPTIVE_THRESHOLD_BLOCK_SIZE,
+    c: int = ADAPTIVE_THRESHOLD_C,
+    page_segmentation_mode: int = DEFAULT_PAGE_SEGMENTATION_MODE,
+    use_vocabulary: bool = True,
+    max_pending_pages: Optional[int] = None,
+) -> Iterator[tuple[int, list[tuple[str, str]]]]:
+    """
+    Yields (page number, page texts) in page order as the worker pool finishes them.  At most `max_pending_pages`
+    pages (two per worker by default) are queued or in flight at once, so a slow consumer holds the workers back
+    instead of letting finished pages pile up in memory.
+    """
+    backend_name = backend_name or get_default_ocr_backend_name()
+    max_pending_pages = max_pending_pages or 2 * worker_count
+    os.makedirs(ocr_folder_path, exist_ok=True)
+    user_words_file_path, user_patterns_file_path = (
+        write_ocr_vocabulary_files(ocr_folder_path) if use_vocabulary else (None, None)
+    )
+
+    with ProcessPoolExecutor(
+        max_workers=worker_count,
+        initializer=init_ocr_worker,
+        initargs=(
+            backend_name,
+            DEFAULT_OCR_LANGUAGE,
+            page_segmentation_mode,
+            user_words_file_path,
+            user_patterns_file_path,
+        ),
+    ) as executor:
+        pending_pages: deque[tuple[int, Future[list[tuple[str, str]]]]] = deque()
+        for page_number in range(1, get_pdf_page_count(pdf_file_path) + 1):
+            pending_pages.append(
+                (
+                    page_number,
+                    executor.submit(
+                        ocr_page,
+                        pdf_file_path,
+                        page_number,
+                        dpi,
+                        ocr_folder_path,
+                        save_images,
+                        use_text_layer,
+                        use_triage,
+                        use_layout,
+                        reocr_min_confidence,
+                        reocr_dpi,
+                        block_size,
+                        c,
+                    ),
+                )
+            )
+            if len(pending_pages) >= max_pending_pages:
+                done_page_number, page_texts = pending_pages.popleft()
+                yield done_page_number, page_texts.result()
+        while pending_pages:
+            done_page_number, page_texts = pending_pages.popleft()
+            yield done_page_number, page_texts.result()
+
+
+def export_pdf_ocr_text(
+    pdf_file_path: str,
+    ocr_folder_path: str,
+    backend_name: Optional[str] = None,
+    worker_count: int = 1,
+    dpi: int = DPI,
+    save_images: bool = False,
+    use_text_layer: bool = True,
+    use_triage: bool = True,
+    use_layout: bool = True,
+    reocr_min_confidence: float = REOCR_MIN_CONFIDENCE,
+    reocr_dpi: int = REOCR_DPI,
+    block_size: int = ADAPTIVE_THRESHOLD_BLOCK_SIZE,
+    c: int = ADAPTIVE_THRESHOLD_C,
+    page_segmentation_mode: int = DEFAULT_PAGE_SEGMENTATION_MODE,
+    use_vocabulary: bool = True,
+) -> str:
+    all_text: list[str] = []
+    for page_number, page_texts in iter_pdf_ocr_page_texts(
+        pdf_file_path,
+        ocr_folder_path,
+        backend_name,
+        worker_count,
+        dpi,
+        save_images,
+        use_text_layer,
+        use_triage,
+        use_layout,
+        reocr_min_confidence,
+        reocr_dpi,
+        block_size,
+        c,
+        page_segmentation_mode,
+        use_vocabulary,
+    ):
+        for label, text in page_texts:
+            all_text.append(format_page_text(page_number, label, text))
+
+    combined_ocr_file_path = os.path.join(ocr_folder_path, COMBINED_OCR_FILE_NAME)
+    with open(combined_ocr_file_path, "w", encoding="utf-8") as f:
+        f.write("\n\n".join(all_text))
+    return combined_ocr_file_path
+
+
+def benchmark_ocr_backends(
+    pdf_file_path: str,
+    page_count: int,
+    backend_names: tuple[str, ...] = OCR_BACKEND_NAMES,
+    dpi: int = DPI,
+) -> None:
+    """Reports the per-page OCR latency of each backend over the first `page_count` pages, rasterization excluded."""
+    page_count = min(page_count, get_pdf_page_count(pdf_file_path))
+    binarized_pages = [
+        [binarize(gray) for _, gray in rasterize_page_halves(pdf_file_path, n, dpi)]
+        for n in range(1, page_count + 1)
+    ]
+
+    print(f"{'backend':<14}{'setup s':>10}{'mean ms/page':>15}{'max ms/page':>14}")
+    for backend_name in backend_names:
+        started_at = time.perf_counter()
+        try:
+            ocr_backend = create_ocr_backend(backend_name)
+        except ValueError as error:
+            print(f"{backend_name:<14}skipped: {error}")
+            continue
+        setup_seconds = time.perf_counter() - started_at
+
+        page_latencies: list[float] = []
+        for page_halves in binarized_pages:
+            started_at = time.perf_counter()
+            for binary in page_halves:
+                ocr_backend.image_to_string(binary)
+            page_latencies.append((time.perf_counter() - started_at) * 1000)
+        ocr_backend.close()
+
+        print(
+            f"{backend_name:<14}{setup_seconds:>10.2f}"
+            f"{sum(page_latencies) / len(page_latencies):>15.1f}{max(page_latencies):>14.1f}"
+        )
+
+
+def binarize_poppler_page_halves(
+    pdf_file_path: str, page_number: int, dpi: int
+) -> None:
+    # The original RasterPdfToText.py path: poppler renders RGB, PIL crops (copying) and converts each half.
+    from pdf2image import convert_from_path
+
+    page = convert_from_path(
+        pdf_file_path, dpi=dpi, first_page=page_number, last_page=page_number
+    )[0]
+    width, height = page.size
+    for box in ((0, 0, width // 2, height), (width // 2, 0, width, height)):
+        binarize(np.array(page.crop(box).convert("L")), dpi)
+
+
+def binarize_pdfium_page_halves(pdf_file_path: str, page_number: int, dpi: int) -> None:
+    for _, gray in rasterize_page_halves(pdf_file_path, page_number, dpi):
+        binarize(gray, dpi)
+
+
+def binarize_page_halves_into_worker_buffers(
+    pdf_file_path: str, page_number: int, dpi: int
+) -> None:
+    gray = rasterize_page(pdf_file_path, page_number, dpi, "page")
+    binary_page = get_worker_buffer("binaryPage", gray.shape)
+    for region in split_page_at_middle(gray):
+        binarize(crop_region(gray, region), dpi, out=crop_region(binary_page, region))
+
+
+def benchmark_page_rasterization(
+    pdf_file_path: str, page_count: int, dpi: int = DPI
+) -> None:
+    """
+    Reports time and peak traced memory per page for producing both binarized column halves of a page, for each
+    way of rasterizing it.  tracemalloc sees NumPy and Python allocations, not poppler's or PIL's own.
+    """
+    page_count = min(page_count, get_pdf_page_count(pdf_file_path))
+    print(f"{'rasterizer':<18}{'mean ms/page':>14}{'peak MiB/page':>15}")
+    for label, binarize_page_halves in (
+        ("poppler + PIL", binarize_poppler_page_halves),
+        ("pdfium halves", binarize_pdfium_page_halves),
+        ("pdfium buffers", binarize_page_halves_into_worker_buffers),
+    ):
+        page_latencies: list[float] = []
+        page_peaks: list[int] = []
+        tracemalloc.start()
+        try:
+            for page_number in range(1, page_count + 1):
+                tracemalloc.reset_peak()
+                baseline_bytes, _ = tracemalloc.get_traced_memory()
+                started_at = time.perf_counter()
+                binarize_page_halves(pdf_file_path, page_number, dpi)
+                page_latencies.append((time.perf_counter() - started_at) * 1000)
+                page_peaks.append(tracemalloc.get_traced_memory()[1] - baseline_bytes)
+        except Exception as error:
+            print(f"{label:<18}skipped: {error}")
+            continue
+        finally:
+            tracemalloc.stop()
+        print(
+            f"{label:<18}{sum(page_latencies) / page_count:>14.1f}"
+            f"{sum(page_peaks) / page_count / 2**20:>15.1f}"
+        )
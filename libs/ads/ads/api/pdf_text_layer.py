@@ -0,0 +1,50 @@
+import re
+from typing import Optional
+
+import pypdfium2 as pdfium
+
+# A page needs at least this many letters/digits, mostly from real words, before its embedded text is
+# trusted over OCR.  Scanned books often carry no text layer at all, or only a few stray labels.
+MIN_TEXT_LAYER_CHARACTERS = 80
+MIN_TEXT_LAYER_WORD_CHARACTER_RATIO = 0.6
+
+WORD_PATTERN = re.compile(r"[A-Za-z]{2,}")
+
+
+def is_usable_text_layer(text: str) -> bool:
+    alphanumeric_count = sum(c.isalnum() for c in text)
+    if alphanumeric_count < MIN_TEXT_LAYER_CHARACTERS:
+        return False
+    word_character_count = sum(len(w) for w in WORD_PATTERN.findall(text))
+    return (
+        word_character_count / alphanumeric_count >= MIN_TEXT_LAYER_WORD_CHARACTER_RATIO
+    )
+
+
+def extract_page_text_layer(
+    pdf_file_path: str, page_number: int
+) -> Optional[list[tuple[str, str]]]:
+    """
+    Returns the embedded text of a page as (label, text) pairs for its left and right column, or None when the
+    page has no usable text layer and has to be OCRed.  Text is read per column box so a two-column page comes
+    out in reading order instead of interleaved line by line.
+    """
+    pdf = pdfium.PdfDocument(pdf_file_path)
+    try:
+        page = pdf[page_number - 1]
+        width, height = page.get_size()
+        text_page = page.get_textpage()
+        mid_x = width / 2
+        page_texts = [
+            (label, text_page.get_text_bounded(left, 0, right, height))
+            for label, left, right in (("left", 0, mid_x), ("right", mid_x, width))
+        ]
+    finally:
+        pdf.close()
+
+    if not is_usable_text_layer("".join(text for _, text in page_texts)):
+        return None
+    return [
+        (label, text.replace("\r\n", "\n").replace("\r", "\n"))
+        for label, text in page_texts
+    ]
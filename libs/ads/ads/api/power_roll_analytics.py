@@ -0,0 +1,212 @@
+import time
+from typing import Iterable, NamedTuple
+
+import numpy as np
+
+from ads.model import Monster
+
+# A power roll is 2d10 + bonus: tier 1 up to 11, tier 2 from 12 to 16, tier 3 from 17.
+TIER_MIN_TOTALS = (12, 17)
+# A natural 19 or 20 is a tier 3 result whatever the bonus, edges or banes.
+CRITICAL_NATURAL_ROLL = 19
+# Edges and banes, from two banes to two edges.  A single one adds or takes 2 from the roll; two of them move
+# the result a whole tier instead.
+EDGE_STATE_NAMES = ("double bane", "bane", "none", "edge", "double edge")
+EDGE_ROLL_MODIFIERS = np.array([0, -2, 0, 2, 0])
+EDGE_TIER_SHIFTS = np.array([-1, 0, 0, 0, 1])
+# Abilities a monster can use every round: its main actions that cost no malice.
+ROUND_ABILITY_TYPES = ("mainAction",)
+
+
+class AbilityDamageTable(NamedTuple):
+    """One row per ability with a power roll, and the monster columns its row belongs to."""
+
+    monster_names: np.ndarray
+    monster_header_texts: np.ndarray
+    monster_levels: np.ndarray
+    monster_roles: np.ndarray
+    ability_names: np.ndarray
+    monster_rows: np.ndarray
+    bonuses: np.ndarray
+    # Damage per tier, 0 when a tier deals none.
+    tier_damage: np.ndarray
+    is_round_ability: np.ndarray
+
+
+def get_natural_rolls() -> np.ndarray:
+    # The 100 equally likely 2d10 outcomes.
+    die = np.arange(1, 11)
+    return np.add.outer(die, die).ravel()
+
+
+def get_tier_probabilities(bonuses: np.ndarray) -> np.ndarray:
+    """
+    Exact tier odds of 2d10 + bonus under each edge state, for every bonus at once: shape
+    (len(bonuses), len(EDGE_STATE_NAMES), 3), from all 100 outcomes of the dice.
+    """
+    natural_rolls = get_natural_rolls()
+    totals = (
+        natural_rolls[None, None, :]
+        + bonuses[:, None, None]
+        + EDGE_ROLL_MODIFIERS[None, :, None]
+    )
+    tiers = np.clip(
+        np.digitize(totals, TIER_MIN_TOTALS) + EDGE_TIER_SHIFTS[None, :, None], 0, 2
+    )
+    tiers = np.where(natural_rolls[None, None, :] >= CRITICAL_NATURAL_ROLL, 2, tiers)
+    return np.stack([(tiers == tier).mean(axis=-1) for tier in range(3)], axis=-1)
+
+
+def get_ability_damage_table(monster_models: Iterable[Monster]) -> AbilityDamageTable:
+    """
+    Lays out the power roll abilities of `monster_models` as columns.  Resistance tests (power rolls without a
+    bonus) are left out, since the target rolls them.
+    """
+    monsters = list(monster_models)
+    ability_rows = [
+        (monster_row, ability)
+        for monster_row, monster in enumerate(monsters)
+        for ability in monster["abilities"]
+        if ability.get("powerRoll") and ability["powerRoll"]["bonus"] is not None  # type: ignore
+    ]
+    return AbilityDamageTable(
+        monster_names=np.array([monster["name"] for monster in monsters], dtype=str),
+        monster_header_texts=np.array(
+            [monster["header_text"] for monster in monsters], dtype=str
+        ),
+        monster_levels=np.array([monster["level"] for monster in monsters], np.int16),
+        monster_roles=np.array(
+            [str(monster.get("role") or "None") for monster in monsters], dtype=str
+        ),
+        ability_names=np.array(
+            [ability["name"] for _, ability in ability_rows], dtype=str
+        ),
+        monster_rows=np.array(
+            [monster_row for monster_row, _ in ability_rows], np.int32
+        ),
+        bonuses=np.array(
+            [ability["powerRoll"]["bonus"] for _, ability in ability_rows],  # type: ignore
+            np.int16,
+        ),
+        tier_damage=np.array(
+            [
+                [
+                    ability["powerRoll"][tier_name].get("damage") or 0  # type: ignore
+                    for tier_name in ("tier1", "tier2", "tier3")
+                ]
+                for _, ability in ability_rows
+            ],
+            np.float64,
+        ).reshape(-1, 3),
+        is_round_ability=np.array(
+            [
+                ability["type"] in ROUND_ABILITY_TYPES and not ability.get("maliceCost")
+                for _, ability in ability_rows
+            ],
+            bool,
+        ),
+    )
+
+
+def get_expected_ability_damage(table: AbilityDamageTable) -> np.ndarray:
+    # Expected damage of every ability under every edge state: shape (abilities, edge states).
+    return np.einsum(
+        "aet,at->ae", get_tier_probabilities(table.bonuses), table.tier_damage
+    )
+
+
+def get_damage_per_round(
+    table: AbilityDamageTable, expected_damage: np.ndarray
+) -> np.ndarray:
+    """
+    A monster's damage per round is the expected damage of its best round ability, under each edge state:
+    shape (monsters, edge states), 0 for monsters without one.
+    """
+    damage_per_round = np.zeros((len(table.monster_names), len(EDGE_STATE_NAMES)))
+    np.maximum.at(
+        damage_per_round,
+        table.monster_rows[table.is_round_ability],
+        expected_damage[table.is_round_ability],
+    )
+    return damage_per_round
+
+
+def get_tier_damage_anomalies(table: AbilityDamageTable) -> np.ndarray:
+    """
+    Rows of abilities whose damage drops from one tier to the next, or that skip a tier between two damaging
+    ones; a digit misread by OCR usually shows up as one of these.
+    """
+    tier_damage = table.tier_damage
+    decreasing = np.any(np.diff(tier_damage, axis=1) < 0, axis=1)
+    missing_middle = (
+        (tier_damage[:, 1] == 0) & (tier_damage[:, 0] > 0) & (tier_damage[:, 2] > 0)
+    )
+    return np.flatnonzero(decreasing | missing_middle)
+
+
+def print_power_roll_report(monster_models: Iterable[Monster]) -> None:
+    started_at = time.perf_counter()
+    table = get_ability_damage_table(monster_models)
+    expected_damage = get_expected_ability_damage(table)
+    damage_per_round = get_damage_per_round(table, expected_damage)
+    has_round_ability = np.zeros(len(table.monster_names), bool)
+    has_round_ability[table.monster_rows[table.is_round_ability]] = True
+    anomaly_rows = get_tier_damage_anomalies(table)
+    elapsed = time.perf_counter() - started_at
+
+    print(
+        f"{len(table.bonuses)} power roll abilities of {len(table.monster_names)} monsters, "
+        f"analyzed in {elapsed * 1000:.1f} ms."
+    )
+    bonuses = np.unique(table.bonuses)
+    print("Tier odds (tier 1 / 2 / 3 %) by power roll bonus:")
+    print(f"  {'bonus':>6}" + "".join(f"{name:>20}" for name in EDGE_STATE_NAMES))
+    for bonus, probabilities in zip(bonuses, get_tier_probabilities(bonuses)):
+        print(
+            f"  {bonus:>+6}"
+            + "".join(
+                f"{'/'.join(f'{p * 100:.0f}' for p in edge_probabilities):>20}"
+                for edge_probabilities in probabilities
+            )
+        )
+
+    print("Expected damage per round of the best main action, by level and role:")
+    print(
+        f"  {'level':>5}  {'role':<12}{'monsters':>9}"
+        + "".join(f"{name:>13}" for name in EDGE_STATE_NAMES)
+    )
+    group_keys = np.char.add(
+        np.char.zfill(table.monster_levels.astype(str), 3),
+        np.char.add("|", table.monster_roles),
+    )[has_round_ability]
+    groups, group_indexes = np.unique(group_keys, return_inverse=True)
+    group_counts = np.bincount(group_indexes, minlength=len(groups))
+    group_damage = (
+        np.stack(
+            [
+                np.bincount(
+                    group_indexes,
+                    weights=damage_per_round[has_round_ability, edge_state_index],
+                    minlength=len(groups),
+                )
+                for edge_state_index in range(len(EDGE_STATE_NAMES))
+            ],
+            axis=1,
+        )
+        / group_counts[:, None]
+    )
+    for group, count, mean_damage in zip(groups, group_counts, group_damage):
+        level, role = str(group).split("|")
+        print(
+            f"  {int(level):>5}  {role:<12}{count:>9}"
+            + "".join(f"{damage:>13.1f}" for damage in mean_damage)
+        )
+
+    print(f"{len(anomaly_rows)} abilities with tier damage out of order:")
+    for row in anomaly_rows:
+        monster_row = table.monster_rows[row]
+        print(
+            f"  [{table.monster_names[monster_row]}] {table.ability_names[row]}: "
+            f"{' / '.join(str(int(damage)) for damage in table.tier_damage[row])} "
+            f"(header: '{table.monster_header_texts[monster_row]}')"
+        )
@@ -1,13 +1,15 @@
 import re
-from typing import Any, List, Optional
+from typing import Any, Callable, List, Optional
 
 from typing_extensions import Literal
 
+from ads.api.parse_cache import memoized_parser
 from ads.model import (
     Effect,
-    PotencyEffect,
-    PowerRoll,
-    PowerRollTier,
+    EffectRecord,
+    PotencyEffectRecord,
+    PowerRollRecord,
+    PowerRollTierRecord,
 )
 
 DAMAGE_TYPES = {
@@ -25,7 +27,22 @@ DAMAGE_TYPES = {
 
 DAMAGE_TYPE_PATTERN = "|".join([rf"{r}" for r in DAMAGE_TYPES])
 
-EFFECT_DURATION_PATTERN = r"(?:save ends|end of target turn|end of targets turn|end of target.?s turn|end of (?:the )?encounter|EoE|EoT|end of \w+ next turn|start of \w+ next turn)"
+EFFECT_DURATION_PATTERN_BY_DURATION = {
+    "saveEnds": r"save ends",
+    "endOfTargetTurn": r"end of target turn|end of targets turn|end of target.?s turn|EoT|end of \w+ next turn",
+    "endOfEncounter": r"end of (?:the )?encounter|EoE",
+    "startOfTargetTurn": r"start of \w+ next turn",
+}
+EFFECT_DURATION_PATTERN = (
+    rf"(?:{'|'.join(EFFECT_DURATION_PATTERN_BY_DURATION.values())})"
+)
+# The conditions among the effect keywords, each read into the Effect flag of the same name: every boolean flag of
+# the Effect model but noEffect, which no keyword sets.
+EFFECT_CONDITIONS = tuple(
+    key
+    for key, annotation in Effect.__annotations__.items()
+    if annotation is bool and key != "noEffect"
+)
 POWER_ROLL_NUMERICAL_EFFECT_KEYWORD_PATTERN = (
     r"shift|move|push|pull|slide|fly|teleport|immunity|weakness"
 )
@@ -33,8 +50,40 @@ POWER_ROLL_EFFECT_KEYWORDS = rf"(?:prone(?:(?:and )?can[' ]?t stand)?|rage|slowe
 POWER_ROLL_RANGE_PATTERN = r"[^1l!]*(11|12.16|17[4]?[+]?).?\s*"
 POWER_ROLL_DAMAGE_TYPE_PATTERN = rf"(?P<damageType>{DAMAGE_TYPE_PATTERN})?"
 DAMAGE_PATTERN = rf"[^0-9]?(?P<damage>[1-9][0-9]?)\s*[^0-9]?{POWER_ROLL_DAMAGE_TYPE_PATTERN}[^0-9]?\s*damage;?\s*"
-POWER_ROLL_EFFECT_PATTERN = rf"[^A-Za-z0-9]*(?P<effectText>[A-Za-z0-9 ,.-]+{POWER_ROLL_EFFECT_KEYWORDS}[A-Za-z0-9 ,.-]*(?:[(](?P<effectDuration>{EFFECT_DURATION_PATTERN})?[)])?).*"
-POWER_ROLL_POTENCY_EFFECT_PATTERN = rf"[^MARIPmarip]*(?P<potencyTargetCharacteristic>[MARIPmarip])\s?<\s?(?P<potencyValue>[0-6])[^A-Za-z0-9]*(?P<potencyEffectText>(?P<potencyEffect>[A-Za-z0-9;',. +-]+)\s*(?:[(](?P<potencyEffectDuration>{EFFECT_DURATION_PATTERN})[)])?)"
+# The junk before an effect is taken whole, or all but its last character when the effect's keyword is its first
+# word; those are the only two starts the effect text can have, and trying just them keeps a failing match linear.
+POWER_ROLL_EFFECT_PATTERN = rf"(?:[^A-Za-z0-9]*+|[^A-Za-z0-9]*?(?=[^A-Za-z0-9][A-Za-z0-9]))(?P<effectText>[A-Za-z0-9 ,.-]+{POWER_ROLL_EFFECT_KEYWORDS}[A-Za-z0-9 ,.-]*(?:[(](?P<effectDuration>{EFFECT_DURATION_PATTERN})?[)])?).*"
+POWER_ROLL_POTENCY_PATTERN = rf"(?P<potencyTargetCharacteristic>[MARIPmarip])\s?<\s?(?P<potencyValue>[0-6])[^A-Za-z0-9]*(?P<potencyEffectText>(?P<potencyEffect>[A-Za-z0-9;',. +-]+)\s*(?:[(](?P<potencyEffectDuration>{EFFECT_DURATION_PATTERN})[)])?)"
+POWER_ROLL_POTENCY_EFFECT_PATTERN = rf"[^MARIPmarip]*{POWER_ROLL_POTENCY_PATTERN}"
+
+# An effect followed by a potency effect is matched in two steps: the last potency effect of the line first, then
+# the effect in the text before it.  That finds what "effect, anything, potency effect" as one pattern would, but
+# in linear time; the single pattern tried every split of the line between the three parts before failing.
+POWER_ROLL_LAST_POTENCY_EFFECT_PATTERN = re.compile(
+    rf"^.*{POWER_ROLL_POTENCY_PATTERN}", re.IGNORECASE
+)
+
+# Every condition and duration in one alternation, named after the Effect field it fills, so the flags of an
+# effect come from a single scan of its text.
+EFFECT_DATA_REGEX = re.compile(
+    "|".join(
+        [f"(?P<{condition}>{condition})" for condition in EFFECT_CONDITIONS]
+        + [
+            f"(?P<{duration}>{pattern})"
+            for duration, pattern in EFFECT_DURATION_PATTERN_BY_DURATION.items()
+        ]
+    ),
+    re.IGNORECASE,
+)
+# A condition the text rules out ("can't be made prone", "immune to being grabbed", "can't be flanked or
+# frightened") is not flagged.  Matched against the end of the text before the condition.
+NEGATED_CONDITION_REGEX = re.compile(
+    r"\b(?:can[' ]?t|cannot|isn[' ]?t|is not|not|immune to)\s+(?:be\s+|become\s+)?(?:made\s+|being\s+)?"
+    r"(?:[a-z]+,?\s+(?:or|and)\s+|[a-z]+,\s+)*$",
+    re.IGNORECASE,
+)
+# How far back a negation is looked for.
+NEGATION_WINDOW_LENGTH = 60
 
 POWER_ROLL_LINE_PATTERN_BY_TYPE = {
     "noEffect": re.compile(
@@ -58,22 +107,34 @@ POWER_ROLL_LINE_PATTERN_BY_TYPE = {
         rf"^{POWER_ROLL_RANGE_PATTERN}{DAMAGE_PATTERN}{POWER_ROLL_POTENCY_EFFECT_PATTERN}.*$",
         re.IGNORECASE,
     ),
-    "effectAndPotencyEffect": re.compile(
-        rf"^{POWER_ROLL_RANGE_PATTERN}{POWER_ROLL_EFFECT_PATTERN}{POWER_ROLL_POTENCY_EFFECT_PATTERN}.*$",
-        re.IGNORECASE,
-    ),
-    "all": re.compile(
-        rf"^{POWER_ROLL_RANGE_PATTERN}{DAMAGE_PATTERN}{POWER_ROLL_EFFECT_PATTERN}{POWER_ROLL_POTENCY_EFFECT_PATTERN}.*$",
-        re.IGNORECASE,
-    ),
 }
 
 
+def parse_effect_data(effect_text: str) -> EffectRecord:
+    """
+    Builds the Effect for `effect_text`, with a flag set for each condition it names and the duration it names
+    first.
+    """
+    effect = EffectRecord(text=effect_text)
+    for match in EFFECT_DATA_REGEX.finditer(effect_text):
+        field = match.lastgroup
+        if field in EFFECT_CONDITIONS:
+            if not NEGATED_CONDITION_REGEX.search(
+                effect_text[
+                    max(0, match.start() - NEGATION_WINDOW_LENGTH) : match.start()
+                ]
+            ):
+                setattr(effect, field, True)
+        elif effect.duration is None:
+            effect.duration = field  # type: ignore
+    return effect
+
+
 def parse_potency_effect(
     target_characteristic: Optional[str],
     value: Optional[str],
     effect_text: Optional[str],
-) -> PotencyEffect | None:
+) -> PotencyEffectRecord | None:
     if target_characteristic is None or value is None or effect_text is None:
         return None
     try:
@@ -81,10 +142,10 @@ def parse_potency_effect(
     except ValueError:
         print(f"  *** [WARN] Invalid potency value: {value}")
         return None
-    return PotencyEffect(
+    return PotencyEffectRecord(
         targetCharacteristic=map_initial_to_characteristic_name(target_characteristic),
         value=value_as_int,
-        effect=Effect(text=(effect_text.strip() if effect_text else "")),
+        effect=parse_effect_data(effect_text.strip() if effect_text else ""),
     )
 
 
@@ -106,8 +167,10 @@ def map_initial_to_characteristic_name(
 
 
 def parse_power_roll_block(
-    header: dict[str, Any], ability_lines: List[str]
-) -> PowerRoll | None:
+    header: dict[str, Any],
+    ability_lines: List[str],
+    tier_parser: Optional[Callable[[str], PowerRollTierRecord]] = None,
+) -> PowerRollRecord | None:
     powerRollBonus: int | None = header["powerRollBonus"]
     current_power_roll_tier: int = 0
     power_roll_lines_by_tier: dict[str, list[str]] = {
@@ -163,15 +226,38 @@ def parse_power_roll_block(
             }: {power_roll_lines_by_tier}"
         )
 
-    return PowerRoll(
+    parse_tier = tier_parser or parse_power_roll_tier_lines
+    return PowerRollRecord(
         bonus=powerRollBonus or None,
-        tier1=parse_power_roll_tier_lines(" ".join(power_roll_lines_by_tier["tier1"])),
-        tier2=parse_power_roll_tier_lines(" ".join(power_roll_lines_by_tier["tier2"])),
-        tier3=parse_power_roll_tier_lines(" ".join(power_roll_lines_by_tier["tier3"])),
+        tier1=parse_tier(" ".join(power_roll_lines_by_tier["tier1"])),
+        tier2=parse_tier(" ".join(power_roll_lines_by_tier["tier2"])),
+        tier3=parse_tier(" ".join(power_roll_lines_by_tier["tier3"])),
     )
 
 
-def parse_power_roll_tier_lines(power_roll_line: str) -> PowerRollTier:
+def match_line_pattern(line_type: str, normalized: str) -> Optional[dict[str, Any]]:
+    match = POWER_ROLL_LINE_PATTERN_BY_TYPE[line_type].match(normalized)
+    return match.groupdict() if match else None
+
+
+def match_effect_before_potency_effect(
+    effect_line_type: str, normalized: str
+) -> Optional[dict[str, Any]]:
+    """Matches a line of type `effect_line_type` followed by a potency effect, returning the groups of both."""
+    potency_effect_match = POWER_ROLL_LAST_POTENCY_EFFECT_PATTERN.match(normalized)
+    if not potency_effect_match:
+        return None
+    effect_groups = match_line_pattern(
+        effect_line_type,
+        normalized[: potency_effect_match.start("potencyTargetCharacteristic")],
+    )
+    if not effect_groups:
+        return None
+    return effect_groups | potency_effect_match.groupdict()
+
+
+def normalize_power_roll_tier_line(power_roll_line: str) -> str:
+    """Repairs the OCR misreads known to occur in power roll tier lines, ahead of matching them."""
     normalized = re.sub("[^A-Za-z0-9();' <+-]", " ", power_roll_line)
     normalized = (
         normalized.replace("damase", "damage")
@@ -232,7 +318,15 @@ def parse_power_roll_tier_lines(power_roll_line: str) -> PowerRollTier:
         r"(3 corruption damage) 0 (weakened [(]save ends[)])", r"\1 I<0 \2", normalized
     )
     normalized = re.sub(r"<11 0prone", r"<11 I<0 prone", normalized)
-    normalized = re.sub(r"(prone.*) As (bleeding)", r"\1 A<2 \2", normalized)
+    # The last " As bleeding" after a "prone" is a misread A<2; r"(prone.*) As (bleeding)" rescanned the rest of the
+    # line from every "prone" when there was none.
+    misread_potency_index = normalized.rfind(" As bleeding")
+    if 0 <= normalized.find("prone") <= misread_potency_index - len("prone"):
+        normalized = (
+            normalized[:misread_potency_index]
+            + " A<2 bleeding"
+            + normalized[misread_potency_index + len(" As bleeding") :]
+        )
     normalized = re.sub("bleedi$", "bleeding (save ends)", normalized)
     normalized = normalized.replace("can t", "can't")
     normalized = (
@@ -245,74 +339,74 @@ def parse_power_roll_tier_lines(power_roll_line: str) -> PowerRollTier:
         )
         .strip()
     )
+    return normalized
 
+
+@memoized_parser
+def parse_power_roll_tier_lines(power_roll_line: str) -> PowerRollTierRecord:
+    normalized = normalize_power_roll_tier_line(power_roll_line)
     # print(f"  - [{normalized}]")
     hasDamage = False
     hasEffect = False
     hasPotencyEffect = False
-    match = POWER_ROLL_LINE_PATTERN_BY_TYPE["all"].match(normalized)
-    if match:
+    groups = match_effect_before_potency_effect("damageAndEffect", normalized)
+    if groups:
         # print("      Matched by 'all' pattern")
         hasDamage = True
         hasEffect = True
         hasPotencyEffect = True
-    if not match:
-        match = POWER_ROLL_LINE_PATTERN_BY_TYPE["damageAndPotencyEffect"].match(
-            normalized
-        )
-        if match:
+    if not groups:
+        groups = match_line_pattern("damageAndPotencyEffect", normalized)
+        if groups:
             # print("      Matched by 'damageAndPotencyEffect' pattern")
             hasDamage = True
             hasPotencyEffect = True
-    if not match:
-        match = POWER_ROLL_LINE_PATTERN_BY_TYPE["damageAndEffect"].match(normalized)
-        if match:
+    if not groups:
+        groups = match_line_pattern("damageAndEffect", normalized)
+        if groups:
             # print("      Matched by 'damageAndEffect' pattern")
             hasDamage = True
             hasEffect = True
-    if not match:
-        match = POWER_ROLL_LINE_PATTERN_BY_TYPE["damage"].match(normalized)
-        if match:
+    if not groups:
+        groups = match_line_pattern("damage", normalized)
+        if groups:
             # print("      Matched by 'damage' pattern")
             hasDamage = True
-    if not match:
-        match = POWER_ROLL_LINE_PATTERN_BY_TYPE["effectAndPotencyEffect"].match(
-            normalized
-        )
-        if match:
+    if not groups:
+        groups = match_effect_before_potency_effect("effect", normalized)
+        if groups:
             # print("      Matched by 'effectAndPotencyEffect' pattern")
             hasEffect = True
             hasPotencyEffect = True
-    if not match:
-        match = POWER_ROLL_LINE_PATTERN_BY_TYPE["potencyEffect"].match(normalized)
-        if match:
+    if not groups:
+        groups = match_line_pattern("potencyEffect", normalized)
+        if groups:
             # print("      Matched by 'potencyEffect' pattern")
             hasPotencyEffect = True
-    if not match:
-        match = POWER_ROLL_LINE_PATTERN_BY_TYPE["effect"].match(normalized)
-        if match:
+    if not groups:
+        groups = match_line_pattern("effect", normalized)
+        if groups:
             # print("      Matched by 'effect' pattern")
             hasEffect = True
-    if not match:
-        match = POWER_ROLL_LINE_PATTERN_BY_TYPE["noEffect"].match(normalized)
-        if match:
+    if not groups:
+        groups = match_line_pattern("noEffect", normalized)
+        if groups:
             # print("      Matched by 'noEffect' pattern")
             hasEffect = True
             hasDamage = False
             hasPotencyEffect = False
-    if not match:
+    if not groups:
         raise ValueError(
             f"Could not match power roll line: '{power_roll_line}'\n"
             f"Normalized as: '{normalized}'"
         )
 
-    groups = match.groupdict()
     # print(f"      Captured: {groups}")
 
-    return PowerRollTier(
+    return PowerRollTierRecord(
         damage=int(groups["damage"]) if hasDamage else None,
         damageType=groups.get("damageType", None) if hasDamage else None,
-        effect=Effect(text=groups["effectText"].strip()) if hasEffect else None,
+        effect=parse_effect_data(groups["effectText"].strip()) if hasEffect else None,
         potencyEffect=parse_potency_effect(
             groups["potencyTargetCharacteristic"],
             groups["potencyValue"],
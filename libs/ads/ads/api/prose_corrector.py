@@ -0,0 +1,414 @@
+import gzip
+import json
+import math
+import os
+import re
+import time
+from collections import Counter
+from dataclasses import replace
+from typing import Iterable, NamedTuple, Optional
+
+from ads.api.monster_parser import read_source_lines
+from ads.api.ocr_vocabulary import get_ocr_user_words
+from ads.api.power_roll_parser import parse_effect_data
+from ads.model import AbilityRecord, EffectRecord, MonsterRecord, PowerRollTierRecord
+from ads.model.records import get_record_field_names
+
+DEFAULT_MODEL_FILE_PATH = os.path.join(
+    os.path.expanduser("~"), ".cache", "ads", "prose-model.json.gz"
+)
+MODEL_FORMAT_VERSION = 1
+DEFAULT_ORDER = 5
+DEFAULT_BEAM_WIDTH = 8
+# Longer n-grams seen only once are mostly noise, and dropping them keeps the model file small.
+MIN_PRUNED_NGRAM_LENGTH = 3
+MIN_NGRAM_COUNT = 2
+# A word seen this often in the corpus, or one of the stat block vocabulary, is never corrected.
+MIN_TRUSTED_WORD_COUNT = 2
+MIN_CORRECTED_WORD_LENGTH = 3
+MAX_EDITS = 2
+# Costs are in nats, on the same scale as the language model's negative log-probabilities.
+BACKOFF_COST = -math.log(0.4)
+UNSEEN_CHAR_COST = 12.0
+SPACE_INSERTION_COST = 5.0
+# A correction has to beat the text as read by this much, so a rare but genuine word is left alone.
+CORRECTION_MARGIN = 3.0
+
+# (misread, meant, cost): the glyph confusions Tesseract makes on the stat block font, e.g. "damase", "erabbed",
+# "Verticalsiide" and "coruption".
+CONFUSIONS = (
+    ("rn", "m", 2.5),
+    ("m", "rn", 2.5),
+    ("cl", "d", 2.5),
+    ("d", "cl", 3.0),
+    ("vv", "w", 2.5),
+    ("ii", "li", 2.5),
+    ("ii", "il", 2.5),
+    ("ii", "ll", 3.0),
+    ("i", "l", 3.0),
+    ("l", "i", 3.0),
+    ("i", "t", 3.5),
+    ("l", "t", 3.5),
+    ("t", "f", 3.5),
+    ("f", "t", 3.5),
+    ("c", "e", 3.0),
+    ("e", "c", 3.0),
+    ("e", "g", 3.5),
+    ("s", "g", 3.5),
+    ("s", "c", 3.5),
+    ("c", "o", 3.5),
+    ("o", "c", 3.5),
+    ("e", "o", 3.5),
+    ("o", "e", 3.5),
+    ("n", "u", 3.5),
+    ("u", "n", 3.5),
+    ("h", "b", 3.5),
+    ("b", "h", 3.5),
+    ("h", "n", 3.5),
+    ("n", "h", 3.5),
+    *((letter, letter * 2, 3.0) for letter in "cdfglmnoprst"),
+)
+
+WORD_REGEX = re.compile(r"[A-Za-z]+(?:'[A-Za-z]+)*")
+WHITESPACE_REGEX = re.compile(r"\s+")
+
+
+class ProseModel(NamedTuple):
+    order: int
+    # Counts of every character n-gram up to `order` characters of the lowercased corpus, pruned.
+    ngram_counts: dict[str, int]
+    word_counts: dict[str, int]
+
+
+class ProseCorrection(NamedTuple):
+    original: str
+    corrected: str
+    cost_gain: float
+
+
+def get_training_text(line: str) -> str:
+    # Lines are padded with a space, so words at either end are scored like any other.
+    return f" {WHITESPACE_REGEX.sub(' ', line).strip().lower()} "
+
+
+def train_prose_model(
+    lines: Iterable[str],
+    extra_words: Iterable[str] = (),
+    order: int = DEFAULT_ORDER,
+) -> ProseModel:
+    """
+    Counts the character n-grams and words of `lines`.  `extra_words` are trusted as if seen often, so the stat
+    block vocabulary is never corrected away even where the corpus is thin.
+    """
+    ngram_counts: Counter[str] = Counter()
+    word_counts: Counter[str] = Counter()
+    # Each distinct line counts once: a book repeats some stat blocks, which would otherwise make their misreads
+    # look common enough to trust.
+    for text in dict.fromkeys(get_training_text(line) for line in lines):
+        if not text.strip():
+            continue
+        for length in range(1, order + 1):
+            ngram_counts.update(
+                text[start : start + length] for start in range(len(text) - length + 1)
+            )
+        word_counts.update(WORD_REGEX.findall(text))
+    for word in extra_words:
+        word = word.lower()
+        word_counts[word] = max(word_counts[word], MIN_TRUSTED_WORD_COUNT)
+    return ProseModel(
+        order=order,
+        ngram_counts={
+            ngram: count
+            for ngram, count in ngram_counts.items()
+            if len(ngram) < MIN_PRUNED_NGRAM_LENGTH or count >= MIN_NGRAM_COUNT
+        },
+        word_counts=dict(word_counts),
+    )
+
+
+def save_prose_model(prose_model: ProseModel, model_file_path: str) -> None:
+    """Writes the model as gzipped JSON, which loads without unpickling anything."""
+    model_folder_path = os.path.dirname(model_file_path)
+    if model_folder_path:
+        os.makedirs(model_folder_path, exist_ok=True)
+    with gzip.open(model_file_path, "wt", encoding="utf-8") as model_file:
+        json.dump(
+            {"version": MODEL_FORMAT_VERSION, **prose_model._asdict()},
+            model_file,
+            separators=(",", ":"),
+        )
+
+
+def load_prose_model(model_file_path: str) -> ProseModel:
+    with gzip.open(model_file_path, "rt", encoding="utf-8") as model_file:
+        model_data = json.load(model_file)
+    if model_data.get("version") != MODEL_FORMAT_VERSION:
+        raise ValueError(
+            f"Prose model [{model_file_path}] has format version {model_data.get('version')}, "
+            f"expected {MODEL_FORMAT_VERSION}; train it again."
+        )
+    return ProseModel(
+        order=model_data["order"],
+        ngram_counts=model_data["ngram_counts"],
+        word_counts=model_data["word_counts"],
+    )
+
+
+def get_prose_model(
+    ocr_file_path: str,
+    model_file_path: str = DEFAULT_MODEL_FILE_PATH,
+    retrain: bool = False,
+) -> ProseModel:
+    """Loads the model unless it is missing or older than `ocr_file_path`, in which case it is trained again."""
+    started_at = time.perf_counter()
+    if (
+        not retrain
+        and os.path.exists(model_file_path)
+        and os.path.getmtime(model_file_path) >= os.path.getmtime(ocr_file_path)
+    ):
+        prose_model = load_prose_model(model_file_path)
+        print(
+            f"Loaded prose model [{model_file_path}] ({len(prose_model.ngram_counts)} n-grams) "
+            f"in {(time.perf_counter() - started_at) * 1000:.1f} ms."
+        )
+        return prose_model
+
+    prose_model = train_prose_model(
+        read_source_lines(ocr_file_path), get_ocr_user_words()
+    )
+    save_prose_model(prose_model, model_file_path)
+    print(
+        f"Trained prose model [{model_file_path}] ({len(prose_model.ngram_counts)} n-grams, "
+        f"{os.path.getsize(model_file_path) / 1024:.0f} KiB) from [{ocr_file_path}] "
+        f"in {time.perf_counter() - started_at:.2f}s."
+    )
+    return prose_model
+
+
+class ProseCorrector:
+    """
+    Corrects OCR misreads in prose with a character n-gram language model.  Only words the corpus doesn't trust
+    are searched: a beam over their characters applies the glyph confusions and space insertions, and the best
+    spelling whose words are all trusted replaces the word when the model prefers it by `CORRECTION_MARGIN`.
+    """
+
+    def __init__(
+        self, prose_model: ProseModel, beam_width: int = DEFAULT_BEAM_WIDTH
+    ) -> None:
+        self.order = prose_model.order
+        self.word_counts = prose_model.word_counts
+        self.beam_width = beam_width
+        unigram_total = sum(
+            count
+            for ngram, count in prose_model.ngram_counts.items()
+            if len(ngram) == 1
+        )
+        # Stupid backoff: -log P(last char | the chars before it) for every n-gram kept.
+        self.char_costs = {
+            ngram: -math.log(
+                count
+                / (
+                    prose_model.ngram_counts[ngram[:-1]]
+                    if len(ngram) > 1
+                    else unigram_total
+                )
+            )
+            for ngram, count in prose_model.ngram_counts.items()
+        }
+        self.confusions_by_first_char: dict[str, list[tuple[str, str, float]]] = {}
+        for confusion in CONFUSIONS:
+            self.confusions_by_first_char.setdefault(confusion[0][0], []).append(
+                confusion
+            )
+        self.corrected_texts: dict[str, str] = {}
+        self.corrections: list[ProseCorrection] = []
+
+    def get_char_cost(self, history: str, char: str) -> float:
+        for length in range(min(len(history), self.order - 1), -1, -1):
+            cost = self.char_costs.get(history[len(history) - length :] + char)
+            if cost is not None:
+                return cost + BACKOFF_COST * (self.order - 1 - length)
+        return UNSEEN_CHAR_COST
+
+    def get_text_cost(self, history: str, text: str) -> float:
+        cost = 0.0
+        for char in text:
+            cost += self.get_char_cost(history, char)
+            history = history[len(history) - self.order + 2 :] + char
+        return cost
+
+    def is_trusted(self, word: str) -> bool:
+        return self.word_counts.get(word.lower(), 0) >= MIN_TRUSTED_WORD_COUNT
+
+    def add_beam_state(
+        self,
+        beam: dict[str, tuple[float, int]],
+        output: str,
+        cost: float,
+        edits: int,
+    ) -> None:
+        if output not in beam or cost < beam[output][0]:
+            beam[output] = (cost, edits)
+
+    def correct_word(self, history: str, word: str, following: str) -> str:
+        """
+        Returns the best spelling of `word` between `history` and `following` (both lowercased), or `word`
+        itself.  beams[i] holds the spellings of word[:i], with their cost and edit count.
+        """
+        lowered = word.lower()
+        beams: list[dict[str, tuple[float, int]]] = [{} for _ in range(len(word) + 1)]
+        beams[0][""] = (0.0, 0)
+        for position in range(len(word)):
+            states = sorted(beams[position].items(), key=lambda state: state[1][0])
+            for output, (cost, edits) in states[: self.beam_width]:
+                context = (history + output.lower())[1 - self.order :]
+                expansions = [(word[position], 1, 0.0)]
+                if edits < MAX_EDITS:
+                    expansions.extend(
+                        (
+                            meant.upper() if word[position].isupper() else meant,
+                            len(misread),
+                            confusion_cost,
+                        )
+                        for misread, meant, confusion_cost in self.confusions_by_first_char.get(
+                            lowered[position], ()
+                        )
+                        if lowered.startswith(misread, position)
+                    )
+                for replacement, consumed, edit_cost in expansions:
+                    next_cost = (
+                        cost
+                        + edit_cost
+                        + self.get_text_cost(context, replacement.lower())
+                    )
+                    next_edits = edits + (edit_cost > 0)
+                    next_beam = beams[position + consumed]
+                    self.add_beam_state(
+                        next_beam, output + replacement, next_cost, next_edits
+                    )
+                    if next_edits < MAX_EDITS and position + consumed < len(word):
+                        self.add_beam_state(
+                            next_beam,
+                            f"{output}{replacement} ",
+                            next_cost
+                            + SPACE_INSERTION_COST
+                            + self.get_text_cost(
+                                (context + replacement.lower())[1 - self.order :], " "
+                            ),
+                            next_edits + 1,
+                        )
+
+        original_cost = self.get_text_cost(history, lowered + following)
+        best_word, best_cost = word, original_cost - CORRECTION_MARGIN
+        for output, (cost, edits) in beams[len(word)].items():
+            if not edits or not all(self.is_trusted(part) for part in output.split()):
+                continue
+            cost += self.get_text_cost(
+                (history + output.lower())[1 - self.order :], following
+            )
+            if cost < best_cost:
+                best_word, best_cost = output, cost
+        if best_word != word:
+            self.corrections.append(
+                ProseCorrection(word, best_word, original_cost - best_cost)
+            )
+        return best_word
+
+    def correct_text(self, text: str) -> str:
+        if text in self.corrected_texts:
+            return self.corrected_texts[text]
+        pieces = []
+        copied_until = 0
+        for match in WORD_REGEX.finditer(text):
+            word = match.group()
+            if len(word) < MIN_CORRECTED_WORD_LENGTH or self.is_trusted(word):
+                continue
+            history = f" {text[: match.start()].lower()}"[1 - self.order :]
+            following = text[match.end()] if match.end() < len(text) else " "
+            pieces.append(text[copied_until : match.start()])
+            pieces.append(self.correct_word(history, word, following.lower()))
+            copied_until = match.end()
+        pieces.append(text[copied_until:])
+        corrected = "".join(pieces)
+        self.corrected_texts[text] = corrected
+        return corrected
+
+    def correct_effect(self, effect: Optional[EffectRecord]) -> Optional[EffectRecord]:
+        # Condition flags and durations are read from the text again, since a correction can reveal one.
+        if not effect or not effect.text:
+            return effect
+        corrected = self.correct_text(effect.text)
+        if corrected == effect.text:
+            return effect
+        corrected_effect = replace(effect)
+        reparsed_effect = parse_effect_data(corrected)
+        for field_name in get_record_field_names(EffectRecord):
+            value = getattr(reparsed_effect, field_name)
+            if value is not None:
+                setattr(corrected_effect, field_name, value)
+        return corrected_effect
+
+    def correct_power_roll_tier(self, tier: PowerRollTierRecord) -> PowerRollTierRecord:
+        corrected_tier = replace(tier)
+        if tier.effect:
+            corrected_tier.effect = self.correct_effect(tier.effect)
+        if tier.potencyEffect and tier.potencyEffect.effect:
+            corrected_tier.potencyEffect = replace(
+                tier.potencyEffect,
+                effect=self.correct_effect(tier.potencyEffect.effect),
+            )
+        return corrected_tier
+
+    def correct_ability(self, ability: AbilityRecord) -> AbilityRecord:
+        corrected_ability = replace(ability)
+        for field in ("prePowerRollEffect", "postPowerRollEffect", "maliceEffect"):
+            effect = getattr(ability, field)
+            if effect:
+                setattr(corrected_ability, field, self.correct_effect(effect))
+        if ability.trigger:
+            corrected_ability.trigger = self.correct_text(ability.trigger)
+        if ability.powerRoll:
+            corrected_ability.powerRoll = replace(
+                ability.powerRoll,
+                tier1=self.correct_power_roll_tier(ability.powerRoll.tier1),
+                tier2=self.correct_power_roll_tier(ability.powerRoll.tier2),
+                tier3=self.correct_power_roll_tier(ability.powerRoll.tier3),
+            )
+        return corrected_ability
+
+    def correct_monster(self, monster: MonsterRecord) -> MonsterRecord:
+        """
+        Returns a copy of `monster` with its ability effect, trigger and malice text corrected.  Parsed tiers
+        are shared by the parser memos, so nothing is corrected in place.
+        """
+        return replace(
+            monster,
+            abilities=[self.correct_ability(ability) for ability in monster.abilities],
+        )
+
+
+def print_prose_corrections(prose_corrector: ProseCorrector) -> None:
+    print(f"Prose corrections: {len(prose_corrector.corrections)}")
+    for correction in prose_corrector.corrections:
+        print(
+            f"  - '{correction.original}' -> '{correction.corrected}' (gain {correction.cost_gain:.1f})"
+        )
+
+
+def benchmark_prose_correction(
+    prose_model: ProseModel, lines: list[str], repeat: int
+) -> None:
+    prose_corrector = ProseCorrector(prose_model)
+    started_at = time.perf_counter()
+    for _ in range(repeat):
+        # The memo is cleared per repetition, so every line is corrected again.
+        prose_corrector.corrected_texts.clear()
+        prose_corrector.corrections.clear()
+        for line in lines:
+            prose_corrector.correct_text(line)
+    elapsed = time.perf_counter() - started_at
+    corrected_count = len(lines) * repeat
+    print(
+        f"Corrected {corrected_count} lines ({len(lines)} x {repeat}) in {elapsed:.3f}s: "
+        f"{corrected_count / elapsed:,.0f} lines/s, {len(prose_corrector.corrections)} corrections per pass."
+    )
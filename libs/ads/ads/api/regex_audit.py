@@ -0,0 +1,196 @@
+import importlib
+import itertools
+import math
+import pkgutil
+import re
+import time
+from typing import Any, Callable, Iterator, NamedTuple, Optional
+
+import ads.api
+from ads.api.distance_and_target_parser import parse_distance_and_target
+from ads.api.monster_parser import parse_header_line, read_source_lines
+from ads.api.power_roll_parser import parse_power_roll_tier_lines
+
+# Adversarial lines are a prefix the patterns commonly anchor on, a fragment repeated to the target length, and a
+# trailing "!" that no pattern expects, so every repetition has to be tried and rejected.
+ADVERSARIAL_PREFIXES = ("", "12-16 ", "17+ 5 damage ", "Distance ", "Goblin ")
+ADVERSARIAL_FRAGMENTS = (
+    "a ",
+    "x",
+    "1 ",
+    ". ",
+    "- ",
+    ", ",
+    "( ",
+    "M ",
+    "prone ",
+    "slide 1 ",
+    "5 damage ",
+    "Level 1 ",
+    "Melee 1 ",
+    "ally ",
+)
+ADVERSARIAL_SUFFIX = "!"
+AUDIT_INPUT_LENGTHS = (250, 500, 1000, 2000)
+# Matching time that grows faster than length**1.5 is taken as backtracking rather than noise.
+SUPERLINEAR_GROWTH_EXPONENT = 1.5
+# Timings below this are too close to the timer resolution to say anything about growth.
+MIN_GROWTH_SECONDS = 0.0005
+# A pattern that takes longer than this on one input is flagged without trying longer inputs.
+MAX_INPUT_SECONDS = 1.0
+
+LINE_PARSERS: dict[str, Callable[[str], Any]] = {
+    "parse_header_line": parse_header_line,
+    "parse_distance_and_target": parse_distance_and_target,
+    "parse_power_roll_tier_lines": parse_power_roll_tier_lines,
+}
+
+
+class PatternAudit(NamedTuple):
+    name: str
+    growth_exponent: float
+    worst_seconds: float
+    worst_input: str
+    corpus_max_seconds: float
+    corpus_max_line: str
+    superlinear: bool
+
+
+def iter_api_patterns() -> Iterator[tuple[str, re.Pattern[str]]]:
+    """Yields every compiled pattern held at module level in `ads.api`, including those in pattern tables."""
+    seen_pattern_ids: set[int] = set()
+    for module_info in pkgutil.iter_modules(ads.api.__path__):
+        try:
+            module = importlib.import_module(f"ads.api.{module_info.name}")
+        except ImportError:
+            # Modules of the OCR stack need its optional dependencies; they hold no parsing patterns.
+            continue
+        for attribute_name, value in vars(module).items():
+            patterns_by_name = (
+                {f"{module_info.name}.{attribute_name}": value}
+                if isinstance(value, re.Pattern)
+                else {
+                    f"{module_info.name}.{attribute_name}[{key}]": item
+                    for key, item in value.items()
+                }
+                if isinstance(value, dict)
+                else {}
+            )
+            for name, pattern in patterns_by_name.items():
+                # A pattern imported into another module is audited once, under the module that defines it.
+                if (
+                    isinstance(pattern, re.Pattern)
+                    and id(pattern) not in seen_pattern_ids
+                ):
+                    seen_pattern_ids.add(id(pattern))
+                    yield name, pattern
+
+
+def get_adversarial_input(prefix: str, fragment: str, length: int) -> str:
+    body = fragment * (length // len(fragment) + 1)
+    return prefix + body[: length - len(prefix)] + ADVERSARIAL_SUFFIX
+
+
+def time_call(call: Callable[[str], Any], text: str) -> float:
+    started_at = time.perf_counter()
+    try:
+        call(text)
+    except Exception:
+        # The line parsers reject most adversarial lines; only the time it takes matters.
+        pass
+    return time.perf_counter() - started_at
+
+
+def get_growth_exponent(lengths: list[int], seconds: list[float]) -> float:
+    """Returns k in seconds ~ length**k, fitted between the shortest and the longest input timed."""
+    if len(lengths) < 2 or seconds[-1] < MIN_GROWTH_SECONDS:
+        return 1.0
+    return math.log(seconds[-1] / max(seconds[0], 1e-9)) / math.log(
+        lengths[-1] / lengths[0]
+    )
+
+
+def audit_call(
+    name: str, call: Callable[[str], Any], corpus_lines: list[str]
+) -> PatternAudit:
+    """
+    Times `call` on every adversarial input shape at growing lengths and keeps the shape whose time grows
+    fastest, then on every corpus line for the slowest real line.
+    """
+    growth_exponent = 0.0
+    worst_seconds = 0.0
+    worst_input = ""
+    superlinear = False
+    for prefix, fragment in itertools.product(
+        ADVERSARIAL_PREFIXES, ADVERSARIAL_FRAGMENTS
+    ):
+        lengths: list[int] = []
+        seconds: list[float] = []
+        text = ""
+        for length in AUDIT_INPUT_LENGTHS:
+            text = get_adversarial_input(prefix, fragment, length)
+            lengths.append(length)
+            seconds.append(min(time_call(call, text) for _ in range(3)))
+            if seconds[-1] > MAX_INPUT_SECONDS:
+                superlinear = True
+                break
+        shape_exponent = get_growth_exponent(lengths, seconds)
+        if shape_exponent > SUPERLINEAR_GROWTH_EXPONENT:
+            superlinear = True
+        if (shape_exponent, seconds[-1]) > (growth_exponent, worst_seconds):
+            growth_exponent = shape_exponent
+            worst_seconds = seconds[-1]
+            worst_input = text
+
+    corpus_max_seconds = 0.0
+    corpus_max_line = ""
+    for line in corpus_lines:
+        line_seconds = time_call(call, line)
+        if line_seconds > corpus_max_seconds:
+            corpus_max_seconds = line_seconds
+            corpus_max_line = line
+    return PatternAudit(
+        name,
+        growth_exponent,
+        worst_seconds,
+        worst_input,
+        corpus_max_seconds,
+        corpus_max_line,
+        superlinear,
+    )
+
+
+def audit_regex_patterns(ocr_file_path: Optional[str] = None) -> list[PatternAudit]:
+    """
+    Audits every module-level pattern of `ads.api` with `search`, and the single-line parsers uncached, against
+    adversarial inputs and the lines of `ocr_file_path`.
+    """
+    corpus_lines = (
+        [line.strip() for line in read_source_lines(ocr_file_path) if line.strip()]
+        if ocr_file_path
+        else []
+    )
+    audits = [
+        audit_call(name, pattern.search, corpus_lines)
+        for name, pattern in iter_api_patterns()
+    ]
+    audits.extend(
+        # The memoized parsers would answer repeated inputs from the cache; time the parsing itself.
+        audit_call(name, getattr(parser, "__wrapped__", parser), corpus_lines)
+        for name, parser in LINE_PARSERS.items()
+    )
+    return audits
+
+
+def print_regex_audit_report(audits: list[PatternAudit]) -> None:
+    print(f"{'pattern':<72}{'growth':>8}{'worst ms':>10}{'corpus ms':>11}  superlinear")
+    for audit in audits:
+        print(
+            f"{audit.name:<72}{audit.growth_exponent:>8.2f}{audit.worst_seconds * 1000:>10.2f}"
+            f"{audit.corpus_max_seconds * 1000:>11.3f}  {'YES' if audit.superlinear else ''}"
+        )
+    for audit in audits:
+        if audit.superlinear:
+            print(
+                f"[WARN] {audit.name} grows superlinearly, e.g. on: '{audit.worst_input[:80]}...'"
+            )
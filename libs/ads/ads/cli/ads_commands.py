@@ -1,13 +1,31 @@
 from typer import Typer
 
+from ads.cli.bench_commands import bench
+from ads.cli.build_commands import build
+from ads.cli.cache_commands import cache
+from ads.cli.encounter_commands import encounter
 from ads.cli.ocr_commands import ocr
 from ads.cli.package_commands import package
 from ads.cli.pdf_commands import pdf
+from ads.cli.query_commands import query
+from ads.cli.queue_commands import queue
+from ads.cli.simulate_commands import simulate
+from ads.cli.stats_commands import stats
+from ads.cli.validate_commands import validate
 
 ads = Typer(no_args_is_help=True, pretty_exceptions_show_locals=False, name="ads")
+ads.add_typer(bench, name="bench")
+ads.command(no_args_is_help=False, name="build")(build)
+ads.add_typer(cache, name="cache")
+ads.add_typer(encounter, name="encounter")
 ads.add_typer(ocr, name="ocr")
 ads.add_typer(package, name="package")
 ads.add_typer(pdf, name="pdf")
+ads.command(no_args_is_help=False, name="query")(query)
+ads.add_typer(queue, name="queue")
+ads.command(no_args_is_help=False, name="simulate")(simulate)
+ads.command(no_args_is_help=False, name="stats")(stats)
+ads.command(no_args_is_help=False, name="validate")(validate)
 
 if __name__ == "__main__":
     ads()
@@ -0,0 +1,175 @@
+from typing import Annotated, Optional
+
+from typer import Option, Typer
+
+from ads.api.benchmark import (
+    benchmark_distance_and_target_parsing,
+    benchmark_foundry_item_serialization,
+    benchmark_model_memory,
+    get_prose_lines,
+)
+from ads.api.prose_corrector import (
+    DEFAULT_MODEL_FILE_PATH,
+    benchmark_prose_correction,
+    get_prose_model,
+)
+from ads.api.regex_audit import audit_regex_patterns, print_regex_audit_report
+
+bench = Typer(no_args_is_help=True, pretty_exceptions_show_locals=False)
+
+
+@bench.command(no_args_is_help=False, name="memory")
+def memory(
+    ocr_file_path: Annotated[
+        str, Option(case_sensitive=False)
+    ] = "c:/_/aeon/fvtt-system-draw-steel/ocr-output/full_combined_ocr.txt",
+) -> None:
+    print(f"Measuring model memory for OCR file [{ocr_file_path}]...")
+    benchmark_model_memory(ocr_file_path)
+
+
+@bench.command(no_args_is_help=False, name="items")
+def items(
+    ocr_file_path: Annotated[
+        str, Option(case_sensitive=False)
+    ] = "c:/_/aeon/fvtt-system-draw-steel/ocr-output/full_combined_ocr.txt",
+    repeat: Annotated[int, Option()] = 100,
+) -> None:
+    print(f"Measuring Foundry item serialization for OCR file [{ocr_file_path}]...")
+    benchmark_foundry_item_serialization(ocr_file_path, repeat)
+
+
+@bench.command(no_args_is_help=False, name="distance")
+def distance(
+    ocr_file_path: Annotated[
+        str, Option(case_sensitive=False)
+    ] = "c:/_/aeon/fvtt-system-draw-steel/ocr-output/full_combined_ocr.txt",
+    repeat: Annotated[int, Option()] = 100,
+) -> None:
+    print(f"Measuring distance and target parsing for OCR file [{ocr_file_path}]...")
+    benchmark_distance_and_target_parsing(ocr_file_path, repeat)
+
+
+@bench.command(no_args_is_help=False, name="ocr")
+def ocr(
+    pdf_file_path: Annotated[
+        str, Option(case_sensitive=False)
+    ] = "c:/_/aeon/fvtt-system-draw-steel/Draw Steel - Delian Tomb - Monsters - 2025-04.pdf",
+    pages: Annotated[int, Option()] = 5,
+) -> None:
+    from ads.api.pdf_ocr import benchmark_ocr_backends
+
+    print(f"Measuring OCR backend latency for PDF [{pdf_file_path}]...")
+    benchmark_ocr_backends(pdf_file_path, pages)
+
+
+@bench.command(no_args_is_help=False, name="vocabulary")
+def vocabulary(
+    pdf_file_path: Annotated[
+        str, Option(case_sensitive=False)
+    ] = "c:/_/aeon/fvtt-system-draw-steel/Draw Steel - Delian Tomb - Monsters - 2025-04.pdf",
+    pages: Annotated[int, Option()] = 5,
+    backend: Annotated[Optional[str], Option(case_sensitive=False)] = None,
+) -> None:
+    from ads.api.ocr_tuning import benchmark_ocr_vocabulary
+
+    print(
+        f"Measuring OCR accuracy and speed with and without the stat block vocabulary for PDF [{pdf_file_path}]..."
+    )
+    benchmark_ocr_vocabulary(pdf_file_path, pages, backend)
+
+
+@bench.command(no_args_is_help=False, name="raster")
+def raster(
+    pdf_file_path: Annotated[
+        str, Option(case_sensitive=False)
+    ] = "c:/_/aeon/fvtt-system-draw-steel/Draw Steel - Delian Tomb - Monsters - 2025-04.pdf",
+    pages: Annotated[int, Option()] = 5,
+    dpi: Annotated[int, Option()] = 300,
+) -> None:
+    from ads.api.pdf_ocr import benchmark_page_rasterization
+
+    print(f"Measuring page rasterization for PDF [{pdf_file_path}]...")
+    benchmark_page_rasterization(pdf_file_path, pages, dpi)
+
+
+@bench.command(no_args_is_help=False, name="regex")
+def regex(
+    ocr_file_path: Annotated[
+        str, Option(case_sensitive=False)
+    ] = "c:/_/aeon/fvtt-system-draw-steel/ocr-output/full_combined_ocr.txt",
+) -> None:
+    print(
+        f"Timing the parser patterns on adversarial lines and the lines of OCR file [{ocr_file_path}]..."
+    )
+    print_regex_audit_report(audit_regex_patterns(ocr_file_path))
+
+
+@bench.command(no_args_is_help=False, name="grammar")
+def grammar(
+    ocr_file_path: Annotated[
+        str, Option(case_sensitive=False)
+    ] = "c:/_/aeon/fvtt-system-draw-steel/ocr-output/full_combined_ocr.txt",
+    repeat: Annotated[int, Option()] = 5,
+    examples: Annotated[int, Option()] = 10,
+) -> None:
+    from ads.api.grammar_parser import (
+        benchmark_parser_engines,
+        compare_parser_engines,
+        print_engine_comparison,
+    )
+
+    print(
+        f"Comparing the regex and grammar parser engines on OCR file [{ocr_file_path}]..."
+    )
+    print_engine_comparison(compare_parser_engines(ocr_file_path), examples)
+    benchmark_parser_engines(ocr_file_path, repeat)
+
+
+@bench.command(no_args_is_help=False, name="combat")
+def combat(
+    ocr_file_path: Annotated[
+        str, Option(case_sensitive=False)
+    ] = "c:/_/aeon/fvtt-system-draw-steel/ocr-output/full_combined_ocr.txt",
+    monster: Annotated[Optional[list[str]], Option(case_sensitive=False)] = None,
+    combats: Annotated[int, Option()] = 100000,
+    max_workers: Annotated[Optional[int], Option()] = None,
+) -> None:
+    from ads.api.bestiary_index import iter_source_monsters
+    from ads.api.combat_simulator import (
+        PartySpec,
+        benchmark_combat_simulation,
+        get_creature_table,
+        get_encounter_monsters,
+    )
+
+    print(f"Measuring combat simulation scaling for OCR file [{ocr_file_path}]...")
+    encounter = get_encounter_monsters(
+        iter_source_monsters(ocr_file_path),
+        monster or ["Goblin Warrior:4", "Goblin Assassin:2"],
+    )
+    benchmark_combat_simulation(
+        get_creature_table(encounter),
+        PartySpec(4, 20, 2, (4, 7, 9)),
+        combats,
+        max_workers,
+    )
+
+
+@bench.command(no_args_is_help=False, name="prose")
+def prose(
+    ocr_file_path: Annotated[
+        str, Option(case_sensitive=False)
+    ] = "c:/_/aeon/fvtt-system-draw-steel/ocr-output/full_combined_ocr.txt",
+    prose_model_file_path: Annotated[
+        str, Option(case_sensitive=False)
+    ] = DEFAULT_MODEL_FILE_PATH,
+    retrain: Annotated[bool, Option()] = False,
+    repeat: Annotated[int, Option()] = 20,
+) -> None:
+    print(f"Measuring prose correction for OCR file [{ocr_file_path}]...")
+    benchmark_prose_correction(
+        get_prose_model(ocr_file_path, prose_model_file_path, retrain),
+        get_prose_lines(ocr_file_path),
+        repeat,
+    )
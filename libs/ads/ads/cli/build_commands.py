@@ -0,0 +1,81 @@
+from typing import Annotated, Optional
+
+from typer import Option
+
+from ads.api.monster_cache import (
+    DEFAULT_CACHE_FILE_PATH,
+    DEFAULT_CACHE_MAX_BYTES,
+    MonsterCache,
+)
+from ads.api.monster_parser import DEFAULT_PARSER_ENGINE_NAME
+
+
+def build(
+    pdf_file_path: Annotated[
+        str, Option(case_sensitive=False)
+    ] = "c:/_/aeon/fvtt-system-draw-steel/Draw Steel - Delian Tomb - Monsters - 2025-04.pdf",
+    ocr_folder_path: Annotated[
+        str, Option(case_sensitive=False)
+    ] = "c:/_/aeon/fvtt-system-draw-steel/ocr-output",
+    yaml_folder_path: Annotated[
+        str, Option(case_sensitive=False)
+    ] = "c:/_/aeon/fvtt-system-draw-steel/packs/_source/monsters",
+    backend: Annotated[Optional[str], Option(case_sensitive=False)] = None,
+    workers: Annotated[int, Option()] = 1,
+    max_pending_pages: Annotated[Optional[int], Option()] = None,
+    dpi: Annotated[int, Option()] = 300,
+    save_images: Annotated[bool, Option()] = False,
+    text_layer: Annotated[bool, Option("--text-layer/--no-text-layer")] = True,
+    triage: Annotated[bool, Option("--triage/--no-triage")] = True,
+    layout: Annotated[bool, Option("--layout/--no-layout")] = True,
+    reocr_min_confidence: Annotated[float, Option()] = 75.0,
+    reocr_dpi: Annotated[int, Option()] = 600,
+    block_size: Annotated[int, Option()] = 21,
+    c: Annotated[int, Option()] = 15,
+    psm: Annotated[int, Option()] = 1,
+    vocabulary: Annotated[bool, Option("--vocabulary/--no-vocabulary")] = True,
+    use_cache: Annotated[bool, Option("--cache/--no-cache")] = False,
+    cache_file_path: Annotated[
+        str, Option(case_sensitive=False)
+    ] = DEFAULT_CACHE_FILE_PATH,
+    cache_max_bytes: Annotated[int, Option()] = DEFAULT_CACHE_MAX_BYTES,
+    engine: Annotated[str, Option(case_sensitive=False)] = DEFAULT_PARSER_ENGINE_NAME,
+) -> None:
+    # The OCR stack (OpenCV, pdfium, Tesseract) is an optional extra, so it is only imported when needed.
+    from ads.api.build_pipeline import build_monsters
+    from ads.api.pdf_ocr import iter_pdf_ocr_page_texts
+
+    print(
+        f"Building monsters from PDF [{pdf_file_path}] into YAML files in folder [{yaml_folder_path}]..."
+    )
+    page_texts_by_page = iter_pdf_ocr_page_texts(
+        pdf_file_path,
+        ocr_folder_path,
+        backend,
+        workers,
+        dpi,
+        save_images,
+        text_layer,
+        triage,
+        layout,
+        reocr_min_confidence,
+        reocr_dpi,
+        block_size,
+        c,
+        psm,
+        vocabulary,
+        max_pending_pages,
+    )
+    if not use_cache:
+        build_monsters(
+            page_texts_by_page, ocr_folder_path, yaml_folder_path, None, engine
+        )
+        return
+    with MonsterCache(cache_file_path, cache_max_bytes) as monster_cache:
+        build_monsters(
+            page_texts_by_page,
+            ocr_folder_path,
+            yaml_folder_path,
+            monster_cache,
+            engine,
+        )
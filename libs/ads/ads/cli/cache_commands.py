@@ -0,0 +1,37 @@
+from typing import Annotated
+
+from typer import Option, Typer
+
+from ads.api.monster_cache import DEFAULT_CACHE_FILE_PATH, MonsterCache
+
+cache = Typer(no_args_is_help=True, pretty_exceptions_show_locals=False)
+
+
+@cache.command(no_args_is_help=False, name="stats")
+def stats(
+    cache_file_path: Annotated[
+        str, Option(case_sensitive=False)
+    ] = DEFAULT_CACHE_FILE_PATH,
+) -> None:
+    with MonsterCache(cache_file_path) as monster_cache:
+        statistics = monster_cache.get_statistics()
+    print(f"Monster cache [{statistics.cache_file_path}]:")
+    print(f"  - parser version: {statistics.parser_version}")
+    print(
+        f"  - entries: {statistics.entries} ({statistics.stale_entries} from other parser versions)"
+    )
+    print(
+        f"  - size: {statistics.size_bytes / 1024:.1f} KiB of {statistics.max_bytes / 1024:.0f} KiB"
+    )
+
+
+@cache.command(no_args_is_help=False, name="clear")
+def clear(
+    cache_file_path: Annotated[
+        str, Option(case_sensitive=False)
+    ] = DEFAULT_CACHE_FILE_PATH,
+    stale_only: Annotated[bool, Option()] = False,
+) -> None:
+    with MonsterCache(cache_file_path) as monster_cache:
+        cleared_count = monster_cache.clear(stale_only)
+    print(f"Cleared {cleared_count} entries from monster cache [{cache_file_path}].")
@@ -0,0 +1,61 @@
+import time
+from typing import Annotated, Optional
+
+from typer import Option, Typer
+
+encounter = Typer(no_args_is_help=True, pretty_exceptions_show_locals=False)
+
+
+@encounter.command(no_args_is_help=False, name="build")
+def build(
+    budget: Annotated[int, Option()] = 30,
+    tolerance: Annotated[int, Option()] = 2,
+    count: Annotated[int, Option()] = 10,
+    max_kinds: Annotated[int, Option()] = 4,
+    max_count: Annotated[int, Option()] = 6,
+    max_leaders: Annotated[int, Option()] = 1,
+    minion_squad_size: Annotated[Optional[list[int]], Option()] = None,
+    source_path: Annotated[
+        str, Option(case_sensitive=False)
+    ] = "c:/_/aeon/fvtt-system-draw-steel/packs/_source/monsters",
+    snapshot_file_path: Annotated[Optional[str], Option(case_sensitive=False)] = None,
+    rebuild: Annotated[bool, Option()] = False,
+    monster_type: Annotated[
+        Optional[list[str]], Option("--type", case_sensitive=False)
+    ] = None,
+    role: Annotated[Optional[list[str]], Option(case_sensitive=False)] = None,
+    keyword: Annotated[Optional[list[str]], Option(case_sensitive=False)] = None,
+    where: Annotated[Optional[list[str]], Option()] = None,
+) -> None:
+    """
+    Finds the encounters closest to an EV budget among the monsters matching the `ads query` filters, e.g.
+    --budget 24 --keyword Goblin --where "level<=2" --minion-squad-size 4 --minion-squad-size 8.
+    """
+    # NumPy is an optional extra, so it is only imported when needed.
+    from ads.api.bestiary_index import (
+        DEFAULT_SNAPSHOT_FILE_PATH,
+        get_bestiary_index,
+        query_bestiary_index,
+    )
+    from ads.api.encounter_builder import (
+        DEFAULT_MINION_SQUAD_SIZES,
+        build_encounters,
+        get_encounter_units,
+        print_encounters,
+    )
+
+    bestiary_index = get_bestiary_index(
+        source_path, snapshot_file_path or DEFAULT_SNAPSHOT_FILE_PATH, rebuild
+    )
+    started_at = time.perf_counter()
+    rows = query_bestiary_index(bestiary_index, monster_type, role, keyword, where)
+    units = get_encounter_units(
+        bestiary_index,
+        rows,
+        tuple(minion_squad_size or DEFAULT_MINION_SQUAD_SIZES),
+        max_count,
+    )
+    encounters = build_encounters(
+        units, budget, tolerance, max_kinds, max_leaders, count
+    )
+    print_encounters(encounters, budget, started_at)
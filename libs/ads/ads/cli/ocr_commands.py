@@ -1,8 +1,21 @@
-from typing import Annotated
+from typing import Annotated, Optional
 
 from typer import Option, Typer
 
-from ads.api.monster_parser import export_monsters
+from ads.api.monster_cache import (
+    DEFAULT_CACHE_FILE_PATH,
+    DEFAULT_CACHE_MAX_BYTES,
+    MonsterCache,
+)
+from ads.api.monster_parser import DEFAULT_PARSER_ENGINE_NAME, export_monsters
+from ads.api.prose_corrector import (
+    DEFAULT_MODEL_FILE_PATH,
+    ProseCorrector,
+    get_prose_model,
+    print_prose_corrections,
+)
+from ads.model import MonsterRecord
+from ads.model.records import to_monster_model
 
 ocr = Typer(no_args_is_help=True, pretty_exceptions_show_locals=False)
 
@@ -15,8 +28,58 @@ def export(
     yaml_folder_path: Annotated[
         str, Option(case_sensitive=False)
     ] = "c:/_/aeon/fvtt-system-draw-steel/packs/_source/monsters",
+    use_cache: Annotated[bool, Option("--cache/--no-cache")] = False,
+    cache_file_path: Annotated[
+        str, Option(case_sensitive=False)
+    ] = DEFAULT_CACHE_FILE_PATH,
+    cache_max_bytes: Annotated[int, Option()] = DEFAULT_CACHE_MAX_BYTES,
+    validate: Annotated[bool, Option("--validate/--no-validate")] = False,
+    correct_prose: Annotated[
+        bool, Option("--correct-prose/--no-correct-prose")
+    ] = False,
+    prose_model_file_path: Annotated[
+        str, Option(case_sensitive=False)
+    ] = DEFAULT_MODEL_FILE_PATH,
+    engine: Annotated[str, Option(case_sensitive=False)] = DEFAULT_PARSER_ENGINE_NAME,
 ) -> None:
     print(
         f"Exporting data from OCR file [{ocr_file_path}] to YAML files in folder [{yaml_folder_path}]..."
     )
-    export_monsters(ocr_file_path, yaml_folder_path)
+    prose_corrector = (
+        ProseCorrector(get_prose_model(ocr_file_path, prose_model_file_path))
+        if correct_prose
+        else None
+    )
+    correct_monster = prose_corrector.correct_monster if prose_corrector else None
+    exported_monsters: Optional[list[MonsterRecord]] = [] if validate else None
+    if not use_cache:
+        export_monsters(
+            ocr_file_path,
+            yaml_folder_path,
+            None,
+            correct_monster,
+            engine,
+            exported_monsters,
+        )
+    else:
+        with MonsterCache(cache_file_path, cache_max_bytes) as monster_cache:
+            export_monsters(
+                ocr_file_path,
+                yaml_folder_path,
+                monster_cache,
+                correct_monster,
+                engine,
+                exported_monsters,
+            )
+    if exported_monsters is not None:
+        validate_export(exported_monsters)
+    if prose_corrector:
+        print_prose_corrections(prose_corrector)
+
+
+def validate_export(exported_monsters: list[MonsterRecord]) -> None:
+    # NumPy is an optional extra, so it is only imported when needed.
+    from ads.api.anomaly_detector import print_anomaly_report
+
+    print("Checking the exported stats for outliers...")
+    print_anomaly_report([to_monster_model(monster) for monster in exported_monsters])
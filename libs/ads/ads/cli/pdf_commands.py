@@ -1,4 +1,4 @@
-from typing import Annotated
+from typing import Annotated, Optional
 
 from typer import Option, Typer
 
@@ -13,7 +13,70 @@ def export(
     ocr_folder_path: Annotated[
         str, Option(case_sensitive=False)
     ] = "c:/_/aeon/fvtt-system-draw-steel/ocr-output",
+    backend: Annotated[Optional[str], Option(case_sensitive=False)] = None,
+    workers: Annotated[int, Option()] = 1,
+    dpi: Annotated[int, Option()] = 300,
+    save_images: Annotated[bool, Option()] = False,
+    text_layer: Annotated[bool, Option("--text-layer/--no-text-layer")] = True,
+    triage: Annotated[bool, Option("--triage/--no-triage")] = True,
+    layout: Annotated[bool, Option("--layout/--no-layout")] = True,
+    reocr_min_confidence: Annotated[float, Option()] = 75.0,
+    reocr_dpi: Annotated[int, Option()] = 600,
+    block_size: Annotated[int, Option()] = 21,
+    c: Annotated[int, Option()] = 15,
+    psm: Annotated[int, Option()] = 1,
+    vocabulary: Annotated[bool, Option("--vocabulary/--no-vocabulary")] = True,
 ) -> None:
+    # The OCR stack (OpenCV, pdfium, Tesseract) is an optional extra, so it is only imported when needed.
+    from ads.api.pdf_ocr import export_pdf_ocr_text
+
     print(
         f"Exporting data from PDF [{pdf_file_path}] to OCR file in folder [{ocr_folder_path}]..."
     )
+    combined_ocr_file_path = export_pdf_ocr_text(
+        pdf_file_path,
+        ocr_folder_path,
+        backend,
+        workers,
+        dpi,
+        save_images,
+        text_layer,
+        triage,
+        layout,
+        reocr_min_confidence,
+        reocr_dpi,
+        block_size,
+        c,
+        psm,
+        vocabulary,
+    )
+    print(f"OCR complete. Output saved to [{combined_ocr_file_path}].")
+
+
+@pdf.command(no_args_is_help=False, name="tune")
+def tune(
+    pdf_file_path: Annotated[
+        str, Option(case_sensitive=False)
+    ] = "c:/_/aeon/fvtt-system-draw-steel/Draw Steel - Delian Tomb - Monsters - 2025-04.pdf",
+    dpi: Annotated[Optional[list[int]], Option()] = None,
+    block_size: Annotated[Optional[list[int]], Option()] = None,
+    c: Annotated[Optional[list[int]], Option()] = None,
+    psm: Annotated[Optional[list[int]], Option()] = None,
+    pages: Annotated[Optional[int], Option()] = None,
+    backend: Annotated[Optional[str], Option(case_sensitive=False)] = None,
+    workers: Annotated[int, Option()] = 1,
+    top: Annotated[int, Option()] = 10,
+) -> None:
+    from ads.api.ocr_tuning import print_ocr_tuning_report, tune_ocr_settings
+
+    scores = tune_ocr_settings(
+        pdf_file_path,
+        dpi or [300],
+        block_size or [15, 21, 31],
+        c or [10, 15, 20],
+        psm or [1, 3, 6],
+        pages,
+        workers,
+        backend,
+    )
+    print_ocr_tuning_report(pdf_file_path, scores, top)
@@ -0,0 +1,54 @@
+from typing import Annotated, Optional
+
+from typer import Option
+
+from ads.api.monster_cache import DEFAULT_CACHE_FILE_PATH, MonsterCache
+
+
+def query(
+    source_path: Annotated[
+        str, Option(case_sensitive=False)
+    ] = "c:/_/aeon/fvtt-system-draw-steel/packs/_source/monsters",
+    snapshot_file_path: Annotated[Optional[str], Option(case_sensitive=False)] = None,
+    rebuild: Annotated[bool, Option()] = False,
+    monster_type: Annotated[
+        Optional[list[str]], Option("--type", case_sensitive=False)
+    ] = None,
+    role: Annotated[Optional[list[str]], Option(case_sensitive=False)] = None,
+    keyword: Annotated[Optional[list[str]], Option(case_sensitive=False)] = None,
+    where: Annotated[Optional[list[str]], Option()] = None,
+    sort_by: Annotated[Optional[list[str]], Option()] = None,
+    limit: Annotated[Optional[int], Option()] = None,
+    use_cache: Annotated[bool, Option("--cache/--no-cache")] = False,
+    cache_file_path: Annotated[
+        str, Option(case_sensitive=False)
+    ] = DEFAULT_CACHE_FILE_PATH,
+) -> None:
+    """
+    Finds monsters by type, role, keywords and numeric filters, e.g.
+    --type leader --keyword Undead --where "level>=3" --where "encounterValue<=12" --sort-by -stamina.
+    """
+    # NumPy is an optional extra, so it is only imported when needed.
+    from ads.api.bestiary_index import (
+        DEFAULT_SNAPSHOT_FILE_PATH,
+        get_bestiary_index,
+        print_query_results,
+        query_bestiary_index,
+    )
+
+    if use_cache:
+        with MonsterCache(cache_file_path) as monster_cache:
+            bestiary_index = get_bestiary_index(
+                source_path,
+                snapshot_file_path or DEFAULT_SNAPSHOT_FILE_PATH,
+                rebuild,
+                monster_cache,
+            )
+    else:
+        bestiary_index = get_bestiary_index(
+            source_path, snapshot_file_path or DEFAULT_SNAPSHOT_FILE_PATH, rebuild
+        )
+    rows = query_bestiary_index(
+        bestiary_index, monster_type, role, keyword, where, sort_by
+    )
+    print_query_results(bestiary_index, rows, limit)
@@ -0,0 +1,113 @@
+from typing import Annotated, Optional
+
+from typer import Option, Typer
+
+queue = Typer(no_args_is_help=True, pretty_exceptions_show_locals=False)
+
+# The OCR stack (OpenCV, pdfium, Tesseract) is an optional extra, so it is only imported by the commands.
+
+
+@queue.command(no_args_is_help=False, name="create")
+def create(
+    queue_folder_path: Annotated[str, Option(case_sensitive=False)],
+    pdf_file_path: Annotated[
+        str, Option(case_sensitive=False)
+    ] = "c:/_/aeon/fvtt-system-draw-steel/Draw Steel - Delian Tomb - Monsters - 2025-04.pdf",
+    dpi: Annotated[int, Option()] = 300,
+    save_images: Annotated[bool, Option()] = False,
+    text_layer: Annotated[bool, Option("--text-layer/--no-text-layer")] = True,
+    triage: Annotated[bool, Option("--triage/--no-triage")] = True,
+    layout: Annotated[bool, Option("--layout/--no-layout")] = True,
+    reocr_min_confidence: Annotated[float, Option()] = 75.0,
+    reocr_dpi: Annotated[int, Option()] = 600,
+    block_size: Annotated[int, Option()] = 21,
+    c: Annotated[int, Option()] = 15,
+    psm: Annotated[int, Option()] = 1,
+    vocabulary: Annotated[bool, Option("--vocabulary/--no-vocabulary")] = True,
+) -> None:
+    from ads.api.ocr_work_queue import create_ocr_queue
+
+    queue_spec = create_ocr_queue(
+        queue_folder_path,
+        pdf_file_path,
+        dpi,
+        save_images,
+        text_layer,
+        triage,
+        layout,
+        reocr_min_confidence,
+        reocr_dpi,
+        block_size,
+        c,
+        psm,
+        vocabulary,
+    )
+    print(
+        f"Created OCR queue [{queue_folder_path}] with {queue_spec['pageCount']} pages of PDF [{pdf_file_path}]."
+    )
+
+
+@queue.command(no_args_is_help=False, name="work")
+def work(
+    queue_folder_path: Annotated[str, Option(case_sensitive=False)],
+    backend: Annotated[Optional[str], Option(case_sensitive=False)] = None,
+    workers: Annotated[int, Option()] = 1,
+    lease_seconds: Annotated[float, Option()] = 300.0,
+    poll_seconds: Annotated[float, Option()] = 5.0,
+) -> None:
+    from ads.api.ocr_work_queue import run_ocr_queue_workers
+
+    print(f"Working on OCR queue [{queue_folder_path}] with {workers} workers...")
+    done_count = run_ocr_queue_workers(
+        queue_folder_path, workers, backend, lease_seconds, poll_seconds
+    )
+    print(f"OCR queue drained; this node OCRed {done_count} pages.")
+
+
+@queue.command(no_args_is_help=False, name="status")
+def status(
+    queue_folder_path: Annotated[str, Option(case_sensitive=False)],
+    lease_seconds: Annotated[float, Option()] = 300.0,
+) -> None:
+    from ads.api.ocr_work_queue import get_ocr_queue_status
+
+    queue_status = get_ocr_queue_status(queue_folder_path, lease_seconds)
+    print(f"OCR queue [{queue_folder_path}]:")
+    print(f"  - done: {queue_status.done} of {queue_status.page_count} pages")
+    print(f"  - leased: {queue_status.leased} ({queue_status.expired} expired)")
+    print(f"  - pending: {queue_status.pending}")
+
+
+@queue.command(no_args_is_help=False, name="merge")
+def merge(
+    queue_folder_path: Annotated[str, Option(case_sensitive=False)],
+    ocr_folder_path: Annotated[
+        str, Option(case_sensitive=False)
+    ] = "c:/_/aeon/fvtt-system-draw-steel/ocr-output",
+) -> None:
+    from ads.api.ocr_work_queue import merge_ocr_queue
+
+    combined_ocr_file_path = merge_ocr_queue(queue_folder_path, ocr_folder_path)
+    print(f"OCR queue merged. Output saved to [{combined_ocr_file_path}].")
+
+
+@queue.command(no_args_is_help=False, name="harness")
+def harness(
+    pages: Annotated[int, Option()] = 12,
+    workers: Annotated[int, Option()] = 4,
+    lease_seconds: Annotated[float, Option()] = 0.5,
+) -> None:
+    from ads.api.ocr_work_queue import run_ocr_queue_harness
+
+    print(
+        f"Draining a {pages}-page OCR queue with {workers} workers and the stub OCR backend "
+        f"({lease_seconds}s leases)..."
+    )
+    result = run_ocr_queue_harness(pages, workers, lease_seconds)
+    print(f"Drained in {result.elapsed_seconds:.1f}s:")
+    print(f"  - done: {result.done} of {result.page_count} pages")
+    print(
+        f"  - OCRed: {result.ocr_page_count} pages ({result.ocr_page_count - result.page_count} twice)"
+    )
+    print(f"  - leases left behind: {result.leftover_lease_count}")
+    print(f"  - merged: {result.merged_page_text_count} column texts")
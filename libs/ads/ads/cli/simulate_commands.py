@@ -0,0 +1,51 @@
+import time
+from typing import Annotated, Optional
+
+from typer import Option
+
+
+def simulate(
+    monster: Annotated[list[str], Option(case_sensitive=False)],
+    ocr_file_path: Annotated[
+        str, Option(case_sensitive=False)
+    ] = "c:/_/aeon/fvtt-system-draw-steel/ocr-output/full_combined_ocr.txt",
+    heroes: Annotated[int, Option()] = 4,
+    hero_stamina: Annotated[int, Option()] = 20,
+    hero_bonus: Annotated[int, Option()] = 2,
+    hero_damage: Annotated[str, Option()] = "4/7/9",
+    combats: Annotated[int, Option()] = 10000,
+    seed: Annotated[Optional[int], Option()] = None,
+    workers: Annotated[int, Option()] = 1,
+    chunk_size: Annotated[int, Option()] = 2500,
+    max_rounds: Annotated[int, Option()] = 20,
+) -> None:
+    """
+    Plays an encounter against a party many times over, e.g.
+    --monster "Goblin Warrior:4" --monster "Goblin Assassin:2" --seed 1 --workers 4.
+    """
+    # NumPy is an optional extra, so it is only imported when needed.
+    from ads.api.bestiary_index import iter_source_monsters
+    from ads.api.combat_simulator import (
+        PartySpec,
+        get_creature_table,
+        get_encounter_monsters,
+        print_combat_report,
+        run_combat_simulations,
+    )
+
+    encounter = get_encounter_monsters(iter_source_monsters(ocr_file_path), monster)
+    creatures = get_creature_table(encounter)
+    tier1_damage, tier2_damage, tier3_damage = [
+        int(damage) for damage in hero_damage.split("/")
+    ]
+    party = PartySpec(
+        heroes, hero_stamina, hero_bonus, (tier1_damage, tier2_damage, tier3_damage)
+    )
+    print(
+        f"Simulating {combats} combats of {len(creatures.names)} creatures against {heroes} heroes..."
+    )
+    started_at = time.perf_counter()
+    outcomes = run_combat_simulations(
+        creatures, party, combats, seed, workers, chunk_size, max_rounds
+    )
+    print_combat_report(outcomes, party, time.perf_counter() - started_at)
@@ -0,0 +1,28 @@
+from typing import Annotated
+
+from typer import Option
+
+from ads.api.monster_cache import DEFAULT_CACHE_FILE_PATH, MonsterCache
+
+
+def stats(
+    ocr_file_path: Annotated[
+        str, Option(case_sensitive=False)
+    ] = "c:/_/aeon/fvtt-system-draw-steel/ocr-output/full_combined_ocr.txt",
+    use_cache: Annotated[bool, Option("--cache/--no-cache")] = False,
+    cache_file_path: Annotated[
+        str, Option(case_sensitive=False)
+    ] = DEFAULT_CACHE_FILE_PATH,
+) -> None:
+    # NumPy is an optional extra, so it is only imported when needed.
+    from ads.api.bestiary_index import iter_source_monsters
+    from ads.api.power_roll_analytics import print_power_roll_report
+
+    print(f"Analyzing power rolls of the monsters in OCR file [{ocr_file_path}]...")
+    if not use_cache:
+        print_power_roll_report(list(iter_source_monsters(ocr_file_path)))
+        return
+    with MonsterCache(cache_file_path) as monster_cache:
+        print_power_roll_report(
+            list(iter_source_monsters(ocr_file_path, monster_cache))
+        )
@@ -0,0 +1,46 @@
+from typing import Annotated, Optional
+
+from typer import Option
+
+from ads.api.monster_cache import DEFAULT_CACHE_FILE_PATH, MonsterCache
+
+DEFAULT_OCR_FILE_PATH = (
+    "c:/_/aeon/fvtt-system-draw-steel/ocr-output/full_combined_ocr.txt"
+)
+
+
+def validate(
+    ocr_file_paths: Annotated[
+        Optional[list[str]], Option("--ocr-file-path", case_sensitive=False)
+    ] = None,
+    threshold: Annotated[float, Option()] = 3.5,
+    use_cache: Annotated[bool, Option("--cache/--no-cache")] = False,
+    cache_file_path: Annotated[
+        str, Option(case_sensitive=False)
+    ] = DEFAULT_CACHE_FILE_PATH,
+) -> None:
+    # NumPy is an optional extra, so it is only imported when needed.
+    from ads.api.anomaly_detector import print_anomaly_report
+    from ads.api.bestiary_index import iter_source_monsters
+
+    ocr_file_paths = ocr_file_paths or [DEFAULT_OCR_FILE_PATH]
+    print(f"Checking the stats of the monsters in OCR files {ocr_file_paths}...")
+    if not use_cache:
+        print_anomaly_report(
+            [
+                monster
+                for ocr_file_path in ocr_file_paths
+                for monster in iter_source_monsters(ocr_file_path)
+            ],
+            threshold,
+        )
+        return
+    with MonsterCache(cache_file_path) as monster_cache:
+        print_anomaly_report(
+            [
+                monster
+                for ocr_file_path in ocr_file_paths
+                for monster in iter_source_monsters(ocr_file_path, monster_cache)
+            ],
+            threshold,
+        )
@@ -5,26 +5,54 @@ from ads.model.effect import Effect, PotencyEffect
 from ads.model.immunity_or_weakness import ImmunityOrWeakness
 from ads.model.minion import AppliedCaptainEffects, DerivedCaptainBonuses
 from ads.model.monster import Monster, MonsterBlock, MonsterHeader
+from ads.model.ocr_queue import OcrQueueSpec
+from ads.model.page_region import PageRegion
 from ads.model.power_roll import PowerRoll, PowerRollTier
+from ads.model.records import (
+    AbilityRecord,
+    CharacteristicsRecord,
+    CubeRecord,
+    DistanceRecord,
+    EffectRecord,
+    LineRecord,
+    MonsterRecord,
+    PotencyEffectRecord,
+    PowerRollRecord,
+    PowerRollTierRecord,
+    TargetRecord,
+)
 from ads.model.stamina import Stamina
 
 __all__ = [
     "Ability",
+    "AbilityRecord",
     "AppliedCaptainEffects",
     "Characteristics",
+    "CharacteristicsRecord",
     "Cube",
+    "CubeRecord",
     "DerivedCaptainBonuses",
     "Distance",
+    "DistanceRecord",
     "Effect",
+    "EffectRecord",
     "ImmunityOrWeakness",
     "Line",
+    "LineRecord",
     "Monster",
     "MonsterBlock",
     "MonsterHeader",
+    "MonsterRecord",
+    "OcrQueueSpec",
+    "PageRegion",
     "PotencyEffect",
+    "PotencyEffectRecord",
     "PowerRoll",
+    "PowerRollRecord",
     "PowerRollTier",
+    "PowerRollTierRecord",
     "Stamina",
     "Target",
+    "TargetRecord",
     "Trait",
 ]
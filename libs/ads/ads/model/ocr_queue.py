@@ -0,0 +1,19 @@
+from typing import Optional, TypedDict
+
+
+class OcrQueueSpec(TypedDict):
+    # Path of the book as every node sees it, i.e. on the shared storage.
+    pdfFilePath: str
+    pageCount: int
+    dpi: int
+    saveImages: bool
+    useTextLayer: bool
+    useTriage: bool
+    useLayout: bool
+    reocrMinConfidence: float
+    reocrDpi: int
+    blockSize: int
+    c: int
+    pageSegmentationMode: int
+    userWordsFilePath: Optional[str]
+    userPatternsFilePath: Optional[str]
@@ -0,0 +1,15 @@
+from typing import Literal, NotRequired, Optional, TypedDict
+
+
+class PageRegion(TypedDict):
+    column: Literal["left", "right"]
+    # Reading order of the region within its page.
+    order: int
+    # Pixel box in the page raster the region was found in.
+    x: int
+    y: int
+    width: int
+    height: int
+    # Mean word confidence (0-100) of the first OCR pass, and of the re-OCR pass if the first one fell short.
+    confidence: NotRequired[Optional[float]]
+    reocrConfidence: NotRequired[Optional[float]]
@@ -0,0 +1,314 @@
+import copy
+from dataclasses import dataclass, fields
+from functools import cache
+from typing import Any, ClassVar, Literal, Optional
+
+from ads.model.ability_and_trait import Ability
+from ads.model.characteristics import Characteristics
+from ads.model.distance_and_target import Distance, Target
+from ads.model.effect import Effect, PotencyEffect
+from ads.model.immunity_or_weakness import ImmunityOrWeakness
+from ads.model.minion import AppliedCaptainEffects, DerivedCaptainBonuses
+from ads.model.monster import Monster
+from ads.model.power_roll import PowerRoll, PowerRollTier
+
+# Slotted counterparts of the TypedDict models, which are what the parsers build: a record holds its fields in
+# fixed slots rather than in a dict of its own.  Fields are named as in the TypedDicts, and a field that is None
+# is one the TypedDict leaves out.  The sparse damage type mappings (weakness, immunity) and the captain bonuses
+# stay dicts.  Records are expanded into the TypedDict shape only where parsed monsters leave the parse core:
+# the monster cache, the bestiary index and the Foundry YAML sink.
+
+
+class Record:
+    __slots__ = ()
+
+    def __deepcopy__(self, memo: dict[int, Any]) -> "Record":
+        # The parse caches deep-copy every record they hand out; copying the slots directly is much faster than
+        # the generic `__reduce_ex__` path `copy.deepcopy` takes for slotted classes.
+        copied = object.__new__(type(self))
+        for field_name in get_record_field_names(type(self)):
+            setattr(copied, field_name, copy.deepcopy(getattr(self, field_name), memo))
+        return copied
+
+
+@dataclass(slots=True)
+class CubeRecord(Record):
+    size: int
+    within: int
+
+
+@dataclass(slots=True)
+class LineRecord(Record):
+    width: int
+    length: int
+    within: int
+
+
+@dataclass(slots=True)
+class DistanceRecord(Record):
+    self: Optional[bool] = None
+    special: Optional[bool] = None
+    melee: Optional[int] = None
+    ranged: Optional[int] = None
+    burst: Optional[int] = None
+    cube: Optional[CubeRecord] = None
+    line: Optional[LineRecord] = None
+
+
+@dataclass(slots=True)
+class TargetRecord(Record):
+    text: Optional[str] = None
+    special: Optional[bool] = None
+    ally: Optional[bool] = None
+    self: Optional[bool] = None
+    creature: Optional[bool] = None
+    enemy: Optional[bool] = None
+    object: Optional[bool] = None
+    filter: Optional[str] = None
+    count: Optional[int | Literal["all"]] = None
+
+
+@dataclass(slots=True)
+class EffectRecord(Record):
+    text: Optional[str] = None
+    targets: Optional[str] = None
+    bleeding: Optional[bool] = None
+    frightened: Optional[bool] = None
+    grabbed: Optional[bool] = None
+    noEffect: Optional[bool] = None
+    prone: Optional[bool] = None
+    restrained: Optional[bool] = None
+    slowed: Optional[bool] = None
+    taunted: Optional[bool] = None
+    weakened: Optional[bool] = None
+    duration: Optional[
+        Literal["startOfTargetTurn", "endOfTargetTurn", "saveEnds", "endOfEncounter"]
+    ] = None
+    weakness: Optional[ImmunityOrWeakness] = None
+
+
+@dataclass(slots=True)
+class PotencyEffectRecord(Record):
+    targetCharacteristic: Literal["might", "agility", "reason", "intuition", "presence"]
+    value: int
+    effect: EffectRecord
+
+
+@dataclass(slots=True)
+class PowerRollTierRecord(Record):
+    damage: Optional[int] = None
+    damageType: Optional[str] = None
+    effect: Optional[EffectRecord] = None
+    potencyEffect: Optional[PotencyEffectRecord] = None
+
+
+@dataclass(slots=True)
+class PowerRollRecord(Record):
+    # Fields kept as None in the TypedDict shape, where they are required.
+    KEEP_NONE: ClassVar[frozenset[str]] = frozenset({"bonus"})
+
+    bonus: Optional[int]
+    tier1: PowerRollTierRecord
+    tier2: PowerRollTierRecord
+    tier3: PowerRollTierRecord
+
+
+@dataclass(slots=True)
+class CharacteristicsRecord(Record):
+    might: int
+    agility: int
+    reason: int
+    intuition: int
+    presence: int
+
+
+@dataclass(slots=True)
+class AbilityRecord(Record):
+    name: str
+    type: Literal[
+        "freeMainAction",
+        "freeManeuver",
+        "freeTriggeredAction",
+        "mainAction",
+        "maneuver",
+        "triggeredAction",
+        "monsterTrait",
+        "villainAction",
+    ]
+    keywords: list[str]
+    header_raw: str
+    villainActionOrdinal: Optional[int] = None
+    maliceCost: Optional[int] = None
+    isSignature: Optional[bool] = None
+    powerRoll: Optional[PowerRollRecord] = None
+    distance: Optional[DistanceRecord] = None
+    target: Optional[TargetRecord] = None
+    trigger: Optional[str] = None
+    prePowerRollEffect: Optional[EffectRecord] = None
+    maliceEffect: Optional[EffectRecord] = None
+    postPowerRollEffect: Optional[EffectRecord] = None
+
+
+@dataclass(slots=True)
+class MonsterRecord(Record):
+    KEEP_NONE: ClassVar[frozenset[str]] = frozenset(
+        {
+            "role",
+            "weakness",
+            "immunity",
+            "derivedCaptainBonuses",
+            "appliedCaptainEffects",
+        }
+    )
+
+    name: str
+    level: int
+    type: str
+    role: Optional[str]
+    header_text: str
+    keywords: list[str]
+    encounterValue: int
+    stamina: int
+    speed: int
+    movementTypes: list[str]
+    size: str
+    stability: int
+    freeStrikeDamage: int
+    characteristics: CharacteristicsRecord
+    weakness: Optional[ImmunityOrWeakness]
+    immunity: Optional[ImmunityOrWeakness]
+    derivedCaptainBonuses: Optional[DerivedCaptainBonuses]
+    appliedCaptainEffects: Optional[AppliedCaptainEffects]
+    abilities: list[AbilityRecord]
+
+
+@cache
+def get_record_field_names(record_type: type[Record]) -> tuple[str, ...]:
+    return tuple(field.name for field in fields(record_type))
+
+
+def get_record_dict(record: Record) -> dict[str, Any]:
+    """Expands a record into its TypedDict shape, recursively, leaving out the fields that are None."""
+    keep_none: frozenset[str] = getattr(record, "KEEP_NONE", frozenset())
+    expanded: dict[str, Any] = {}
+    for field_name in get_record_field_names(type(record)):
+        value = getattr(record, field_name)
+        if value is None:
+            if field_name in keep_none:
+                expanded[field_name] = None
+        elif isinstance(value, Record):
+            expanded[field_name] = get_record_dict(value)
+        elif isinstance(value, list):
+            expanded[field_name] = [
+                get_record_dict(item) if isinstance(item, Record) else item
+                for item in value  # type: ignore
+            ]
+        else:
+            expanded[field_name] = value
+    return expanded
+
+
+def to_monster_model(monster_record: MonsterRecord) -> Monster:
+    monster: Monster = get_record_dict(monster_record)  # type: ignore
+    monster["traits"] = []
+    return monster
+
+
+def to_effect_record(effect: Optional[Effect]) -> Optional[EffectRecord]:
+    return EffectRecord(**effect) if effect is not None else None  # type: ignore
+
+
+def to_potency_effect_record(
+    potency_effect: Optional[PotencyEffect],
+) -> Optional[PotencyEffectRecord]:
+    if potency_effect is None:
+        return None
+    return PotencyEffectRecord(
+        targetCharacteristic=potency_effect["targetCharacteristic"],
+        value=potency_effect["value"],
+        effect=EffectRecord(**potency_effect["effect"]),  # type: ignore
+    )
+
+
+def to_power_roll_tier_record(tier: PowerRollTier) -> PowerRollTierRecord:
+    return PowerRollTierRecord(
+        damage=tier.get("damage"),
+        damageType=tier.get("damageType"),
+        effect=to_effect_record(tier.get("effect")),
+        potencyEffect=to_potency_effect_record(tier.get("potencyEffect")),
+    )
+
+
+def to_power_roll_record(power_roll: Optional[PowerRoll]) -> Optional[PowerRollRecord]:
+    if power_roll is None:
+        return None
+    return PowerRollRecord(
+        bonus=power_roll["bonus"],
+        tier1=to_power_roll_tier_record(power_roll["tier1"]),
+        tier2=to_power_roll_tier_record(power_roll["tier2"]),
+        tier3=to_power_roll_tier_record(power_roll["tier3"]),
+    )
+
+
+def to_distance_record(distance: Optional[Distance]) -> Optional[DistanceRecord]:
+    if distance is None:
+        return None
+    cube = distance.get("cube")
+    line = distance.get("line")
+    return DistanceRecord(
+        self=distance.get("self"),
+        special=distance.get("special"),
+        melee=distance.get("melee"),
+        ranged=distance.get("ranged"),
+        burst=distance.get("burst"),
+        cube=CubeRecord(**cube) if cube else None,
+        line=LineRecord(**line) if line else None,
+    )
+
+
+def to_target_record(target: Optional[Target]) -> Optional[TargetRecord]:
+    return TargetRecord(**target) if target is not None else None  # type: ignore
+
+
+def to_ability_record(ability: Ability) -> AbilityRecord:
+    return AbilityRecord(
+        name=ability["name"],
+        type=ability["type"],
+        keywords=ability["keywords"],
+        header_raw=ability["header_raw"],
+        villainActionOrdinal=ability.get("villainActionOrdinal"),
+        maliceCost=ability.get("maliceCost"),
+        isSignature=ability.get("isSignature"),
+        powerRoll=to_power_roll_record(ability.get("powerRoll")),
+        distance=to_distance_record(ability.get("distance")),
+        target=to_target_record(ability.get("target")),
+        trigger=ability.get("trigger"),
+        prePowerRollEffect=to_effect_record(ability.get("prePowerRollEffect")),
+        maliceEffect=to_effect_record(ability.get("maliceEffect")),
+        postPowerRollEffect=to_effect_record(ability.get("postPowerRollEffect")),
+    )
+
+
+def to_monster_record(monster: Monster) -> MonsterRecord:
+    characteristics: Characteristics = monster["characteristics"]
+    return MonsterRecord(
+        name=monster["name"],
+        level=monster["level"],
+        type=monster["type"],
+        role=monster.get("role"),
+        header_text=monster["header_text"],
+        keywords=monster["keywords"],
+        encounterValue=monster["encounterValue"],
+        stamina=monster["stamina"],
+        speed=monster["speed"],
+        movementTypes=monster["movementTypes"],
+        size=monster["size"],
+        stability=monster["stability"],
+        freeStrikeDamage=monster["freeStrikeDamage"],
+        characteristics=CharacteristicsRecord(**characteristics),
+        weakness=monster.get("weakness"),
+        immunity=monster.get("immunity"),
+        derivedCaptainBonuses=monster.get("derivedCaptainBonuses"),
+        appliedCaptainEffects=monster.get("appliedCaptainEffects"),
+        abilities=[to_ability_record(ability) for ability in monster["abilities"]],
+    )